@@ -71,6 +71,27 @@ class Blake2b(Blake2):
 
 TMessageBlock = Tuple[int, int, int, int, int, int, int, int]
 
+# The four columns of the working vector are mixed at once, as lanes of a single
+# int: lane i holds a 64-bit word at bit 128 * i. The 64 bits of space above each
+# word take the carries of additions and the bits shifted out by rotations, until
+# LANE_MASK clears them.
+LANE_WIDTH = 128
+LANE_MASK = sum(Blake2b.MASKBITS << (LANE_WIDTH * i) for i in range(4))
+
+
+def _pack_lanes(w0: int, w1: int, w2: int, w3: int) -> int:
+    return w0 | w1 << LANE_WIDTH | w2 << (2 * LANE_WIDTH) | w3 << (3 * LANE_WIDTH)
+
+
+def _unpack_lanes(lanes: int) -> Tuple[int, int, int, int]:
+    mask = Blake2b.MASKBITS
+    return (
+        lanes & mask,
+        lanes >> LANE_WIDTH & mask,
+        lanes >> (2 * LANE_WIDTH) & mask,
+        lanes >> (3 * LANE_WIDTH) & mask,
+    )
+
 
 def blake2b_compress(
     num_rounds: int,
@@ -82,25 +103,17 @@ def blake2b_compress(
     """
     'F Compression' from section 3.2 of RFC 7693:
     https://tools.ietf.org/html/rfc7693#section-3.2
-    """
-
-    # Dereference these for [very small] speed improvement.
-    # Perhaps more than anything, this makes the code
-    # easier to read.
-    MASKBITS = Blake2b.MASKBITS
-    WORDBITS = Blake2b.WORDBITS
-    IV = Blake2b.IV
-    ROT1 = Blake2b.ROT1
-    ROT2 = Blake2b.ROT2
-    ROT3 = Blake2b.ROT3
-    ROT4 = Blake2b.ROT4
-    WB_ROT1 = WORDBITS - ROT1
-    WB_ROT2 = WORDBITS - ROT2
-    WB_ROT3 = WORDBITS - ROT3
-    WB_ROT4 = WORDBITS - ROT4
 
+    EIP-152 lets callers ask for up to 2**32 - 1 rounds, so the rounds are unrolled
+    and run G() on the four columns, and then on the four diagonals, at once: each
+    of the rows a, b, c and d of the working vector is a single int of four lanes
+    (see ``LANE_MASK``). For the diagonals, rows b, c and d are rotated by one, two
+    and three lanes, and rotated back afterwards. This is about three times as fast
+    as calling G() on one column or diagonal at a time.
+    """
     sigma_schedule = Blake2b.sigma_schedule
     sigma_schedule_len = len(sigma_schedule)
+    IV = Blake2b.IV
 
     # convert block (if bytes) into tuple of 16 LE words
     # *later versions of blake2b use the tuple form, but older versions use bytes
@@ -110,81 +123,82 @@ def blake2b_compress(
         else struct.unpack_from("<16%s" % Blake2b.WORDFMT, bytes(block))
     )
 
-    v = [0] * 16
-    v[0:8] = h_starting_state
-    v[8:12] = IV[:4]
-    v[12] = t_offset_counters[0] ^ IV[4]
-    v[13] = t_offset_counters[1] ^ IV[5]
+    # The message words that each round adds to row a, in lanes: the first and
+    # second word for the columns, then the first and second word for the diagonals
+    message_lanes = tuple(
+        (
+            _pack_lanes(m[sr[0]], m[sr[2]], m[sr[4]], m[sr[6]]),
+            _pack_lanes(m[sr[1]], m[sr[3]], m[sr[5]], m[sr[7]]),
+            _pack_lanes(m[sr[8]], m[sr[10]], m[sr[12]], m[sr[14]]),
+            _pack_lanes(m[sr[9]], m[sr[11]], m[sr[13]], m[sr[15]]),
+        )
+        # rounds past the end of the schedule wrap around to the beginning
+        for sr in sigma_schedule[:num_rounds]
+    )
 
     if final_block_flag:
-        v[14] = Blake2b.MASKBITS ^ IV[6]
+        v14 = Blake2b.MASKBITS ^ IV[6]
     else:
-        v[14] = IV[6]
+        v14 = IV[6]
 
     # The original code had a mechanism to turn on a "tree mode",
     # setting f[1] to MASKBITS here.
     # There seems to be no reference to that bit flip in the 3.2 section of RFC 7693,
     # and there is no such setting in EIP-152. So the bit flip option is removed.
-    v[15] = IV[7]
-
-    # Within the confines of the Python language, this is a
-    # highly optimized version of G().  It differs some from
-    # the formal specification and reference implementation.
-    def G(a: int, b: int, c: int, d: int) -> None:
-        # dereference v[] for another small speed improvement
-        va = v[a]
-        vb = v[b]
-        vc = v[c]
-        vd = v[d]
-        va = (va + vb + msri2) & MASKBITS
-        w = vd ^ va
-        vd = (w >> ROT1) | (w << (WB_ROT1)) & MASKBITS
-        vc = (vc + vd) & MASKBITS
-        w = vb ^ vc
-        vb = (w >> ROT2) | (w << (WB_ROT2)) & MASKBITS
-        va = (va + vb + msri21) & MASKBITS
-        w = vd ^ va
-        vd = (w >> ROT3) | (w << (WB_ROT3)) & MASKBITS
-        vc = (vc + vd) & MASKBITS
-        w = vb ^ vc
-        vb = (w >> ROT4) | (w << (WB_ROT4)) & MASKBITS
-        # re-reference v[]
-        v[a] = va
-        v[b] = vb
-        v[c] = vc
-        v[d] = vd
-
-    # time to ChaCha
-    for r in range(num_rounds):
-        # resolve as much as possible outside G() and
-        # don't pass as argument, let scope do its job.
-        # Result is a 50% speed increase, but sadly,
-        # "slow" divided by 1.5 is still "slow".  :-/
-        sr = sigma_schedule[r % sigma_schedule_len]
-        msri2 = m[sr[0]]
-        msri21 = m[sr[1]]
-        G(0, 4, 8, 12)
-        msri2 = m[sr[2]]
-        msri21 = m[sr[3]]
-        G(1, 5, 9, 13)
-        msri2 = m[sr[4]]
-        msri21 = m[sr[5]]
-        G(2, 6, 10, 14)
-        msri2 = m[sr[6]]
-        msri21 = m[sr[7]]
-        G(3, 7, 11, 15)
-        msri2 = m[sr[8]]
-        msri21 = m[sr[9]]
-        G(0, 5, 10, 15)
-        msri2 = m[sr[10]]
-        msri21 = m[sr[11]]
-        G(1, 6, 11, 12)
-        msri2 = m[sr[12]]
-        msri21 = m[sr[13]]
-        G(2, 7, 8, 13)
-        msri2 = m[sr[14]]
-        msri21 = m[sr[15]]
-        G(3, 4, 9, 14)
+    v15 = IV[7]
+
+    a = _pack_lanes(*h_starting_state[:4])
+    b = _pack_lanes(*h_starting_state[4:])
+    c = _pack_lanes(*IV[:4])
+    d = _pack_lanes(
+        t_offset_counters[0] ^ IV[4], t_offset_counters[1] ^ IV[5], v14, v15
+    )
 
+    # Dereference for speed; the rotations by Blake2b.ROT1-4 are written out below
+    mask = LANE_MASK
+    for r in range(num_rounds):
+        m_column_1, m_column_2, m_diagonal_1, m_diagonal_2 = message_lanes[
+            r % sigma_schedule_len
+        ]
+
+        # G() on the columns
+        a = (a + b + m_column_1) & mask
+        w = d ^ a
+        d = ((w >> 32) | (w << 32)) & mask
+        c = (c + d) & mask
+        w = b ^ c
+        b = ((w >> 24) | (w << 40)) & mask
+        a = (a + b + m_column_2) & mask
+        w = d ^ a
+        d = ((w >> 16) | (w << 48)) & mask
+        c = (c + d) & mask
+        w = b ^ c
+        b = ((w >> 63) | (w << 1)) & mask
+
+        # line the diagonals up in the lanes
+        b = ((b >> 128) | (b << 384)) & mask
+        c = ((c >> 256) | (c << 256)) & mask
+        d = ((d >> 384) | (d << 128)) & mask
+
+        # G() on the diagonals
+        a = (a + b + m_diagonal_1) & mask
+        w = d ^ a
+        d = ((w >> 32) | (w << 32)) & mask
+        c = (c + d) & mask
+        w = b ^ c
+        b = ((w >> 24) | (w << 40)) & mask
+        a = (a + b + m_diagonal_2) & mask
+        w = d ^ a
+        d = ((w >> 16) | (w << 48)) & mask
+        c = (c + d) & mask
+        w = b ^ c
+        b = ((w >> 63) | (w << 1)) & mask
+
+        # and back into columns
+        b = ((b >> 384) | (b << 128)) & mask
+        c = ((c >> 256) | (c << 256)) & mask
+        d = ((d >> 128) | (d << 384)) & mask
+
+    v = _unpack_lanes(a) + _unpack_lanes(b) + _unpack_lanes(c) + _unpack_lanes(d)
     result_message_words = (h_starting_state[i] ^ v[i] ^ v[i + 8] for i in range(8))
     return struct.pack(f"<8{Blake2b.WORDFMT}", *result_message_words)
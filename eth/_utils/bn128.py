@@ -1,17 +1,56 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import os
 from typing import (
+    Any,
+    Callable,
+    Optional,
+    Sequence,
     Tuple,
+    Type,
+    cast,
 )
 
 from eth_utils import (
     ValidationError,
 )
+from lru import (
+    LRU,
+)
 from py_ecc import (
     optimized_bn128 as bn128,
 )
 from py_ecc.optimized_bn128 import (
     FQ2,
+    FQ12,
     FQP,
 )
+from py_ecc.optimized_bn128.optimized_pairing import (
+    cast_point_to_fq12,
+    linefunc,
+    pseudo_binary_encoding,
+)
+
+from eth._utils.caching import (
+    CacheStats,
+)
+from eth._utils.module_loading import (
+    import_string,
+)
+
+# Affine coordinates, with (0, 0) as the point at infinity
+G1Point = Tuple[int, int]
+# (x imaginary, x real, y imaginary, y real), in the order of the precompile input
+G2Point = Tuple[int, int, int, int]
+# The pairs of points that the line functions of each step of a Miller loop go through
+LinePoints = Tuple[Tuple[Tuple[Any, Any], ...], ...]
+
+DEFAULT_BN128_BACKEND = "eth._utils.bn128.PyEccBN128Backend"
+# Tried in order when no backend is configured, so compiled backends go first, and
+# are skipped if they are not installed
+BN128_BACKEND_CANDIDATES = (DEFAULT_BN128_BACKEND,)
 
 
 def validate_point(x: int, y: int) -> Tuple[bn128.FQ, bn128.FQ, bn128.FQ]:
@@ -32,6 +71,27 @@ def validate_point(x: int, y: int) -> Tuple[bn128.FQ, bn128.FQ, bn128.FQ]:
     return p1
 
 
+def validate_g2_point(point: G2Point) -> Tuple[FQ2, FQ2, FQ2]:
+    x2_i, x2_r, y2_i, y2_r = point
+    for v in point:
+        if v >= bn128.field_modulus:
+            raise ValidationError("value greater than field modulus")
+
+    fq2_x = FQ2([x2_r, x2_i])
+    fq2_y = FQ2([y2_r, y2_i])
+
+    p2 = bn128.Z2
+    if (fq2_x, fq2_y) != (FQ2.zero(), FQ2.zero()):
+        p2 = (fq2_x, fq2_y, FQ2.one())
+        if not bn128.is_on_curve(p2, bn128.b2):
+            raise ValidationError("point is not on curve")
+
+    if bn128.multiply(p2, bn128.curve_order)[-1] != FQ2.zero():
+        raise ValidationError("point is not in the subgroup")
+
+    return FQP_point_to_FQ2_point(p2)
+
+
 def FQP_point_to_FQ2_point(pt: Tuple[FQP, FQP, FQP]) -> Tuple[FQ2, FQ2, FQ2]:
     """
     Transform FQP to FQ2 for type hinting.
@@ -41,3 +101,280 @@ def FQP_point_to_FQ2_point(pt: Tuple[FQP, FQP, FQP]) -> Tuple[FQ2, FQ2, FQ2]:
         FQ2(pt[1].coeffs),
         FQ2(pt[2].coeffs),
     )
+
+
+class BaseBN128Backend(ABC):
+    """
+    The alt_bn128 curve operations of the ECADD, ECMUL and ECPAIRING precompiles.
+
+    Points are passed and returned as plain integers, so that implementations are
+    free to use their own representation. Invalid points raise a ``ValidationError``.
+    """
+
+    @abstractmethod
+    def add(self, p1: G1Point, p2: G1Point) -> G1Point:
+        """
+        Return the sum of ``p1`` and ``p2``.
+        """
+        ...
+
+    @abstractmethod
+    def multiply(self, point: G1Point, scalar: int) -> G1Point:
+        """
+        Return ``point`` multiplied by ``scalar``.
+        """
+        ...
+
+    @abstractmethod
+    def pairing_check(self, pairs: Sequence[Tuple[G1Point, G2Point]]) -> bool:
+        """
+        Return whether the product of the pairings of all ``pairs`` is one.
+        """
+        ...
+
+
+class PyEccBN128Backend(BaseBN128Backend):
+    """
+    The pure-Python implementation of ``py_ecc``.
+
+    The pairing check runs a single Miller loop over all the pairs, which shares the
+    squarings of the accumulated value and the final division between them.
+
+    Two caches can be turned on, for callers like zk verifier contracts, which check
+    proofs against the same verifying key over and over:
+
+    - ``prepared_g2_cache_size``: the G2 points of pairing checks, validated and
+      with the points of the line functions of their Miller loop computed
+    - ``product_cache_size``: the products of G1 points and scalars
+    """
+
+    def __init__(
+        self, prepared_g2_cache_size: int = 0, product_cache_size: int = 0
+    ) -> None:
+        self._prepared_g2_points: "LRU[G2Point, Optional[LinePoints]]" = None
+        if prepared_g2_cache_size:
+            self._prepared_g2_points = LRU(prepared_g2_cache_size)
+        self.prepared_g2_stats = CacheStats()
+
+        self._products: "LRU[Tuple[G1Point, int], G1Point]" = None
+        if product_cache_size:
+            self._products = LRU(product_cache_size)
+        self.product_stats = CacheStats()
+
+    def add(self, p1: G1Point, p2: G1Point) -> G1Point:
+        result = bn128.normalize(bn128.add(validate_point(*p1), validate_point(*p2)))
+        return result[0].n, result[1].n
+
+    def multiply(self, point: G1Point, scalar: int) -> G1Point:
+        if self._products is None:
+            return self._multiply(point, scalar)
+
+        try:
+            result = self._products[(point, scalar)]
+        except KeyError:
+            self.product_stats.misses += 1
+            result = self._products[(point, scalar)] = self._multiply(point, scalar)
+        else:
+            self.product_stats.hits += 1
+        return result
+
+    def _multiply(self, point: G1Point, scalar: int) -> G1Point:
+        result = bn128.normalize(bn128.multiply(validate_point(*point), scalar))
+        return result[0].n, result[1].n
+
+    def pairing_check(self, pairs: Sequence[Tuple[G1Point, G2Point]]) -> bool:
+        prepared_pairs = []
+        for p1, p2 in pairs:
+            validated_p1 = validate_point(*p1)
+            line_points = self._get_line_points(p2)
+            # Pairs with a point at infinity contribute a factor of one
+            if line_points is not None and validated_p1[-1] != validated_p1[-1].zero():
+                prepared_pairs.append((line_points, cast_point_to_fq12(validated_p1)))
+
+        if not prepared_pairs:
+            return True
+
+        accumulated = _multi_miller_loop(prepared_pairs)
+        return bn128.final_exponentiate(accumulated) == FQ12.one()
+
+    def _get_line_points(self, point: G2Point) -> Optional[LinePoints]:
+        if self._prepared_g2_points is None:
+            return _prepare_g2_point(validate_g2_point(point))
+
+        try:
+            line_points = self._prepared_g2_points[point]
+        except KeyError:
+            self.prepared_g2_stats.misses += 1
+            # Only valid points make it into the cache
+            line_points = _prepare_g2_point(validate_g2_point(point))
+            self._prepared_g2_points[point] = line_points
+        else:
+            self.prepared_g2_stats.hits += 1
+        return line_points
+
+
+def _prepare_g2_point(point: Tuple[FQ2, FQ2, FQ2]) -> Optional[LinePoints]:
+    """
+    Return the pairs of points that the line functions of the Miller loop of
+    ``point`` go through, for each step of the loop and then for the final step, or
+    ``None`` for the point at infinity. They do not depend on the G1 point.
+    """
+    if point[-1] == point[-1].zero():
+        return None
+
+    q = bn128.twist(point)
+    negated_q = bn128.neg(q)
+    r = q
+    line_points = []
+    for v in pseudo_binary_encoding[63::-1]:
+        step = [(r, r)]
+        r = bn128.double(r)
+        if v == 1:
+            step.append((r, q))
+            r = bn128.add(r, q)
+        elif v == -1:
+            step.append((r, negated_q))
+            r = bn128.add(r, negated_q)
+        line_points.append(tuple(step))
+
+    field_modulus = bn128.field_modulus
+    q1 = (q[0] ** field_modulus, q[1] ** field_modulus, q[2] ** field_modulus)
+    negated_q2 = (
+        q1[0] ** field_modulus,
+        -(q1[1] ** field_modulus),
+        q1[2] ** field_modulus,
+    )
+    line_points.append(((r, q1), (bn128.add(r, q1), negated_q2)))
+    return tuple(line_points)
+
+
+def _multi_miller_loop(pairs: Sequence[Tuple[LinePoints, Any]]) -> FQ12:
+    """
+    Run the Miller loop of ``py_ecc`` on all ``pairs`` of prepared G2 and G1 points at
+    once, returning the product of the results of running it on each pair
+    separately.
+    """
+    f_num, f_den = FQ12.one(), FQ12.one()
+    for step in range(len(pseudo_binary_encoding) - 1):
+        f_num = f_num * f_num
+        f_den = f_den * f_den
+        for line_points, p in pairs:
+            for r, q in line_points[step]:
+                _n, _d = linefunc(r, q, p)
+                f_num = f_num * _n
+                f_den = f_den * _d
+
+    for line_points, p in pairs:
+        for r, q in line_points[-1]:
+            _n, _d = linefunc(r, q, p)
+            f_num = f_num * _n
+            f_den = f_den * _d
+
+    return f_num / f_den
+
+
+class ReferenceBN128Backend(PyEccBN128Backend):
+    """
+    The pure-Python implementation of ``py_ecc``, computing the pairing of each pair
+    separately with :func:`py_ecc.optimized_bn128.pairing`. Slower than
+    :class:`PyEccBN128Backend`, and meant as a reference to cross-check against.
+    """
+
+    def pairing_check(self, pairs: Sequence[Tuple[G1Point, G2Point]]) -> bool:
+        exponent = FQ12.one()
+        for p1, p2 in pairs:
+            exponent *= bn128.pairing(
+                validate_g2_point(p2), validate_point(*p1), final_exponentiate=False
+            )
+        return bn128.final_exponentiate(exponent) == FQ12.one()
+
+
+class BN128BackendMismatch(Exception):
+    """
+    Raised by :class:`CrossCheckBN128Backend` when two backends disagree.
+    """
+
+    pass
+
+
+class CrossCheckBN128Backend(BaseBN128Backend):
+    """
+    Run every operation on both ``backend`` and ``reference``, and raise a
+    :class:`BN128BackendMismatch` if their results, or the errors they raise, differ.
+    """
+
+    def __init__(self, backend: BaseBN128Backend, reference: BaseBN128Backend) -> None:
+        self.backend = backend
+        self.reference = reference
+
+    def add(self, p1: G1Point, p2: G1Point) -> G1Point:
+        return self._cross_check("add", p1, p2)
+
+    def multiply(self, point: G1Point, scalar: int) -> G1Point:
+        return self._cross_check("multiply", point, scalar)
+
+    def pairing_check(self, pairs: Sequence[Tuple[G1Point, G2Point]]) -> bool:
+        return self._cross_check("pairing_check", pairs)
+
+    def _cross_check(self, operation: str, *args: Any) -> Any:
+        outcome = _get_outcome(getattr(self.backend, operation), args)
+        reference_outcome = _get_outcome(getattr(self.reference, operation), args)
+        if outcome != reference_outcome:
+            raise BN128BackendMismatch(
+                f"{operation}{args!r} gave {outcome!r} with {self.backend!r}, but "
+                f"{reference_outcome!r} with {self.reference!r}"
+            )
+
+        result, error = outcome
+        if error is not None:
+            raise ValidationError(error)
+        return result
+
+
+def _get_outcome(
+    operation: Callable[..., Any], args: Tuple[Any, ...]
+) -> Tuple[Any, str]:
+    # Only whether validation fails has to match, not the message
+    try:
+        return operation(*args), None
+    except ValidationError:
+        return None, "Invalid BN128 operation"
+
+
+def load_bn128_backend() -> BaseBN128Backend:
+    """
+    Instantiate the backend named by the ``BN128_BACKEND_CLASS`` environment
+    variable, or else the first of :data:`BN128_BACKEND_CANDIDATES` that can be
+    imported.
+    """
+    import_path = os.environ.get("BN128_BACKEND_CLASS")
+    if import_path is not None:
+        return cast(Type[BaseBN128Backend], import_string(import_path))()
+
+    for candidate_path in BN128_BACKEND_CANDIDATES:
+        try:
+            backend_class = cast(Type[BaseBN128Backend], import_string(candidate_path))
+        except ImportError:
+            continue
+        else:
+            return backend_class()
+
+    raise ImportError("None of the BN128 backends can be imported")
+
+
+_bn128_backend: BaseBN128Backend = None
+
+
+def get_bn128_backend() -> BaseBN128Backend:
+    global _bn128_backend
+    if _bn128_backend is None:
+        _bn128_backend = load_bn128_backend()
+    return _bn128_backend
+
+
+def set_bn128_backend(backend: BaseBN128Backend) -> None:
+    """
+    Use ``backend`` for the curve operations of all the precompiles from now on.
+    """
+    global _bn128_backend
+    _bn128_backend = backend
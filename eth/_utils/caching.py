@@ -0,0 +1,28 @@
+class CacheStats:
+    """
+    Count the hits and misses of a cache.
+    """
+
+    __slots__ = ["hits", "misses"]
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups:
+            return self.hits / lookups
+        else:
+            return 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"hit_rate={self.hit_rate:.1%})"
+        )
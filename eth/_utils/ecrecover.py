@@ -0,0 +1,181 @@
+from concurrent.futures import (
+    Executor,
+)
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from eth_hash.auto import (
+    keccak,
+)
+from eth_keys import (
+    keys,
+)
+from eth_keys.datatypes import (
+    PublicKey,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+from lru import (
+    LRU,
+)
+
+from eth._utils.caching import (
+    CacheStats,
+)
+from eth.abc import (
+    SignedTransactionAPI,
+)
+from eth.typing import (
+    Address,
+)
+
+# (message hash, canonical v, r, s)
+SignatureKey = Tuple[bytes, int, int, int]
+
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+RECOVERY_CACHE_SIZE = 8192
+
+
+class RecoveryCache:
+    """
+    Bounded cache of the public keys recovered from signatures, shared by the
+    ECRECOVER precompile and the recovery of transaction senders, so that the same
+    signature is only recovered once.
+
+    Signatures that fail to recover are cached too, as ``None``.
+    """
+
+    def __init__(self, size: int = RECOVERY_CACHE_SIZE) -> None:
+        self._public_keys: "LRU[SignatureKey, Optional[PublicKey]]" = LRU(size)
+        self.stats = CacheStats()
+
+    def recover_public_key(
+        self, message_hash: bytes, v: int, r: int, s: int
+    ) -> PublicKey:
+        """
+        Recover the public key that signed ``message_hash``, with ``v`` as a
+        y-parity of 0 or 1.
+
+        :raise eth_keys.exceptions.BadSignature: if no public key can be recovered
+        """
+        signature_key = (message_hash, v, r, s)
+        try:
+            public_key = self._public_keys[signature_key]
+        except KeyError:
+            self.stats.misses += 1
+            signature = keys.Signature(vrs=(v, r, s))
+            try:
+                public_key = signature.recover_public_key_from_msg_hash(message_hash)
+            except BadSignature:
+                self._public_keys[signature_key] = None
+                raise
+            else:
+                self._public_keys[signature_key] = public_key
+                return public_key
+        else:
+            self.stats.hits += 1
+            if public_key is None:
+                raise BadSignature("Cannot recover a public key from the signature")
+            return public_key
+
+    def __contains__(self, signature_key: SignatureKey) -> bool:
+        return signature_key in self._public_keys
+
+    def add(self, signature_key: SignatureKey, public_key: Optional[PublicKey]) -> None:
+        self._public_keys[signature_key] = public_key
+
+    def clear(self) -> None:
+        self._public_keys.clear()
+        self.stats.reset()
+
+    def __repr__(self) -> str:
+        return f"RecoveryCache(size={len(self._public_keys)}, {self.stats})"
+
+
+recovery_cache = RecoveryCache()
+
+
+def get_signature_key(transaction: SignedTransactionAPI) -> SignatureKey:
+    return (
+        keccak(transaction.get_message_for_signing()),
+        transaction.y_parity,
+        transaction.r,
+        transaction.s,
+    )
+
+
+def _recover_public_key_bytes(signature_key: SignatureKey) -> Optional[bytes]:
+    # Runs in the worker processes, so it only takes and returns picklable values
+    message_hash, v, r, s = signature_key
+    try:
+        signature = keys.Signature(vrs=(v, r, s))
+        public_key = signature.recover_public_key_from_msg_hash(message_hash)
+    except BadSignature:
+        return None
+    else:
+        return public_key.to_bytes()
+
+
+def map_signature_checks(
+    function: Callable[[TItem], TResult],
+    items: Sequence[TItem],
+    executor: Optional[Executor],
+) -> Iterable[TResult]:
+    """
+    Call ``function``, which checks signatures, on every item of ``items``.
+
+    The calls run on ``executor`` if given, or else one after another. With the
+    pure-Python ``eth_keys`` backend, which holds the GIL, only a process pool checks
+    signatures in parallel. ``function`` must then be picklable, and so must the
+    items and the results.
+    """
+    if executor is not None:
+        return executor.map(function, items)
+    else:
+        return map(function, items)
+
+
+def recover_senders(
+    transactions: Sequence[SignedTransactionAPI],
+    executor: Executor = None,
+) -> Tuple[Address, ...]:
+    """
+    Recover the senders of all ``transactions`` at once, and add their public keys
+    to the recovery cache, so that looking up the sender of each transaction later
+    is a cache hit.
+
+    Signatures that are not in the cache yet are recovered with
+    :func:`map_signature_checks`, on ``executor`` if given, or else one after
+    another. With the pure-Python ``eth_keys`` backend, pass a long-lived process
+    pool to recover them in parallel. No pool is started here, since starting one
+    for every block costs more than the recoveries it spreads out.
+
+    :raise eth_keys.exceptions.BadSignature: if a sender cannot be recovered
+    """
+    signature_keys = tuple(
+        get_signature_key(transaction) for transaction in transactions
+    )
+    uncached_keys = tuple(
+        {key: None for key in signature_keys if key not in recovery_cache}
+    )
+
+    recovered = map_signature_checks(_recover_public_key_bytes, uncached_keys, executor)
+    for signature_key, public_key_bytes in zip(uncached_keys, recovered):
+        if public_key_bytes is None:
+            recovery_cache.add(signature_key, None)
+        else:
+            recovery_cache.add(signature_key, PublicKey(public_key_bytes))
+
+    return tuple(
+        Address(recovery_cache.recover_public_key(*key).to_canonical_address())
+        for key in signature_keys
+    )
@@ -15,6 +15,10 @@ from eth_utils import (
 )
 import rlp
 
+from eth._utils.ecrecover import (
+    get_signature_key,
+    recovery_cache,
+)
 from eth._utils.numeric import (
     is_even,
 )
@@ -86,23 +90,20 @@ def create_transaction_signature(
 
 
 def validate_transaction_signature(transaction: SignedTransactionAPI) -> None:
-    message = transaction.get_message_for_signing()
-    vrs = (transaction.y_parity, transaction.r, transaction.s)
+    signature_key = get_signature_key(transaction)
+    message_hash, y_parity, r, s = signature_key
     try:
-        signature = keys.Signature(vrs=vrs)
-        public_key = signature.recover_public_key_from_msg(message)
+        signature = keys.Signature(vrs=(y_parity, r, s))
+        public_key = recovery_cache.recover_public_key(*signature_key)
     except BadSignature as e:
         raise ValidationError(f"Bad Signature: {str(e)}")
 
-    if not signature.verify_msg(message, public_key):
+    if not signature.verify_msg_hash(message_hash, public_key):
         raise ValidationError("Invalid Signature")
 
 
 def extract_transaction_sender(transaction: SignedTransactionAPI) -> Address:
-    vrs = (transaction.y_parity, transaction.r, transaction.s)
-    signature = keys.Signature(vrs=vrs)
-    message = transaction.get_message_for_signing()
-    public_key = signature.recover_public_key_from_msg(message)
+    public_key = recovery_cache.recover_public_key(*get_signature_key(transaction))
     sender = public_key.to_canonical_address()
     return Address(sender)
 
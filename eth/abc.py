@@ -2,10 +2,14 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
     Any,
     Callable,
     ClassVar,
+    Collection,
     ContextManager,
     Dict,
     FrozenSet,
@@ -36,6 +40,7 @@ from eth_typing import (
 )
 from eth_utils import (
     ExtendedDebugLogger,
+    ValidationError,
 )
 
 from eth.constants import (
@@ -1030,6 +1035,24 @@ class DatabaseAPI(MutableMapping[bytes, bytes], ABC):
         """
         ...
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        """
+        Return the values of all ``keys``, in the same order, with ``None`` for the
+        keys that are missing.
+
+        Looks up one key at a time, unless the database overrides it.
+        """
+        return tuple(self.get(key) for key in keys)
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        """
+        Assign each value of the ``(key, value)`` pairs of ``items`` to its key.
+
+        Writes one key at a time, unless the database overrides it.
+        """
+        for key, value in items:
+            self[key] = value
+
 
 class AtomicWriteBatchAPI(DatabaseAPI):
     """
@@ -1514,15 +1537,117 @@ class OpcodeAPI(ABC):
         ...
 
 
+class WarmStateCacheAPI(ABC):
+    """
+    A size-bounded cache of the state at a single state root, which outlives the
+    state objects of a block, so that the next block starts with the accounts,
+    storage slots and bytecode that the previous blocks used.
+
+    Accounts and storage slots are kept in their encoded form. Bytecode is keyed by
+    its hash, so it stays valid at every state root.
+    """
+
+    max_size: int
+    size: int
+
+    @property
+    @abstractmethod
+    def state_root(self) -> Optional[Hash32]:
+        """
+        Return the state root that the cached accounts and storage slots belong to,
+        or ``None`` if there is none.
+        """
+        ...
+
+    @abstractmethod
+    def get_account(self, address: Address) -> Optional[bytes]:
+        """
+        Return the encoded account at ``address``, or ``None`` if it is not cached.
+        An account that does not exist is cached as ``b""``.
+        """
+        ...
+
+    @abstractmethod
+    def set_account(self, address: Address, encoded_account: bytes) -> None:
+        """
+        Cache the encoded account at ``address``.
+        """
+        ...
+
+    @abstractmethod
+    def get_storage(self, address: Address, slot_key: bytes) -> Optional[bytes]:
+        """
+        Return the encoded value of the storage slot of ``address`` with the big
+        endian ``slot_key``, or ``None`` if it is not cached. An empty slot is
+        cached as ``b""``.
+        """
+        ...
+
+    @abstractmethod
+    def set_storage(self, address: Address, slot_key: bytes, value: bytes) -> None:
+        """
+        Cache the encoded value of a storage slot of ``address``.
+        """
+        ...
+
+    @abstractmethod
+    def get_code(self, code_hash: Hash32) -> Optional[bytes]:
+        """
+        Return the bytecode with the hash ``code_hash``, or ``None`` if it is not
+        cached.
+        """
+        ...
+
+    @abstractmethod
+    def set_code(self, code_hash: Hash32, code: bytes) -> None:
+        """
+        Cache the bytecode ``code`` with the hash ``code_hash``.
+        """
+        ...
+
+    @abstractmethod
+    def apply_changes(
+        self,
+        from_root: Hash32,
+        to_root: Hash32,
+        accounts: Dict[Address, bytes],
+        storage: Dict[Address, Dict[bytes, bytes]],
+        wiped_addresses: Collection[Address],
+    ) -> None:
+        """
+        Move the cache from the state at ``from_root`` to the state at ``to_root``,
+        which differs by the given encoded ``accounts`` and ``storage`` slots, and
+        by the storage of ``wiped_addresses`` being deleted before them.
+
+        If the cache is not at ``from_root``, the accounts and storage slots that
+        it held are dropped first.
+        """
+        ...
+
+    @abstractmethod
+    def discard_state_roots(self, state_roots: Collection[Hash32]) -> None:
+        """
+        Drop the cached accounts and storage slots if they belong to one of
+        ``state_roots``, like the roots of the blocks that a reorg removed from
+        the canonical chain.
+        """
+        ...
+
+
 class ChainContextAPI(ABC):
     """
     Immutable chain context information that remains constant over the VM execution.
     """
 
     @abstractmethod
-    def __init__(self, chain_id: Optional[int]) -> None:
+    def __init__(
+        self,
+        chain_id: Optional[int],
+        warm_state_cache: Optional[WarmStateCacheAPI] = None,
+    ) -> None:
         """
-        Initialize the chain context with the given ``chain_id``.
+        Initialize the chain context with the given ``chain_id``, and the
+        ``warm_state_cache`` that the states of the chain share, if any.
         """
         ...
 
@@ -1534,6 +1659,15 @@ class ChainContextAPI(ABC):
         """
         ...
 
+    @property
+    @abstractmethod
+    def warm_state_cache(self) -> Optional[WarmStateCacheAPI]:
+        """
+        Return the cache of the state that carries over from one block to the
+        next, or ``None`` if the chain does not keep one.
+        """
+        ...
+
 
 class TransactionContextAPI(ABC):
     """
@@ -1572,6 +1706,15 @@ class TransactionContextAPI(ABC):
         """
         ...
 
+    @property
+    @abstractmethod
+    def resource_pool(self) -> "ResourcePoolAPI":
+        """
+        Return the pool of stacks and memories shared by all the computations of the
+        transaction.
+        """
+        ...
+
 
 class MemoryAPI(ABC):
     """
@@ -1593,12 +1736,22 @@ class MemoryAPI(ABC):
         ...
 
     @abstractmethod
-    def write(self, start_position: int, size: int, value: bytes) -> None:
+    def write(self, start_position: int, size: int, value: BytesOrView) -> None:
         """
         Write `value` into memory.
         """
         ...
 
+    @abstractmethod
+    def write_unchecked(self, start_position: int, value: BytesOrView) -> None:
+        """
+        Write ``value`` into memory at ``start_position``, without validating it.
+
+        The caller must make sure that the memory was already extended to cover the
+        write, and that ``value`` is ``bytes`` or a view of bytes.
+        """
+        ...
+
     @abstractmethod
     def read(self, start_position: int, size: int) -> memoryview:
         """
@@ -1613,6 +1766,13 @@ class MemoryAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Empty the memory, so that it can be reused by another computation.
+        """
+        ...
+
 
 class StackAPI(ABC):
     """
@@ -1688,6 +1848,28 @@ class StackAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def pop2_ints(self) -> Tuple[int, int]:
+        """
+        Pop the last two items from the stack, returning a tuple of their ordinal
+        values, like ``pop_ints(2)``.
+
+        Raise `eth.exceptions.InsufficientStack` if there are fewer than two items on
+        the stack.
+        """
+        ...
+
+    @abstractmethod
+    def pop3_ints(self) -> Tuple[int, int, int]:
+        """
+        Pop the last three items from the stack, returning a tuple of their ordinal
+        values, like ``pop_ints(3)``.
+
+        Raise `eth.exceptions.InsufficientStack` if there are fewer than three items on
+        the stack.
+        """
+        ...
+
     @abstractmethod
     def pop_bytes(self, num_items: int) -> Tuple[bytes, ...]:
         """
@@ -1714,6 +1896,54 @@ class StackAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all items from the stack, so that it can be reused by another
+        computation.
+        """
+        ...
+
+
+TResource = TypeVar("TResource", StackAPI, MemoryAPI)
+
+
+class ResourcePoolAPI(ABC):
+    """
+    A pool of cleared stacks and memories, recycled from finished computations.
+    """
+
+    @abstractmethod
+    def acquire(self, resource_class: Type[TResource]) -> TResource:
+        """
+        Return a cleared instance of ``resource_class``, reusing a released one if
+        there is any.
+        """
+        ...
+
+    @abstractmethod
+    def release(self, resource: TResource) -> None:
+        """
+        Clear ``resource`` and keep it for reuse. The caller must not use it after.
+        """
+        ...
+
+
+class KeccakMemoAPI(ABC):
+    """
+    A memo of the keccak hashes of short preimages, shared by computations.
+    """
+
+    max_preimage_size: int
+
+    @abstractmethod
+    def keccak(self, preimage: bytes) -> bytes:
+        """
+        Return the keccak hash of ``preimage``, which is at most
+        ``max_preimage_size`` bytes long.
+        """
+        ...
+
 
 class CodeStreamAPI(ABC):
     """
@@ -1782,6 +2012,22 @@ class StackManipulationAPI(ABC):
         """
         ...
 
+    @abstractmethod
+    def stack_pop2_ints(self) -> Tuple[int, int]:
+        """
+        Pop the last two items from the stack, returning a tuple of their ordinal
+        values.
+        """
+        ...
+
+    @abstractmethod
+    def stack_pop3_ints(self) -> Tuple[int, int, int]:
+        """
+        Pop the last three items from the stack, returning a tuple of their ordinal
+        values.
+        """
+        ...
+
     @abstractmethod
     def stack_pop_bytes(self, num_items: int) -> Tuple[bytes, ...]:
         """
@@ -1914,6 +2160,75 @@ class ExecutionContextAPI(ABC):
         ...
 
 
+class TraceStep(NamedTuple):
+    """
+    The state of a computation right before it runs an opcode, as reported to a
+    :class:`~eth.abc.TracerAPI`.
+
+    ``stack`` and ``memory`` are only captured if the tracer asks for them, and are
+    ``None`` otherwise. The stack is ordered from the bottom to the top.
+    """
+
+    pc: int
+    op: int
+    op_name: str
+    gas: int
+    gas_cost: int
+    depth: int
+    refund: int
+    memory_size: int
+    stack: Optional[Tuple[int, ...]]
+    memory: Optional[bytes]
+
+
+class TracerAPI(ABC):
+    """
+    Receive a structured event for every opcode that computations run.
+
+    A tracer is installed as the ``tracer`` of a computation class, or of a state to
+    trace only the computations run on it. Installing a tracer makes computations
+    run on the slower, traced interpreter loop. Without one, tracing costs nothing.
+    """
+
+    capture_stack: bool = False
+    capture_memory: bool = False
+
+    @abstractmethod
+    def on_step(self, step: TraceStep) -> None:
+        """
+        Called before each opcode runs. ``step.gas_cost`` is the static gas of the
+        opcode, since any dynamic cost is only known once it ran.
+        """
+        ...
+
+    @abstractmethod
+    def on_computation_end(self, computation: "ComputationAPI") -> None:
+        """
+        Called once a computation is done, including the computations of nested
+        calls, which end before the computation that made the call.
+        """
+        ...
+
+
+class ExecutionEngineAPI(ABC):
+    """
+    Run the code of computations, in place of the built-in interpreter loops.
+
+    An engine only changes how opcodes are dispatched. It changes the stack, memory,
+    gas and state through the computation it is given, so the state and its journal
+    stay authoritative, and child computations are still made by the computation.
+    Computations that are traced or profiled always run on the built-in loops.
+    """
+
+    @abstractmethod
+    def execute(self, computation: "ComputationAPI") -> None:
+        """
+        Run the code of ``computation`` until it halts. Errors are raised as they
+        would be by the built-in loops, for the computation to record when it exits.
+        """
+        ...
+
+
 class ComputationAPI(
     ContextManager["ComputationAPI"],
     StackManipulationAPI,
@@ -1929,18 +2244,21 @@ class ComputationAPI(
     transaction_context: TransactionContextAPI
     code: CodeStreamAPI
     children: List["ComputationAPI"]
-    return_data: bytes = b""
+    # A view of the output of the last child computation, see output_view
+    return_data: BytesOrView = b""
     accounts_to_delete: Dict[Address, Address]
 
     _memory: MemoryAPI
     _stack: StackAPI
     _gas_meter: GasMeterAPI
     _error: VMError
-    _output: bytes = b""
+    _output: BytesOrView = b""
     _log_entries: List[Tuple[int, Address, Tuple[int, ...], bytes]]
 
     # VM configuration
     opcodes: Dict[int, OpcodeAPI]
+    keccak_memo: Optional[KeccakMemoAPI]
+    execution_engine: Optional[ExecutionEngineAPI]
     _precompiles: Dict[Address, Callable[["ComputationAPI"], "ComputationAPI"]]
 
     @abstractmethod
@@ -2052,13 +2370,22 @@ class ComputationAPI(
         ...
 
     @abstractmethod
-    def memory_write(self, start_position: int, size: int, value: bytes) -> None:
+    def memory_write(self, start_position: int, size: int, value: BytesOrView) -> None:
         """
         Write ``value`` to memory at ``start_position``. Require that
         ``len(value) == size``.
         """
         ...
 
+    @abstractmethod
+    def memory_write_unchecked(self, start_position: int, value: BytesOrView) -> None:
+        """
+        Write ``value`` to memory at ``start_position``, skipping the validation of
+        :meth:`memory_write`. Only for opcode logic that already extended the memory
+        to cover the write, with a value of the right length.
+        """
+        ...
+
     @abstractmethod
     def memory_read(self, start_position: int, size: int) -> memoryview:
         """
@@ -2138,20 +2465,32 @@ class ComputationAPI(
     @abstractmethod
     def output(self) -> bytes:
         """
-        Get the return value of the computation.
+        Get the return value of the computation, as ``bytes``.
         """
         ...
 
     @output.setter
-    def output(self, value: bytes) -> None:
+    def output(self, value: BytesOrView) -> None:
         """
-        Set the return value of the computation.
+        Set the return value of the computation, which may be a view, like one of
+        memory from :meth:`memory_read`, that no one writes to afterwards.
         """
         # See: https://github.com/python/mypy/issues/4165
         # Since we can't also decorate this with abstract method we want to be
         # sure that the setter doesn't actually get used as a noop.
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def output_view(self) -> BytesOrView:
+        """
+        Get the return value of the computation as it was set, which may be a view,
+        so that it can be passed on to the calling computation without copying.
+        Only materialize it with :attr:`output` when it leaves the EVM, like when it
+        is stored as code.
+        """
+        ...
+
     # -- opcode API -- #
     @property
     @abstractmethod
@@ -2441,10 +2780,14 @@ class AccountDatabaseAPI(ABC):
 
     @abstractmethod
     def __init__(
-        self, db: AtomicDatabaseAPI, state_root: Hash32 = BLANK_ROOT_HASH
+        self,
+        db: AtomicDatabaseAPI,
+        state_root: Hash32 = BLANK_ROOT_HASH,
+        warm_state_cache: WarmStateCacheAPI = None,
     ) -> None:
         """
-        Initialize the account database.
+        Initialize the account database, reading through ``warm_state_cache``
+        while it is at ``state_root``, if it is given.
         """
         ...
 
@@ -2716,6 +3059,17 @@ class AccountDatabaseAPI(ABC):
         ...
 
 
+class TransactionPrevalidation(NamedTuple):
+    """
+    The outcome of the checks of a transaction that do not depend on the state, run
+    ahead of applying it. ``error`` is the ``ValidationError`` the checks raised, if
+    any, to raise when the transaction is applied.
+    """
+
+    intrinsic_gas: int
+    error: Optional[ValidationError]
+
+
 class TransactionExecutorAPI(ABC):
     """
     A class providing APIs to execute transactions on VM state.
@@ -2809,15 +3163,21 @@ class StateAPI(ConfigurableAPI):
     account_db_class: Type[AccountDatabaseAPI]
     transaction_executor_class: Type[TransactionExecutorAPI] = None
 
+    # Set to a tracer to report every opcode that the computations on this state
+    # run, in place of the tracer of the computation class
+    tracer: TracerAPI = None
+
     @abstractmethod
     def __init__(
         self,
         db: AtomicDatabaseAPI,
         execution_context: ExecutionContextAPI,
         state_root: bytes,
+        warm_state_cache: WarmStateCacheAPI = None,
     ) -> None:
         """
-        Initialize the state.
+        Initialize the state, sharing ``warm_state_cache`` with the states of the
+        other blocks, if it is given.
         """
         ...
 
@@ -3207,6 +3567,36 @@ class StateAPI(ConfigurableAPI):
         """
         ...
 
+    @abstractmethod
+    def prevalidate_transactions(
+        self,
+        transactions: Sequence[SignedTransactionAPI],
+        executor: Executor = None,
+    ) -> None:
+        """
+        Run the checks of ``transactions`` that do not depend on the state all at
+        once, on ``executor`` if given, and keep their outcomes for when each
+        transaction is applied.
+        """
+        ...
+
+    @abstractmethod
+    def get_transaction_prevalidation(
+        self, transaction: SignedTransactionAPI
+    ) -> Optional[TransactionPrevalidation]:
+        """
+        Return the outcome of the checks of ``transaction`` run by
+        :meth:`prevalidate_transactions`, or ``None`` if they were not run.
+        """
+        ...
+
+    @abstractmethod
+    def clear_transaction_prevalidations(self) -> None:
+        """
+        Forget the outcomes kept by :meth:`prevalidate_transactions`.
+        """
+        ...
+
     @abstractmethod
     def costless_execute_transaction(
         self,
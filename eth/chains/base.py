@@ -53,6 +53,7 @@ from eth.abc import (
     StateAPI,
     UnsignedTransactionAPI,
     VirtualMachineAPI,
+    WarmStateCacheAPI,
     WithdrawalAPI,
 )
 from eth.consensus import (
@@ -68,6 +69,9 @@ from eth.db.chain import (
 from eth.db.header import (
     HeaderDB,
 )
+from eth.db.warm_state import (
+    WarmStateCache,
+)
 from eth.estimators import (
     get_gas_estimator,
 )
@@ -193,6 +197,11 @@ class Chain(BaseChain):
     chaindb_class: Type[ChainDatabaseAPI] = ChainDB
     consensus_context_class: Type[ConsensusContextAPI] = ConsensusContext
 
+    # Set to a number of bytes to keep a cache of the state of that size, which
+    # carries over from one block to the next. Warm hits skip the accesses to the
+    # database, so the meta witnesses of the imported blocks are incomplete.
+    warm_state_cache_size: int = None
+
     def __init__(self, base_db: AtomicDatabaseAPI) -> None:
         if not self.vm_configuration:
             raise ValueError(
@@ -207,6 +216,10 @@ class Chain(BaseChain):
         self.headerdb = HeaderDB(base_db)
         if self.gas_estimator is None:
             self.gas_estimator = get_gas_estimator()
+        if self.warm_state_cache_size is None:
+            self.warm_state_cache: WarmStateCacheAPI = None
+        else:
+            self.warm_state_cache = WarmStateCache(self.warm_state_cache_size)
 
     #
     # Helpers
@@ -270,7 +283,7 @@ class Chain(BaseChain):
     def get_vm(self, at_header: BlockHeaderAPI = None) -> VirtualMachineAPI:
         header = self.ensure_header(at_header)
         vm_class = self.get_vm_class_for_block_number(header.block_number)
-        chain_context = ChainContext(self.chain_id)
+        chain_context = ChainContext(self.chain_id, self.warm_state_cache)
 
         return vm_class(
             header=header,
@@ -519,6 +532,13 @@ class Chain(BaseChain):
                 raise
 
         persist_result = self.persist_block(imported_block, perform_validation)
+        if self.warm_state_cache is not None and persist_result.old_canonical_blocks:
+            self.warm_state_cache.discard_state_roots(
+                {
+                    old_block.header.state_root
+                    for old_block in persist_result.old_canonical_blocks
+                }
+            )
         return BlockImportResult(*persist_result, block_result.meta_witness)
 
     def persist_block(
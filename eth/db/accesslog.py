@@ -4,8 +4,12 @@ from contextlib import (
 import logging
 from typing import (
     FrozenSet,
+    Iterable,
     Iterator,
+    Optional,
+    Sequence,
     Set,
+    Tuple,
 )
 
 from eth.abc import (
@@ -18,6 +22,8 @@ from eth.db.atomic import (
 )
 from eth.db.backends.base import (
     BaseDB,
+    get_many_from,
+    write_many_to,
 )
 
 
@@ -65,6 +71,19 @@ class KeyAccessLoggerDB(BaseDB):
             self._keys_read.add(key)
         return does_exist
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        values = get_many_from(self.wrapped_db, keys)
+        if self._log_missing_keys:
+            self._keys_read.update(keys)
+        else:
+            self._keys_read.update(
+                key for key, value in zip(keys, values) if value is not None
+            )
+        return values
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        write_many_to(self.wrapped_db, items)
+
 
 class KeyAccessLoggerAtomicDB(BaseAtomicDB):
     """
@@ -113,6 +132,19 @@ class KeyAccessLoggerAtomicDB(BaseAtomicDB):
             self._keys_read.add(key)
         return does_exist
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        values = get_many_from(self.wrapped_db, keys)
+        if self._log_missing_keys:
+            self._keys_read.update(keys)
+        else:
+            self._keys_read.update(
+                key for key, value in zip(keys, values) if value is not None
+            )
+        return values
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        write_many_to(self.wrapped_db, items)
+
     @contextmanager
     def atomic_batch(self) -> Iterator[AtomicWriteBatchAPI]:
         with self.wrapped_db.atomic_batch() as readable_batch:
@@ -1,6 +1,7 @@
 from typing import (
     Dict,
     Iterable,
+    Optional,
     Set,
     Tuple,
     cast,
@@ -37,6 +38,7 @@ from eth.abc import (
     AtomicDatabaseAPI,
     DatabaseAPI,
     MetaWitnessAPI,
+    WarmStateCacheAPI,
 )
 from eth.constants import (
     BLANK_ROOT_HASH,
@@ -64,6 +66,10 @@ from eth.db.journal import (
 from eth.db.storage import (
     AccountStorageDB,
 )
+from eth.db.warm_state import (
+    WarmAccountLookup,
+    WarmStateView,
+)
 from eth.db.witness import (
     AccountQueryTracker,
     MetaWitness,
@@ -96,7 +102,10 @@ class AccountDB(AccountDatabaseAPI):
     logger = get_extended_debug_logger("eth.db.account.AccountDB")
 
     def __init__(
-        self, db: AtomicDatabaseAPI, state_root: Hash32 = BLANK_ROOT_HASH
+        self,
+        db: AtomicDatabaseAPI,
+        state_root: Hash32 = BLANK_ROOT_HASH,
+        warm_state_cache: WarmStateCacheAPI = None,
     ) -> None:
         r"""
         Internal implementation details (subject to rapid change):
@@ -130,6 +139,13 @@ class AccountDB(AccountDatabaseAPI):
         rather than the nodes stored by the trie). This enables
         a squashing of all account changes before pushing them into the trie.
 
+        _warm_state, if there is a ``warm_state_cache``, reads the accounts
+        in between _trie_logger and _trie_cache, and the storage and code, from
+        the cache while the trie is still at its state root. It records the
+        changes to move the cache to the new state root on :meth:`persist`.
+        Warm hits do not reach the key access loggers, so the meta witness
+        does not include the trie nodes and bytecode that they skipped.
+
         .. NOTE:: StorageDB works similarly
 
         AccountDB synchronizes the snapshot/revert/persist of both of the
@@ -141,7 +157,14 @@ class AccountDB(AccountDatabaseAPI):
         self._journaldb = JournalDB(self._batchdb)
         self._trie = HashTrie(HexaryTrie(self._batchtrie, state_root, prune=True))
         self._trie_logger = KeyAccessLoggerDB(self._trie, log_missing_keys=False)
-        self._trie_cache = CacheDB(self._trie_logger)
+        if warm_state_cache is None:
+            self._warm_state: WarmStateView = None
+            self._trie_cache = CacheDB(self._trie_logger)
+        else:
+            self._warm_state = WarmStateView(warm_state_cache, state_root)
+            self._trie_cache = CacheDB(
+                WarmAccountLookup(self._trie_logger, self._warm_state, self._trie)
+            )
         self._journaltrie = JournalDB(self._trie_cache)
         self._account_cache = LRU(2048)
         self._account_stores: Dict[Address, AccountStorageDatabaseAPI] = {}
@@ -161,7 +184,11 @@ class AccountDB(AccountDatabaseAPI):
     def state_root(self, value: Hash32) -> None:
         if self._trie.root_hash != value:
             self._trie_cache.reset_cache()
+            self._account_cache.clear()
             self._trie.root_hash = value
+            if self._warm_state is not None:
+                # the changes recorded so far do not lead to the new root
+                self._warm_state.detach()
 
     def has_root(self, state_root: bytes) -> bool:
         return state_root in self._batchtrie
@@ -222,10 +249,37 @@ class AccountDB(AccountDatabaseAPI):
             store = self._account_stores[address]
         else:
             storage_root = self._get_storage_root(address)
-            store = AccountStorageDB(self._raw_store_db, storage_root, address)
+            store = AccountStorageDB(
+                self._raw_store_db,
+                storage_root,
+                address,
+                self._warm_state,
+                self._get_warm_storage_root(address, storage_root),
+            )
             self._account_stores[address] = store
         return store
 
+    def _get_warm_storage_root(
+        self, address: Address, storage_root: Hash32
+    ) -> Optional[Hash32]:
+        """
+        Return ``storage_root`` if the storage of ``address`` can be read from the
+        warm state cache, because it is the storage root in the cached state.
+        """
+        warm_state = self._warm_state
+        if (
+            warm_state is None
+            or not warm_state.is_current
+            or self._trie.root_hash != warm_state.state_root
+        ):
+            return None
+        elif self._get_account(address, from_journal=False).storage_root != (
+            storage_root
+        ):
+            return None
+        else:
+            return storage_root
+
     def _dirty_account_stores(
         self,
     ) -> Iterable[Tuple[Address, AccountStorageDatabaseAPI]]:
@@ -306,14 +360,23 @@ class AccountDB(AccountDatabaseAPI):
         code_hash = self.get_code_hash(address)
         if code_hash == EMPTY_SHA3:
             return b""
+        elif self._warm_state is not None:
+            code = self._warm_state.cache.get_code(code_hash)
+            if code is None:
+                code = self._get_code_from_db(address, code_hash)
+                self._warm_state.cache.set_code(code_hash, code)
+            return code
         else:
-            try:
-                return self._journaldb[code_hash]
-            except KeyError:
-                raise MissingBytecode(code_hash) from KeyError
-            finally:
-                if code_hash in self._get_accessed_node_hashes():
-                    self._accessed_bytecodes.add(address)
+            return self._get_code_from_db(address, code_hash)
+
+    def _get_code_from_db(self, address: Address, code_hash: Hash32) -> bytes:
+        try:
+            return self._journaldb[code_hash]
+        except KeyError:
+            raise MissingBytecode(code_hash) from KeyError
+        finally:
+            if code_hash in self._get_accessed_node_hashes():
+                self._accessed_bytecodes.add(address)
 
     def set_code(self, address: Address, code: bytes) -> None:
         validate_canonical_address(address, title="Storage Address")
@@ -323,6 +386,9 @@ class AccountDB(AccountDatabaseAPI):
 
         code_hash = keccak(code)
         self._journaldb[code_hash] = code
+        if self._warm_state is not None:
+            # bytecode is keyed by its hash, so it stays valid even if this reverts
+            self._warm_state.cache.set_code(Hash32(code_hash), code)
         self._set_account(address, account.copy(code_hash=code_hash))
 
     def get_code_hash(self, address: Address) -> Hash32:
@@ -436,10 +502,15 @@ class AccountDB(AccountDatabaseAPI):
         return checkpoint
 
     def discard(self, checkpoint: JournalDBCheckpoint) -> None:
+        # Only the accounts written since the checkpoint are reverted, so the rest of
+        #   the cached accounts stay valid
+        reverted_addresses = self._journaltrie.keys_changed_since(checkpoint)
         self._journaldb.discard(checkpoint)
         self._journaltrie.discard(checkpoint)
         self._journal_accessed_state.discard(checkpoint)
-        self._account_cache.clear()
+        for address in reverted_addresses:
+            if address in self._account_cache:
+                del self._account_cache[address]
         for _, store in self._dirty_account_stores():
             store.discard(checkpoint)
 
@@ -476,6 +547,8 @@ class AccountDB(AccountDatabaseAPI):
             # causes an atomic commit of the changes, so exceptions will revert the trie
             with self._trie.squash_changes() as memory_trie:
                 self._apply_account_diff_without_proof(diff, memory_trie)
+            if self._warm_state is not None:
+                self._record_warm_account_changes(diff)
 
         self._journaltrie.reset()
         self._trie_cache.reset_cache()
@@ -525,6 +598,8 @@ class AccountDB(AccountDatabaseAPI):
             self._batchtrie.commit_to(write_batch, apply_deletes=False)
             self._batchdb.commit_to(write_batch, apply_deletes=False)
         self._root_hash_at_last_persist = new_root_hash
+        if self._warm_state is not None:
+            self._warm_state.commit(new_root_hash)
 
         return meta_witness
 
@@ -558,6 +633,13 @@ class AccountDB(AccountDatabaseAPI):
         """
         return MetaWitness(self._get_accessed_node_hashes(), self._get_access_list())
 
+    def _record_warm_account_changes(self, diff: DBDiff) -> None:
+        for address, encoded_account in diff.pending_items():
+            self._warm_state.record_account_change(Address(address), encoded_account)
+        for address in diff.deleted_keys():
+            # the account does not exist at the new state root
+            self._warm_state.record_account_change(Address(address), b"")
+
     def _validate_generated_root(self) -> None:
         db_diff = self._journaldb.diff()
         if db_diff:
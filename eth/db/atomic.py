@@ -3,7 +3,11 @@ from contextlib import (
 )
 import logging
 from typing import (
+    Iterable,
     Iterator,
+    Optional,
+    Sequence,
+    Tuple,
 )
 
 from eth_utils import (
@@ -17,6 +21,8 @@ from eth.abc import (
 from eth.db.backends.base import (
     BaseAtomicDB,
     BaseDB,
+    get_many_from,
+    write_many_to,
 )
 from eth.db.backends.memory import (
     MemoryDB,
@@ -52,6 +58,12 @@ class AtomicDB(BaseAtomicDB):
     def _exists(self, key: bytes) -> bool:
         return key in self.wrapped_db
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        return get_many_from(self.wrapped_db, keys)
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        write_many_to(self.wrapped_db, items)
+
     @contextmanager
     def atomic_batch(self) -> Iterator[AtomicWriteBatchAPI]:
         with AtomicDBWriteBatch._commit_unless_raises(self) as readable_batch:
@@ -103,6 +115,18 @@ class AtomicDBWriteBatch(BaseDB, AtomicWriteBatchAPI):
             raise KeyError(key)
         del self._track_diff[key]
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        if self._track_diff is None:
+            raise ValidationError("Cannot get data from a write batch, out of context")
+
+        return self._track_diff.multi_get_through(self._write_target_db, keys)
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        if self._track_diff is None:
+            raise ValidationError("Cannot set data from a write batch, out of context")
+
+        self._track_diff.write_many(items)
+
     def _diff(self) -> DBDiff:
         return self._track_diff.diff()
 
@@ -1,5 +1,13 @@
 from typing import (
+    Any,
+    Iterable,
     Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
 )
 
 from eth.abc import (
@@ -79,3 +87,31 @@ class BaseAtomicDB(BaseDB, AtomicDatabaseAPI):
     """
 
     pass
+
+
+def get_many_from(
+    db: Union[DatabaseAPI, Mapping[bytes, Any]], keys: Sequence[bytes]
+) -> Tuple[Optional[bytes], ...]:
+    """
+    Look up all ``keys`` in ``db`` like :meth:`~eth.abc.DatabaseAPI.multi_get`, one
+    at a time if ``db`` is a plain mapping, like a dict or a trie.
+    """
+    if isinstance(db, DatabaseAPI):
+        return db.multi_get(keys)
+    else:
+        return tuple(db.get(key) for key in keys)
+
+
+def write_many_to(
+    db: Union[DatabaseAPI, MutableMapping[bytes, Any]],
+    items: Iterable[Tuple[bytes, bytes]],
+) -> None:
+    """
+    Write all ``items`` to ``db`` like :meth:`~eth.abc.DatabaseAPI.write_many`, one
+    at a time if ``db`` is a plain mapping, like a dict or a trie.
+    """
+    if isinstance(db, DatabaseAPI):
+        db.write_many(items)
+    else:
+        for key, value in items:
+            db[key] = value
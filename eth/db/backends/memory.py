@@ -1,6 +1,10 @@
 from typing import (
     Dict,
+    Iterable,
     Iterator,
+    Optional,
+    Sequence,
+    Tuple,
 )
 
 from .base import (
@@ -29,6 +33,19 @@ class MemoryDB(BaseDB):
     def __delitem__(self, key: bytes) -> None:
         del self.kv_store[key]
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        # A subclass that overrides __getitem__ sees every read
+        if type(self).__getitem__ is not MemoryDB.__getitem__:
+            return super().multi_get(keys)
+        return tuple(map(self.kv_store.get, keys))
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        # A subclass that overrides __setitem__ sees every write
+        if type(self).__setitem__ is not MemoryDB.__setitem__:
+            super().write_many(items)
+        else:
+            self.kv_store.update(items)
+
     def __iter__(self) -> Iterator[bytes]:
         return iter(self.kv_store)
 
@@ -0,0 +1,187 @@
+from contextlib import (
+    contextmanager,
+)
+import logging
+from pathlib import (
+    Path,
+)
+import sqlite3
+import threading
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from eth.abc import (
+    AtomicWriteBatchAPI,
+)
+from eth.db.atomic import (
+    AtomicDBWriteBatch,
+)
+from eth.db.backends.base import (
+    BaseAtomicDB,
+)
+from eth.db.diff import (
+    DBDiff,
+)
+
+SQLITE_DB_FILENAME = "kv.sqlite3"
+
+DEFAULT_PAGE_CACHE_SIZE = 64 * 1024 * 1024
+
+# Stay below the lowest limit on the number of parameters of a statement that SQLite
+# may be built with
+MAX_KEYS_PER_SELECT = 999
+
+
+class SQLiteDB(BaseAtomicDB):
+    """
+    A persistent key/value database in a single SQLite file in ``db_path``, which is
+    created if it does not exist.
+
+    The file is in WAL mode, so readers do not block the writer, and every write
+    outside of an atomic batch is committed on its own. Atomic batches, and the
+    writes of :meth:`write_many`, are committed in a single SQLite transaction.
+
+    ``page_cache_size`` is the size of the SQLite page cache, in bytes.
+
+    The database can be used from any thread. Its connection is shared, so only one
+    thread uses it at a time, and a transaction never takes in the writes of
+    another thread.
+    """
+
+    logger = logging.getLogger("eth.db.backends.SQLiteDB")
+
+    def __init__(
+        self,
+        db_path: Union[Path, str] = None,
+        page_cache_size: int = DEFAULT_PAGE_CACHE_SIZE,
+    ) -> None:
+        if not db_path:
+            raise TypeError("Please specify a valid path for SQLiteDB")
+
+        self.db_path = Path(db_path)
+        self.db_path.mkdir(parents=True, exist_ok=True)
+
+        # Transactions are started explicitly, see _transaction()
+        self._connection = sqlite3.connect(
+            str(self.db_path / SQLITE_DB_FILENAME),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        # Held around every use of the connection, including whole transactions
+        self._lock = threading.RLock()
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        # In WAL mode, a crash can lose the latest commits, but never corrupts the
+        # database, nor keeps part of a transaction
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        # A negative size is in KiB rather than in pages
+        self._connection.execute(f"PRAGMA cache_size = {-(page_cache_size // 1024)}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS kv "
+            "(key BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+        )
+
+    def __getitem__(self, key: bytes) -> bytes:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM kv WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def _exists(self, key: bytes) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM kv WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def __delitem__(self, key: bytes) -> None:
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM kv WHERE key = ?", (key,))
+            if cursor.rowcount == 0:
+                raise KeyError(key)
+
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        values: Dict[bytes, bytes] = {}
+        with self._lock:
+            for start in range(0, len(keys), MAX_KEYS_PER_SELECT):
+                chunk = keys[start : start + MAX_KEYS_PER_SELECT]
+                placeholders = ", ".join("?" * len(chunk))
+                values.update(
+                    self._connection.execute(
+                        f"SELECT key, value FROM kv WHERE key IN ({placeholders})",
+                        tuple(chunk),
+                    )
+                )
+        return tuple(values.get(key) for key in keys)
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        """
+        Set all the key/value pairs of ``items`` in a single transaction.
+        """
+        with self._transaction():
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", items
+            )
+
+    @contextmanager
+    def atomic_batch(self) -> Iterator[AtomicWriteBatchAPI]:
+        with SQLiteWriteBatch._commit_unless_raises(self) as readable_batch:
+            yield readable_batch
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _apply_diff(self, diff: DBDiff) -> None:
+        with self._transaction():
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)",
+                diff.pending_items(),
+            )
+            self._connection.executemany(
+                "DELETE FROM kv WHERE key = ?",
+                ((key,) for key in diff.deleted_keys()),
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+
+    def __repr__(self) -> str:
+        return f"SQLiteDB({str(self.db_path)!r})"
+
+
+class SQLiteWriteBatch(AtomicDBWriteBatch):
+    """
+    A write batch of a :class:`SQLiteDB`, which commits all of its changes in a single
+    SQLite transaction.
+    """
+
+    logger = logging.getLogger("eth.db.backends.SQLiteWriteBatch")
+
+    def _commit(self) -> None:
+        cast(SQLiteDB, self._write_target_db)._apply_diff(self._diff())
@@ -1,4 +1,10 @@
 import logging
+from typing import (
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from eth_utils import (
     ValidationError,
@@ -92,5 +98,13 @@ class BatchDB(BaseDB):
             raise KeyError(key)
         del self._track_diff[key]
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        return self._track_diff.multi_get_through(
+            self.wrapped_db, keys, self._read_through_deletes
+        )
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        self._track_diff.write_many(items)
+
     def diff(self) -> DBDiff:
         return self._track_diff.diff()
@@ -1,3 +1,12 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
 from lru import (
     LRU,
 )
@@ -7,6 +16,8 @@ from eth.abc import (
 )
 from eth.db.backends.base import (
     BaseDB,
+    get_many_from,
+    write_many_to,
 )
 
 
@@ -37,3 +48,28 @@ class CacheDB(BaseDB):
         if key in self._cached_values:
             del self._cached_values[key]
         del self._db[key]
+
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        cached_values = self._cached_values
+        # Loading the missing values may evict some of the others from the cache
+        values: Dict[bytes, Optional[bytes]] = {}
+        missing_keys: List[bytes] = []
+        for key in keys:
+            if key in cached_values:
+                values[key] = cached_values[key]
+            else:
+                missing_keys.append(key)
+
+        if missing_keys:
+            for key, value in zip(missing_keys, get_many_from(self._db, missing_keys)):
+                values[key] = value
+                if value is not None:
+                    cached_values[key] = value
+
+        return tuple(values[key] for key in keys)
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        items = tuple(items)
+        for key, value in items:
+            self._cached_values[key] = value
+        write_many_to(self._db, items)
@@ -560,5 +560,4 @@ class ChainDB(HeaderDB, ChainDatabaseAPI):
     def _persist_trie_data_dict(
         cls, db: DatabaseAPI, trie_data_dict: Dict[Hash32, bytes]
     ) -> None:
-        for key, value in trie_data_dict.items():
-            db[key] = value
+        db.write_many(trie_data_dict.items())
@@ -6,6 +6,9 @@ from typing import (
     TYPE_CHECKING,
     Dict,
     Iterable,
+    List,
+    Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -19,6 +22,10 @@ from eth_utils import (
 from eth.abc import (
     DatabaseAPI,
 )
+from eth.db.backends.base import (
+    get_many_from,
+    write_many_to,
+)
 from eth.vm.interrupt import (
     EVMMissingData,
 )
@@ -102,6 +109,44 @@ class DBDiffTracker(ABC_Mutable_Mapping):
             "to update a database"
         )
 
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        self._changes.update(items)
+
+    def multi_get_through(
+        self,
+        db: DatabaseAPI,
+        keys: Sequence[bytes],
+        read_through_deletes: bool = False,
+    ) -> Tuple[Optional[bytes], ...]:
+        """
+        Return the values of all ``keys`` in ``db`` with the tracked changes applied,
+        in the same order, with ``None`` for the keys that are missing. The keys that
+        were never changed are looked up in ``db`` all at once.
+
+        :param read_through_deletes: whether deleted keys are looked up in ``db``,
+            rather than missing
+        """
+        changes = [self._changes.get(key, NEVER_INSERTED) for key in keys]
+        if read_through_deletes:
+            changes = [
+                NEVER_INSERTED if change is DELETED else change for change in changes
+            ]
+
+        unchanged_keys = tuple(
+            key for key, change in zip(keys, changes) if change is NEVER_INSERTED
+        )
+        unchanged_values = iter(get_many_from(db, unchanged_keys))
+
+        values: List[Optional[bytes]] = []
+        for change in changes:
+            if change is NEVER_INSERTED:
+                values.append(next(unchanged_values))
+            elif change is DELETED:
+                values.append(None)
+            else:
+                values.append(cast(bytes, change))
+        return tuple(values)
+
     def __len__(self) -> int:
         return len(self._changes)
 
@@ -203,19 +248,30 @@ class DBDiff(ABC_Mapping):
         :param apply_deletes: whether the pending deletes should be
             applied to the database
         """
-        for key, value in self._changes.items():
-            if value is DELETED:
-                if apply_deletes:
-                    try:
-                        del db[key]
-                    except EVMMissingData:
-                        raise
-                    except KeyError:
-                        pass
-                else:
+        changes = self._changes
+        deleted_keys = [key for key, value in changes.items() if value is DELETED]
+        if not deleted_keys:
+            # the common case: hand the whole diff over at once
+            write_many_to(db, cast(Dict[bytes, bytes], changes).items())
+            return
+
+        if apply_deletes:
+            for key in deleted_keys:
+                try:
+                    del db[key]
+                except EVMMissingData:
+                    raise
+                except KeyError:
                     pass
-            else:
-                db[key] = value  # type: ignore # ignore over cast for perf reasons
+
+        write_many_to(
+            db,
+            [
+                (key, cast(bytes, value))
+                for key, value in changes.items()
+                if value is not DELETED
+            ],
+        )
 
     @classmethod
     def join(cls, diffs: Iterable["DBDiff"]) -> "DBDiff":
@@ -5,8 +5,12 @@ from itertools import (
 from typing import (
     Callable,
     Dict,
+    Iterable,
     List,
+    Optional,
+    Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -28,6 +32,8 @@ from eth.typing import (
 
 from .backends.base import (
     BaseDB,
+    get_many_from,
+    write_many_to,
 )
 from .diff import (
     DBDiff,
@@ -222,6 +228,22 @@ class Journal(BaseDB):
                 return False
         raise ValidationError(f"Checkpoint {at_checkpoint} is not in the journal")
 
+    def keys_changed_since(self, checkpoint: JournalDBCheckpoint) -> Set[bytes]:
+        """
+        Returns the keys that were set or deleted since the given checkpoint, which
+        are the keys that discarding it would revert. If the journal was cleared since
+        the checkpoint, it would also revert the keys of the underlying database.
+        """
+        if checkpoint not in self._journal_data:
+            raise ValidationError(f"No checkpoint {checkpoint} was found")
+
+        changed_keys: Set[bytes] = set()
+        for changeset_id in reversed(self._journal_data.keys()):
+            changed_keys.update(self._journal_data[changeset_id])
+            if changeset_id == checkpoint:
+                break
+        return changed_keys
+
     def commit_checkpoint(self, commit_to: JournalDBCheckpoint) -> ChangesetDict:
         """
         Collapses all changes since the given checkpoint. Can no longer discard to any
@@ -293,6 +315,14 @@ class Journal(BaseDB):
             revert_changeset[key] = self._current_values.get(key, REVERT_TO_WRAPPED)
         self._current_values[key] = value
 
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        revert_changeset = self._journal_data[self.last_checkpoint]
+        current_values = self._current_values
+        for key, value in items:
+            if key not in revert_changeset:
+                revert_changeset[key] = current_values.get(key, REVERT_TO_WRAPPED)
+            current_values[key] = value
+
     def _exists(self, key: bytes) -> bool:
         val = self.get(key)
         return val is not None and val not in (REVERT_TO_WRAPPED, DELETE_WRAPPED)
@@ -392,6 +422,30 @@ class JournalDB(BaseDB):
         else:
             return True
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        journal = self._journal
+        journal_values = tuple(journal[key] for key in keys)
+        # look up all the keys that the journal knows nothing about at once
+        wrapped_values = iter(
+            get_many_from(
+                self._wrapped_db,
+                tuple(key for key, value in zip(keys, journal_values) if value is None),
+            )
+        )
+
+        values: List[Optional[bytes]] = []
+        for value in journal_values:
+            if value is None:
+                values.append(next(wrapped_values))
+            elif value is DELETE_WRAPPED or value is REVERT_TO_WRAPPED:
+                values.append(None)
+            else:
+                values.append(cast(bytes, value))
+        return tuple(values)
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        self._journal.write_many(items)
+
     def clear(self) -> None:
         """
         Remove all keys. Immediately after a clear, *all* getitem requests will return a
@@ -428,6 +482,12 @@ class JournalDB(BaseDB):
     def has_checkpoint(self, checkpoint: JournalDBCheckpoint) -> bool:
         return self._journal.has_checkpoint(checkpoint)
 
+    def keys_changed_since(self, checkpoint: JournalDBCheckpoint) -> Set[bytes]:
+        """
+        Returns the keys that a :meth:`discard` of the given checkpoint would revert
+        """
+        return self._journal.keys_changed_since(checkpoint)
+
     def discard(self, checkpoint: JournalDBCheckpoint) -> None:
         """
         Throws away all journaled data starting at the given checkpoint
@@ -450,17 +510,28 @@ class JournalDB(BaseDB):
         """
         journal_data = self._journal.pop_all()
 
-        for key, value in journal_data.items():
-            try:
-                if value is DELETE_WRAPPED:
-                    del self._wrapped_db[key]
-                elif value is REVERT_TO_WRAPPED:
-                    pass
-                else:
-                    self._wrapped_db[key] = cast(bytes, value)
-            except Exception:
-                self._reapply_checkpoint_to_journal(journal_data)
-                raise
+        try:
+            marked_keys = [
+                key
+                for key, value in journal_data.items()
+                if value is DELETE_WRAPPED or value is REVERT_TO_WRAPPED
+            ]
+            if marked_keys:
+                for key in marked_keys:
+                    if journal_data[key] is DELETE_WRAPPED:
+                        del self._wrapped_db[key]
+                writes: Iterable[Tuple[bytes, bytes]] = [
+                    (key, cast(bytes, value))
+                    for key, value in journal_data.items()
+                    if value is not DELETE_WRAPPED and value is not REVERT_TO_WRAPPED
+                ]
+            else:
+                # the common case: hand the whole journal over at once
+                writes = cast(Dict[bytes, bytes], journal_data).items()
+            write_many_to(self._wrapped_db, writes)
+        except Exception:
+            self._reapply_checkpoint_to_journal(journal_data)
+            raise
 
     def flatten(self) -> None:
         """
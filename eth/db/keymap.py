@@ -3,6 +3,10 @@ from abc import (
 )
 from typing import (
     Any,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
 )
 
 from eth.abc import (
@@ -10,6 +14,8 @@ from eth.abc import (
 )
 from eth.db.backends.base import (
     BaseDB,
+    get_many_from,
+    write_many_to,
 )
 
 
@@ -43,6 +49,13 @@ class KeyMapDB(BaseDB):
         mapped_key = self.keymap(key)
         return mapped_key in self._db
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        return get_many_from(self._db, tuple(map(self.keymap, keys)))
+
+    def write_many(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        keymap = self.keymap
+        write_many_to(self._db, ((keymap(key), value) for key, value in items))
+
     def __getattr__(self, attr: Any) -> Any:
         return getattr(self._db, attr)
 
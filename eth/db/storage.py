@@ -1,8 +1,11 @@
 from typing import (
+    Dict,
     FrozenSet,
     List,
     NamedTuple,
+    Optional,
     Set,
+    Tuple,
 )
 
 from eth_hash.auto import (
@@ -52,6 +55,9 @@ from eth.db.cache import (
 from eth.db.journal import (
     JournalDB,
 )
+from eth.db.warm_state import (
+    WarmStateView,
+)
 from eth.typing import (
     JournalDBCheckpoint,
 )
@@ -78,6 +84,10 @@ class StorageLookup(BaseDB):
     lookup. Similarly, it persists changes to the appropriate trie at write time.
 
     StorageLookup also tracks the state roots changed since the last persist.
+
+    If it is given a ``warm_state``, StorageLookup records its changes in it, and
+    reads the slots through its cache while the trie is still at
+    ``warm_storage_root``, the storage root of the account in the cached state.
     """
 
     logger = get_extended_debug_logger("eth.db.storage.StorageLookup")
@@ -93,13 +103,22 @@ class StorageLookup(BaseDB):
     # each delete.
     _historical_write_tries: List[PendingWrites]
 
-    def __init__(self, db: DatabaseAPI, storage_root: Hash32, address: Address) -> None:
+    def __init__(
+        self,
+        db: DatabaseAPI,
+        storage_root: Hash32,
+        address: Address,
+        warm_state: WarmStateView = None,
+        warm_storage_root: Hash32 = None,
+    ) -> None:
         self._db = db
 
         # Set the starting root hash, to be used for on-disk storage read lookups
         self._initialize_to_root_hash(storage_root)
 
         self._address = address
+        self._warm_state = warm_state
+        self._warm_storage_root = warm_storage_root
 
     def _get_write_trie(self) -> HexaryTrie:
         if self._trie_nodes_batch is None:
@@ -126,7 +145,26 @@ class StorageLookup(BaseDB):
         padded_slot = pad32(key)
         return keccak(padded_slot)
 
+    def _is_warm(self) -> bool:
+        return (
+            self._warm_storage_root is not None
+            and self._write_trie is None
+            and self._starting_root_hash == self._warm_storage_root
+            and self._warm_state.is_current
+        )
+
     def __getitem__(self, key: bytes) -> bytes:
+        if not self._is_warm():
+            return self._get_from_trie(key)
+
+        cache = self._warm_state.cache
+        value = cache.get_storage(self._address, key)
+        if value is None:
+            value = self._get_from_trie(key)
+            cache.set_storage(self._address, key, value)
+        return value
+
+    def _get_from_trie(self, key: bytes) -> bytes:
         hashed_slot = self._decode_key(key)
         read_trie = self._get_read_trie()
         try:
@@ -144,6 +182,8 @@ class StorageLookup(BaseDB):
         hashed_slot = self._decode_key(key)
         write_trie = self._get_write_trie()
         write_trie[hashed_slot] = value
+        if self._warm_state is not None:
+            self._warm_state.record_storage_change(self._address, key, value)
 
     def _exists(self, key: bytes) -> bool:
         # used by BaseDB for __contains__ checks
@@ -164,6 +204,8 @@ class StorageLookup(BaseDB):
                 exc.prefix,
                 self._address,
             ) from exc
+        if self._warm_state is not None:
+            self._warm_state.record_storage_change(self._address, key, b"")
 
     @property
     def has_changed_root(self) -> bool:
@@ -227,6 +269,8 @@ class StorageLookup(BaseDB):
         self._starting_root_hash = BLANK_ROOT_HASH
         self._write_trie = None
         self._trie_nodes_batch = None
+        if self._warm_state is not None:
+            self._warm_state.record_storage_wipe(self._address)
 
         return new_idx
 
@@ -264,7 +308,12 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
     logger = get_extended_debug_logger("eth.db.storage.AccountStorageDB")
 
     def __init__(
-        self, db: AtomicDatabaseAPI, storage_root: Hash32, address: Address
+        self,
+        db: AtomicDatabaseAPI,
+        storage_root: Hash32,
+        address: Address,
+        warm_state: WarmStateView = None,
+        warm_storage_root: Hash32 = None,
     ) -> None:
         """
         Database entries go through several pipes, like so...
@@ -298,12 +347,32 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
 
         In both _storage_cache and _journal_storage, Keys are set/retrieved as the
         big_endian encoding of the slot integer, and the rlp-encoded value.
+
+        _pending_slots and _clean_slots sit in front of _journal_storage.
+        _pending_slots holds the decoded values written since the last time the
+        changes were locked, which are only encoded into _journal_storage by
+        :meth:`lock_changes`. They are journaled by _slot_changes instead, in
+        lockstep with _journal_storage. _clean_slots caches the decoded values read
+        from _journal_storage, which only change on a lock, a delete, or a revert
+        across a delete.
+
+        warm_state and warm_storage_root are passed on to _storage_lookup, see
+        :class:`StorageLookup`.
         """
         self._address = address
-        self._storage_lookup = StorageLookup(db, storage_root, address)
+        self._storage_lookup = StorageLookup(
+            db, storage_root, address, warm_state, warm_storage_root
+        )
         self._storage_cache = CacheDB(self._storage_lookup)
         self._locked_changes = JournalDB(self._storage_cache)
         self._journal_storage = JournalDB(self._locked_changes)
+        self._pending_slots: Dict[int, int] = {}
+        self._clean_slots: Dict[int, int] = {}
+        # For each checkpoint, the pending value of each slot written after it, from
+        # just before the first write, or None if the slot was not pending
+        self._slot_changes: List[
+            Tuple[JournalDBCheckpoint, Dict[int, Optional[int]]]
+        ] = []
         self._accessed_slots: Set[int] = set()
 
         # Track how many times we have cleared the storage. This is journaled
@@ -314,10 +383,21 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
 
     def get(self, slot: int, from_journal: bool = True) -> int:
         self._accessed_slots.add(slot)
-        key = int_to_big_endian(slot)
-        lookup_db = self._journal_storage if from_journal else self._locked_changes
+        if not from_journal:
+            return self._read_slot(self._locked_changes, slot)
+
+        value = self._pending_slots.get(slot)
+        if value is None:
+            value = self._clean_slots.get(slot)
+            if value is None:
+                value = self._read_slot(self._journal_storage, slot)
+                self._clean_slots[slot] = value
+        return value
+
+    @staticmethod
+    def _read_slot(lookup_db: DatabaseAPI, slot: int) -> int:
         try:
-            encoded_value = lookup_db[key]
+            encoded_value = lookup_db[int_to_big_endian(slot)]
         except MissingStorageTrieNode:
             raise
         except KeyError:
@@ -329,25 +409,44 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
             return rlp.decode(encoded_value, sedes=rlp.sedes.big_endian_int)
 
     def set(self, slot: int, value: int) -> None:
-        key = int_to_big_endian(slot)
-        if value:
-            self._journal_storage[key] = rlp.encode(value)
-        else:
-            try:
-                current_val = self._journal_storage[key]
-            except KeyError:
-                # deleting an empty key has no effect
-                return
+        if self._slot_changes:
+            _, changes = self._slot_changes[-1]
+            if slot not in changes:
+                changes[slot] = self._pending_slots.get(slot)
+        self._pending_slots[slot] = value
+
+    def _flush_pending_slots(self) -> None:
+        for slot, value in self._pending_slots.items():
+            key = int_to_big_endian(slot)
+            if value:
+                self._journal_storage[key] = rlp.encode(value)
             else:
-                if current_val != b"":
-                    # only try to delete the value if it's present
-                    del self._journal_storage[key]
+                try:
+                    current_val = self._journal_storage[key]
+                except KeyError:
+                    # deleting an empty key has no effect
+                    continue
+                else:
+                    if current_val != b"":
+                        # only try to delete the value if it's present
+                        del self._journal_storage[key]
+
+        self._clean_slots.update(self._pending_slots)
+        self._pending_slots.clear()
 
     def delete(self) -> None:
         self.logger.debug2(
             "Deleting all storage in account 0x%s",
             self._address.hex(),
         )
+        # The pending writes are wiped along with the rest of the storage, and come
+        #   back if the delete is reverted
+        if self._slot_changes:
+            _, changes = self._slot_changes[-1]
+            for slot, value in self._pending_slots.items():
+                changes.setdefault(slot, value)
+        self._pending_slots.clear()
+        self._clean_slots.clear()
         self._journal_storage.clear()
         self._storage_cache.reset_cache()
 
@@ -372,6 +471,13 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
     def record(self, checkpoint: JournalDBCheckpoint) -> None:
         self._journal_storage.record(checkpoint)
         self._clear_count.record(checkpoint)
+        self._slot_changes.append((checkpoint, {}))
+
+    def _find_slot_changes(self, checkpoint: JournalDBCheckpoint) -> Optional[int]:
+        for index in range(len(self._slot_changes) - 1, -1, -1):
+            if self._slot_changes[index][0] == checkpoint:
+                return index
+        return None
 
     def discard(self, checkpoint: JournalDBCheckpoint) -> None:
         self.logger.debug2("discard checkpoint %r", checkpoint)
@@ -386,8 +492,12 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
             self._journal_storage.reset()
             self._clear_count.reset()
         self._storage_cache.reset_cache()
+        self._discard_pending_slots(checkpoint)
 
         reverted_clear_count = to_int(self._clear_count[CLEAR_COUNT_KEY_NAME])
+        if reverted_clear_count != latest_clear_count:
+            # The reverted delete had hidden the storage that is visible again
+            self._clean_slots.clear()
 
         if reverted_clear_count == latest_clear_count - 1:
             # This revert rewinds past a trie deletion, so roll back to the trie at
@@ -407,6 +517,25 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
                 f" 0x{self._address.hex()}"
             )
 
+    def _discard_pending_slots(self, checkpoint: JournalDBCheckpoint) -> None:
+        index = self._find_slot_changes(checkpoint)
+        if index is None:
+            # the checkpoint comes before this account started tracking, and
+            #   _journal_storage only ever changed on a delete since, which wiped
+            #   the slots that were read before it
+            self._pending_slots.clear()
+            self._clean_slots.clear()
+            self._slot_changes.clear()
+            return
+
+        for _, changes in reversed(self._slot_changes[index:]):
+            for slot, value in changes.items():
+                if value is None:
+                    self._pending_slots.pop(slot, None)
+                else:
+                    self._pending_slots[slot] = value
+        del self._slot_changes[index:]
+
     def commit(self, checkpoint: JournalDBCheckpoint) -> None:
         if self._journal_storage.has_checkpoint(checkpoint):
             self._journal_storage.commit(checkpoint)
@@ -417,7 +546,21 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
             self._journal_storage.flatten()
             self._clear_count.flatten()
 
+        index = self._find_slot_changes(checkpoint)
+        if index is None or index == 0:
+            # there is no earlier checkpoint left to revert the changes to
+            self._slot_changes.clear()
+        else:
+            _, previous_changes = self._slot_changes[index - 1]
+            for _, changes in self._slot_changes[index:]:
+                for slot, value in changes.items():
+                    previous_changes.setdefault(slot, value)
+            del self._slot_changes[index:]
+
     def lock_changes(self) -> None:
+        # This is the only place where the written values get encoded
+        self._flush_pending_slots()
+        self._slot_changes.clear()
         if self._journal_storage.has_clear():
             self._locked_changes.clear()
         self._journal_storage.persist()
@@ -430,6 +573,11 @@ class AccountStorageDB(AccountStorageDatabaseAPI):
         """
         Will raise an exception if there are some changes made since the last persist.
         """
+        if self._pending_slots:
+            raise ValidationError(
+                "StorageDB had pending writes when it needed to be clean: "
+                f"{self._pending_slots!r}"
+            )
         journal_diff = self._journal_storage.diff()
         if len(journal_diff) > 0:
             raise ValidationError(
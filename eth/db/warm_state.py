@@ -0,0 +1,275 @@
+from collections import (
+    OrderedDict,
+)
+from typing import (
+    Collection,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from eth_typing import (
+    Address,
+    Hash32,
+)
+
+from eth._utils.caching import (
+    CacheStats,
+)
+from eth.abc import (
+    DatabaseAPI,
+    WarmStateCacheAPI,
+)
+from eth.db.backends.base import (
+    BaseDB,
+)
+from eth.db.hash_trie import (
+    HashTrie,
+)
+
+# A rough count of the bytes that the python objects around each entry take, on top
+# of the bytes of its key and value
+ENTRY_OVERHEAD = 200
+
+# The first part of the key of each entry, for each kind of entry
+_ACCOUNT = b"account"
+_STORAGE = b"storage"
+_CODE = b"code"
+
+_EntryKey = Tuple[bytes, ...]
+
+
+class WarmStateCache(WarmStateCacheAPI):
+    """
+    A cache of the encoded accounts, encoded storage slots and bytecode of the state
+    at :attr:`state_root`, which holds at most ``max_size`` bytes, evicting the least
+    recently used entries first.
+
+    Bytecode is keyed by its hash, so it stays valid at every state root, but the
+    accounts and storage slots are only valid at :attr:`state_root`. The cache moves
+    to the next state root with :meth:`apply_changes`, so that the entries that did
+    not change carry over from one block to the next.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self.stats = CacheStats()
+        self._state_root: Optional[Hash32] = None
+        self._entries: "OrderedDict[_EntryKey, Tuple[bytes, int]]" = OrderedDict()
+        # The keys of the cached storage slots of each address, to wipe them
+        self._storage_keys: Dict[Address, Set[_EntryKey]] = {}
+
+    @property
+    def state_root(self) -> Optional[Hash32]:
+        return self._state_root
+
+    def get_account(self, address: Address) -> Optional[bytes]:
+        return self._get((_ACCOUNT, address))
+
+    def set_account(self, address: Address, encoded_account: bytes) -> None:
+        self._set((_ACCOUNT, address), encoded_account)
+
+    def get_storage(self, address: Address, slot_key: bytes) -> Optional[bytes]:
+        return self._get((_STORAGE, address, slot_key))
+
+    def set_storage(self, address: Address, slot_key: bytes, value: bytes) -> None:
+        entry_key = (_STORAGE, address, slot_key)
+        self._set(entry_key, value)
+        if entry_key in self._entries:
+            self._storage_keys.setdefault(address, set()).add(entry_key)
+
+    def get_code(self, code_hash: Hash32) -> Optional[bytes]:
+        return self._get((_CODE, code_hash))
+
+    def set_code(self, code_hash: Hash32, code: bytes) -> None:
+        self._set((_CODE, code_hash), code)
+
+    def apply_changes(
+        self,
+        from_root: Hash32,
+        to_root: Hash32,
+        accounts: Dict[Address, bytes],
+        storage: Dict[Address, Dict[bytes, bytes]],
+        wiped_addresses: Collection[Address],
+    ) -> None:
+        if self._state_root != from_root:
+            # The changes are not relative to the cached state, so only the changes
+            #   themselves are known at the new root
+            self._clear_state()
+
+        for address in wiped_addresses:
+            self._wipe_storage(address)
+        for address, encoded_account in accounts.items():
+            self.set_account(address, encoded_account)
+        for address, slots in storage.items():
+            for slot_key, value in slots.items():
+                self.set_storage(address, slot_key, value)
+
+        self._state_root = to_root
+
+    def discard_state_roots(self, state_roots: Collection[Hash32]) -> None:
+        if self._state_root in state_roots:
+            self._clear_state()
+            self._state_root = None
+
+    def _get(self, entry_key: _EntryKey) -> Optional[bytes]:
+        try:
+            value, _ = self._entries[entry_key]
+        except KeyError:
+            self.stats.misses += 1
+            return None
+        else:
+            self.stats.hits += 1
+            self._entries.move_to_end(entry_key)
+            return value
+
+    def _set(self, entry_key: _EntryKey, value: bytes) -> None:
+        self._pop(entry_key)
+        entry_size = sum(len(part) for part in entry_key[1:]) + len(value)
+        entry_size += ENTRY_OVERHEAD
+        if entry_size > self.max_size:
+            return
+
+        self._entries[entry_key] = (value, entry_size)
+        self.size += entry_size
+        while self.size > self.max_size:
+            oldest_key, (_, oldest_size) = self._entries.popitem(last=False)
+            self.size -= oldest_size
+            if oldest_key[0] == _STORAGE:
+                self._discard_storage_key(oldest_key)
+
+    def _pop(self, entry_key: _EntryKey) -> None:
+        try:
+            _, entry_size = self._entries.pop(entry_key)
+        except KeyError:
+            pass
+        else:
+            self.size -= entry_size
+            if entry_key[0] == _STORAGE:
+                self._discard_storage_key(entry_key)
+
+    def _discard_storage_key(self, entry_key: _EntryKey) -> None:
+        address = Address(entry_key[1])
+        address_keys = self._storage_keys[address]
+        address_keys.discard(entry_key)
+        if not address_keys:
+            del self._storage_keys[address]
+
+    def _wipe_storage(self, address: Address) -> None:
+        for entry_key in tuple(self._storage_keys.get(address, ())):
+            self._pop(entry_key)
+
+    def _clear_state(self) -> None:
+        # Only the bytecode is valid at any state root
+        for entry_key in tuple(self._entries):
+            if entry_key[0] != _CODE:
+                self._pop(entry_key)
+
+    def __repr__(self) -> str:
+        return (
+            f"WarmStateCache(size={self.size}, max_size={self.max_size}, "
+            f"stats={self.stats!r})"
+        )
+
+
+class WarmStateView:
+    """
+    The use of a :class:`~eth.abc.WarmStateCacheAPI` by a single account database,
+    starting at ``state_root``.
+
+    The cache may only be read while it is still at the same state root as the
+    account database, see :attr:`is_current`. The changes to the accounts and
+    storage are recorded until :meth:`commit` moves the cache to the new state root.
+    """
+
+    def __init__(self, cache: WarmStateCacheAPI, state_root: Optional[Hash32]) -> None:
+        self.cache = cache
+        self.state_root = state_root
+        self._accounts: Dict[Address, bytes] = {}
+        self._storage: Dict[Address, Dict[bytes, bytes]] = {}
+        self._wiped_addresses: Set[Address] = set()
+
+    @property
+    def is_current(self) -> bool:
+        return self.state_root is not None and self.cache.state_root == self.state_root
+
+    def record_account_change(self, address: Address, encoded_account: bytes) -> None:
+        if self.state_root is not None:
+            self._accounts[address] = encoded_account
+
+    def record_storage_change(
+        self, address: Address, slot_key: bytes, value: bytes
+    ) -> None:
+        if self.state_root is not None:
+            self._storage.setdefault(address, {})[slot_key] = value
+
+    def record_storage_wipe(self, address: Address) -> None:
+        if self.state_root is not None:
+            self._wiped_addresses.add(address)
+            self._storage.pop(address, None)
+
+    def detach(self) -> None:
+        """
+        Stop using the cache, because the state root moved in a way that the
+        recorded changes cannot follow.
+        """
+        self.state_root = None
+        self._clear_changes()
+
+    def commit(self, new_state_root: Hash32) -> None:
+        """
+        Move the cache to ``new_state_root`` with the changes recorded since the
+        last commit, and keep on using it from there.
+        """
+        if self.state_root is not None:
+            self.cache.apply_changes(
+                self.state_root,
+                new_state_root,
+                self._accounts,
+                self._storage,
+                self._wiped_addresses,
+            )
+            self.state_root = new_state_root
+            self._clear_changes()
+
+    def _clear_changes(self) -> None:
+        self._accounts = {}
+        self._storage = {}
+        self._wiped_addresses = set()
+
+
+class WarmAccountLookup(BaseDB):
+    """
+    Look up the encoded accounts of ``db`` in the cache of ``warm_state``, while
+    ``trie`` is at the state root of the cache.
+    """
+
+    def __init__(
+        self, db: DatabaseAPI, warm_state: WarmStateView, trie: HashTrie
+    ) -> None:
+        self._db = db
+        self._warm_state = warm_state
+        self._trie = trie
+
+    def __getitem__(self, key: bytes) -> bytes:
+        warm_state = self._warm_state
+        if not warm_state.is_current or self._trie.root_hash != warm_state.state_root:
+            return self._db[key]
+
+        address = Address(key)
+        encoded_account = warm_state.cache.get_account(address)
+        if encoded_account is None:
+            encoded_account = self._db[key]
+            warm_state.cache.set_account(address, encoded_account)
+        return encoded_account
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self._db[key] = value
+
+    def _exists(self, key: bytes) -> bool:
+        return key in self._db
+
+    def __delitem__(self, key: bytes) -> None:
+        del self._db[key]
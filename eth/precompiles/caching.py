@@ -0,0 +1,110 @@
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Tuple,
+)
+
+from eth_typing import (
+    Address,
+)
+from lru import (
+    LRU,
+)
+
+from eth._utils.caching import (
+    CacheStats,
+)
+from eth.abc import (
+    ComputationAPI,
+)
+
+PrecompileFn = Callable[[ComputationAPI], ComputationAPI]
+
+PRECOMPILE_RESULT_CACHE_SIZE = 4096
+MAX_CACHED_INPUT_SIZE = 1024
+
+
+class PrecompileResultCache:
+    """
+    Bounded cache of the output and gas of precompiles whose results, gas included,
+    only depend on their input, like SHA256 and RIPEMD160, so that contracts which
+    hash the same data over and over only have it hashed once.
+
+    The cache is keyed by the address of the precompile and its input, of which
+    the dictionary lookup only hashes the bytes, which is much cheaper than running
+    the precompiles. Inputs longer than ``max_input_size`` bypass the cache, which
+    bounds its memory to about ``size * max_input_size`` bytes.
+
+    A cached result is charged exactly the gas that the precompile charged for it.
+    Calls that fail, like those running out of gas, are not cached.
+    """
+
+    def __init__(
+        self,
+        size: int = PRECOMPILE_RESULT_CACHE_SIZE,
+        max_input_size: int = MAX_CACHED_INPUT_SIZE,
+    ) -> None:
+        self.max_input_size = max_input_size
+        self.stats = CacheStats()
+        self._results: "LRU[Tuple[Address, bytes], Tuple[bytes, int]]" = LRU(size)
+        self._precompiles_by_class: Dict[type, Dict[Address, PrecompileFn]] = {}
+
+    def wrap(self, address: Address, precompile: PrecompileFn) -> PrecompileFn:
+        """
+        Return the precompile at ``address``, with its results cached.
+        """
+
+        def cached_precompile(computation: ComputationAPI) -> ComputationAPI:
+            data = computation.msg.data
+            if len(data) > self.max_input_size:
+                return precompile(computation)
+
+            key = (address, bytes(data))
+            try:
+                output, gas = self._results[key]
+            except KeyError:
+                self.stats.misses += 1
+                gas_before = computation.get_gas_remaining()
+                precompile(computation)
+                if computation.is_success:
+                    gas = gas_before - computation.get_gas_remaining()
+                    self._results[key] = (computation.output, gas)
+            else:
+                self.stats.hits += 1
+                computation.consume_gas(gas, reason="Cached Precompile")
+                computation.output = output
+            return computation
+
+        return cached_precompile
+
+    def get_precompiles(
+        self,
+        computation_class: type,
+        precompiles: Dict[Address, PrecompileFn],
+        cacheable_addresses: Collection[Address],
+    ) -> Dict[Address, PrecompileFn]:
+        """
+        Return ``precompiles`` with those at ``cacheable_addresses`` wrapped with the
+        cache, wrapping them once per ``computation_class``.
+        """
+        try:
+            return self._precompiles_by_class[computation_class]
+        except KeyError:
+            cached_precompiles = {
+                address: (
+                    self.wrap(address, precompile)
+                    if address in cacheable_addresses
+                    else precompile
+                )
+                for address, precompile in precompiles.items()
+            }
+            self._precompiles_by_class[computation_class] = cached_precompiles
+            return cached_precompiles
+
+    def clear(self) -> None:
+        self._results.clear()
+        self.stats.reset()
+
+    def __repr__(self) -> str:
+        return f"PrecompileResultCache(size={len(self._results)}, {self.stats})"
@@ -1,7 +1,3 @@
-from typing import (
-    Tuple,
-)
-
 from eth_utils import (
     ValidationError,
     big_endian_to_int,
@@ -10,15 +6,13 @@ from eth_utils import (
 from eth_utils.toolz import (
     curry,
 )
-from py_ecc import (
-    optimized_bn128 as bn128,
-)
 
 from eth import (
     constants,
 )
 from eth._utils.bn128 import (
-    validate_point,
+    G1Point,
+    get_bn128_backend,
 )
 from eth._utils.padding import (
     pad32,
@@ -46,15 +40,15 @@ def ecadd(
     result_x, result_y = result
     result_bytes = b"".join(
         (
-            pad32(int_to_big_endian(result_x.n)),
-            pad32(int_to_big_endian(result_y.n)),
+            pad32(int_to_big_endian(result_x)),
+            pad32(int_to_big_endian(result_y)),
         )
     )
     computation.output = result_bytes
     return computation
 
 
-def _ecadd(data: bytes) -> Tuple[bn128.FQ, bn128.FQ]:
+def _ecadd(data: bytes) -> G1Point:
     x1_bytes = pad32r(data[:32])
     y1_bytes = pad32r(data[32:64])
     x2_bytes = pad32r(data[64:96])
@@ -65,8 +59,4 @@ def _ecadd(data: bytes) -> Tuple[bn128.FQ, bn128.FQ]:
     x2 = big_endian_to_int(x2_bytes)
     y2 = big_endian_to_int(y2_bytes)
 
-    p1 = validate_point(x1, y1)
-    p2 = validate_point(x2, y2)
-
-    result = bn128.normalize(bn128.add(p1, p2))
-    return result
+    return get_bn128_backend().add((x1, y1), (x2, y2))
@@ -1,7 +1,3 @@
-from typing import (
-    Tuple,
-)
-
 from eth_utils import (
     ValidationError,
     big_endian_to_int,
@@ -10,15 +6,13 @@ from eth_utils import (
 from eth_utils.toolz import (
     curry,
 )
-from py_ecc import (
-    optimized_bn128 as bn128,
-)
 
 from eth import (
     constants,
 )
 from eth._utils.bn128 import (
-    validate_point,
+    G1Point,
+    get_bn128_backend,
 )
 from eth._utils.padding import (
     pad32,
@@ -46,15 +40,15 @@ def ecmul(
     result_x, result_y = result
     result_bytes = b"".join(
         (
-            pad32(int_to_big_endian(result_x.n)),
-            pad32(int_to_big_endian(result_y.n)),
+            pad32(int_to_big_endian(result_x)),
+            pad32(int_to_big_endian(result_y)),
         )
     )
     computation.output = result_bytes
     return computation
 
 
-def _ecmull(data: bytes) -> Tuple[bn128.FQ, bn128.FQ]:
+def _ecmull(data: bytes) -> G1Point:
     x_bytes = pad32r(data[:32])
     y_bytes = pad32r(data[32:64])
     m_bytes = pad32r(data[64:96])
@@ -63,7 +57,4 @@ def _ecmull(data: bytes) -> Tuple[bn128.FQ, bn128.FQ]:
     y = big_endian_to_int(y_bytes)
     m = big_endian_to_int(m_bytes)
 
-    p = validate_point(x, y)
-
-    result = bn128.normalize(bn128.multiply(p, m))
-    return result
+    return get_bn128_backend().multiply((x, y), m)
@@ -8,18 +8,13 @@ from eth_utils import (
 )
 from eth_utils.toolz import (
     curry,
-    pipe,
-)
-from py_ecc import (
-    optimized_bn128 as bn128,
 )
 
 from eth import (
     constants,
 )
 from eth._utils.bn128 import (
-    FQP_point_to_FQ2_point,
-    validate_point,
+    get_bn128_backend,
 )
 from eth._utils.padding import (
     pad32,
@@ -34,9 +29,6 @@ from eth.typing import (
     BytesOrView,
 )
 
-ZERO = bn128.Z2
-EXPONENT = bn128.FQ12.one()
-
 
 @curry
 def ecpairing(
@@ -68,42 +60,14 @@ def ecpairing(
 
 
 def _ecpairing(data: BytesOrView) -> bool:
-    exponent = bn128.FQ12.one()
-
-    processing_pipeline = (
-        _process_point(data[start_idx : start_idx + 192])
-        for start_idx in range(0, len(data), 192)
-    )
-    exponent = pipe(bn128.FQ12.one(), *processing_pipeline)
-
-    result = bn128.final_exponentiate(exponent) == bn128.FQ12.one()
-    return result
-
-
-@curry
-def _process_point(data_buffer: bytes, exponent: int) -> bn128.FQP:
-    x1, y1, x2_i, x2_r, y2_i, y2_r = _extract_point(data_buffer)
-    p1 = validate_point(x1, y1)
-
-    for v in (x2_i, x2_r, y2_i, y2_r):
-        if v >= bn128.field_modulus:
-            raise ValidationError("value greater than field modulus")
-
-    fq2_x = bn128.FQ2([x2_r, x2_i])
-    fq2_y = bn128.FQ2([y2_r, y2_i])
-
-    p2 = ZERO
-    if (fq2_x, fq2_y) != (bn128.FQ2.zero(), bn128.FQ2.zero()):
-        p2 = (fq2_x, fq2_y, bn128.FQ2.one())
-        if not bn128.is_on_curve(p2, bn128.b2):
-            raise ValidationError("point is not on curve")
-
-    if bn128.multiply(p2, bn128.curve_order)[-1] != bn128.FQ2.zero():
-        raise ValidationError("TODO: what case is this?????")
-
-    return exponent * bn128.pairing(
-        FQP_point_to_FQ2_point(p2), p1, final_exponentiate=False
-    )
+    pairs = []
+    for start_idx in range(0, len(data), 192):
+        x1, y1, x2_i, x2_r, y2_i, y2_r = _extract_point(
+            data[start_idx : start_idx + 192]
+        )
+        pairs.append(((x1, y1), (x2_i, x2_r, y2_i, y2_r)))
+
+    return get_bn128_backend().pairing_check(pairs)
 
 
 def _extract_point(data_slice: bytes) -> Tuple[int, int, int, int, int, int]:
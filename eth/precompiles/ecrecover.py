@@ -1,6 +1,3 @@
-from eth_keys import (
-    keys,
-)
 from eth_keys.exceptions import (
     BadSignature,
 )
@@ -12,6 +9,9 @@ from eth_utils import (
 from eth import (
     constants,
 )
+from eth._utils.ecrecover import (
+    recovery_cache,
+)
 from eth._utils.padding import (
     pad32,
     pad32r,
@@ -52,8 +52,7 @@ def ecrecover(computation: ComputationAPI) -> ComputationAPI:
     canonical_v = v - 27
 
     try:
-        signature = keys.Signature(vrs=(canonical_v, r, s))
-        public_key = signature.recover_public_key_from_msg_hash(message_hash)
+        public_key = recovery_cache.recover_public_key(message_hash, canonical_v, r, s)
     except BadSignature:
         return computation
 
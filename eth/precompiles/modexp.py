@@ -5,7 +5,6 @@ from typing import (
 
 from eth_utils import (
     big_endian_to_int,
-    int_to_big_endian,
 )
 from eth_utils.toolz import (
     curry,
@@ -17,14 +16,12 @@ from eth import (
 from eth._utils.numeric import (
     get_highest_bit_index,
 )
-from eth._utils.padding import (
-    pad32r,
-    zpad_left,
-    zpad_right,
-)
 from eth.abc import (
     ComputationAPI,
 )
+from eth.typing import (
+    BytesOrView,
+)
 
 
 def _compute_adjusted_exponent_length(
@@ -50,27 +47,49 @@ def _compute_complexity(length: int) -> int:
         return length**2 // 16 + 480 * length - 199680
 
 
-def extract_lengths(data: bytes) -> Tuple[int, int, int]:
-    # extract argument lengths
-    base_length_bytes = pad32r(data[:32])
-    base_length = big_endian_to_int(base_length_bytes)
+def _read_padded_int(data: BytesOrView, start: int, length: int) -> int:
+    """
+    Read the big-endian int of ``length`` bytes at ``start`` in ``data``, which is
+    padded with zero bytes on the right, without copying or padding ``data``.
+    """
+    value_bytes = data[start : start + length]
+    value = int.from_bytes(value_bytes, "big")
+
+    missing_length = length - len(value_bytes)
+    if missing_length:
+        return value << (8 * missing_length)
+    else:
+        return value
 
-    exponent_length_bytes = pad32r(data[32:64])
-    exponent_length = big_endian_to_int(exponent_length_bytes)
 
-    modulus_length_bytes = pad32r(data[64:96])
-    modulus_length = big_endian_to_int(modulus_length_bytes)
+def extract_lengths(data: BytesOrView) -> Tuple[int, int, int]:
+    # extract argument lengths
+    base_length = _read_padded_int(data, 0, 32)
+    exponent_length = _read_padded_int(data, 32, 32)
+    modulus_length = _read_padded_int(data, 64, 32)
 
     return base_length, exponent_length, modulus_length
 
 
-def _compute_modexp_gas_fee_eip_198(data: bytes) -> int:
+def extract_first_32_exponent_bytes(
+    data: BytesOrView, base_length: int, exponent_length: int
+) -> bytes:
+    """
+    Return the first 32 bytes of the exponent, or all of it if it is shorter, which
+    is all the gas calculation needs, so that the gas is known without reading the
+    arguments, whatever their declared lengths.
+    """
+    head_length = min(exponent_length, 32)
+    exponent_head = _read_padded_int(data, 96 + base_length, head_length)
+    return exponent_head.to_bytes(head_length, "big")
+
+
+def _compute_modexp_gas_fee_eip_198(data: BytesOrView) -> int:
     base_length, exponent_length, modulus_length = extract_lengths(data)
 
-    first_32_exponent_bytes = zpad_right(
-        data[96 + base_length : 96 + base_length + exponent_length],
-        to_size=min(exponent_length, 32),
-    )[:32]
+    first_32_exponent_bytes = extract_first_32_exponent_bytes(
+        data, base_length, exponent_length
+    )
     adjusted_exponent_length = _compute_adjusted_exponent_length(
         exponent_length,
         first_32_exponent_bytes,
@@ -85,7 +104,42 @@ def _compute_modexp_gas_fee_eip_198(data: bytes) -> int:
     return gas_fee
 
 
-def _modexp(data: bytes) -> int:
+def _pow_modulo_power_of_two(base: int, exponent: int, modulus: int) -> int:
+    # the modulus is 2**k, with k >= 1
+    k = modulus.bit_length() - 1
+    mask = modulus - 1
+    base &= mask
+
+    if exponent == 0:
+        return 1 & mask
+    elif base == 0:
+        return 0
+    elif base & 1 == 0:
+        # base = 2**t * odd, so any exponent of at least k / t shifts every bit out
+        t = (base & -base).bit_length() - 1
+        if exponent >= -(-k // t):
+            return 0
+    elif k == 1:
+        # an odd base to a positive power is odd
+        return 1
+    elif k == 2:
+        # the odd numbers modulo 4 square to 1
+        return pow(base, exponent & 1, 4)
+    else:
+        # the odd numbers modulo 2**k form a group in which x ** (2**(k - 2)) == 1
+        exponent &= (1 << (k - 2)) - 1
+
+    # Square and multiply, reducing with a mask, which is faster than the divisions
+    # of pow()
+    result = 1
+    for bit in bin(exponent)[2:]:
+        result = result * result & mask
+        if bit == "1":
+            result = result * base & mask
+    return result
+
+
+def _modexp(data: BytesOrView) -> int:
     base_length, exponent_length, modulus_length = extract_lengths(data)
 
     if base_length == 0:
@@ -96,40 +150,33 @@ def _modexp(data: bytes) -> int:
     # compute start:end indexes
     base_end_idx = 96 + base_length
     exponent_end_idx = base_end_idx + exponent_length
-    modulus_end_dx = exponent_end_idx + modulus_length
 
     # extract arguments
-    modulus_bytes = zpad_right(
-        data[exponent_end_idx:modulus_end_dx],
-        to_size=modulus_length,
-    )
-    modulus = big_endian_to_int(modulus_bytes)
-    if modulus == 0:
+    modulus = _read_padded_int(data, exponent_end_idx, modulus_length)
+    if modulus <= 1:
+        # including modulo 0, which is undefined and returns zero
         return 0
 
-    base_bytes = zpad_right(data[96:base_end_idx], to_size=base_length)
-    base = big_endian_to_int(base_bytes)
+    base = _read_padded_int(data, 96, base_length)
+    exponent = _read_padded_int(data, base_end_idx, exponent_length)
 
-    exponent_bytes = zpad_right(
-        data[base_end_idx:exponent_end_idx],
-        to_size=exponent_length,
-    )
-    exponent = big_endian_to_int(exponent_bytes)
-
-    result = pow(base, exponent, modulus)
-
-    return result
+    if modulus & (modulus - 1) == 0:
+        return _pow_modulo_power_of_two(base, exponent, modulus)
+    else:
+        return pow(base, exponent, modulus)
 
 
 @curry
 def modexp(
     computation: ComputationAPI,
-    gas_calculator: Callable[[bytes], int] = _compute_modexp_gas_fee_eip_198,
+    gas_calculator: Callable[[BytesOrView], int] = _compute_modexp_gas_fee_eip_198,
 ) -> ComputationAPI:
     """
     https://github.com/ethereum/EIPs/pull/198
     """
-    data = computation.msg.data_as_bytes
+    # The arguments are read from a view of the call data, after the gas, which only
+    # depends on their lengths and the start of the exponent, is paid for
+    data = memoryview(computation.msg.data)
 
     gas_fee = gas_calculator(data)
     computation.consume_gas(gas_fee, reason="MODEXP Precompile")
@@ -140,11 +187,5 @@ def modexp(
 
     # Modulo 0 is undefined, return zero
     # https://math.stackexchange.com/questions/516251/why-is-n-mod-0-undefined
-    result_bytes = (
-        b""
-        if modulus_length == 0
-        else zpad_left(int_to_big_endian(result), to_size=modulus_length)
-    )
-
-    computation.output = result_bytes
+    computation.output = result.to_bytes(modulus_length, "big")
     return computation
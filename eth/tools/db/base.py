@@ -76,3 +76,26 @@ class DatabaseAPITestSuite:
         assert b"key-1" not in db
         with pytest.raises(KeyError):
             del db[b"key-1"]
+
+    def test_database_api_multi_get(self, db: DatabaseAPI) -> None:
+        db[b"key-1"] = b"value-1"
+        db[b"key-2"] = b"value-2"
+        db[b"key-3"] = b"value-3"
+        db.delete(b"key-3")
+
+        assert db.multi_get([b"key-2", b"key-1", b"key-3", b"key-4"]) == (
+            b"value-2",
+            b"value-1",
+            None,
+            None,
+        )
+        assert db.multi_get([]) == ()
+
+    def test_database_api_write_many(self, db: DatabaseAPI) -> None:
+        db[b"key-1"] = b"value-1"
+
+        db.write_many([(b"key-1", b"value-2"), (b"key-2", b"value-3")])
+
+        assert db[b"key-1"] == b"value-2"
+        assert db[b"key-2"] == b"value-3"
+        assert db.multi_get([b"key-1", b"key-2"]) == (b"value-2", b"value-3")
@@ -1,3 +1,6 @@
+from concurrent.futures import (
+    Executor,
+)
 import contextlib
 import itertools
 import logging
@@ -106,6 +109,9 @@ class VM(Configurable, VirtualMachineAPI):
     fork: str = None
     chaindb: ChainDatabaseAPI = None
     _state_class: Type[StateAPI] = None
+    # Set to an executor, like a process pool, to run the checks of the transactions of
+    # a block that do not depend on the state on it in parallel, ahead of applying them
+    transaction_prevalidation_executor: Executor = None
 
     _state = None
     _block = None
@@ -160,7 +166,12 @@ class VM(Configurable, VirtualMachineAPI):
         execution_context = cls.create_execution_context(
             header, previous_hashes, chain_context
         )
-        return cls.get_state_class()(db, execution_context, header.state_root)
+        return cls.get_state_class()(
+            db,
+            execution_context,
+            header.state_root,
+            chain_context.warm_state_cache,
+        )
 
     @cached_property
     def _consensus(self) -> ConsensusAPI:
@@ -278,30 +289,38 @@ class VM(Configurable, VirtualMachineAPI):
         previous_header = base_header
         result_header = base_header
 
-        for transaction_index, transaction in enumerate(transactions):
-            snapshot = self.state.snapshot()
-            try:
-                receipt, computation = self.apply_transaction(
-                    previous_header,
-                    transaction,
+        # Check the signatures and everything else that does not depend on the
+        # state up front, in parallel where possible
+        self.state.prevalidate_transactions(
+            transactions, self.transaction_prevalidation_executor
+        )
+        try:
+            for transaction_index, transaction in enumerate(transactions):
+                snapshot = self.state.snapshot()
+                try:
+                    receipt, computation = self.apply_transaction(
+                        previous_header,
+                        transaction,
+                    )
+                except EVMMissingData:
+                    self.state.revert(snapshot)
+                    raise
+
+                result_header = self.add_receipt_to_header(previous_header, receipt)
+                previous_header = result_header
+                receipts.append(receipt)
+                computations.append(computation)
+
+                self.transaction_applied_hook(
+                    transaction_index,
+                    transactions,
+                    vm_header,
+                    result_header,
+                    computation,
+                    receipt,
                 )
-            except EVMMissingData:
-                self.state.revert(snapshot)
-                raise
-
-            result_header = self.add_receipt_to_header(previous_header, receipt)
-            previous_header = result_header
-            receipts.append(receipt)
-            computations.append(computation)
-
-            self.transaction_applied_hook(
-                transaction_index,
-                transactions,
-                vm_header,
-                result_header,
-                computation,
-                receipt,
-            )
+        finally:
+            self.state.clear_transaction_prevalidations()
 
         receipts_tuple = tuple(receipts)
         computations_tuple = tuple(computations)
@@ -377,7 +396,10 @@ class VM(Configurable, VirtualMachineAPI):
 
         # we need to re-initialize the `state` to update the execution context.
         self._state = self.get_state_class()(
-            self.chaindb.db, execution_context, header.state_root
+            self.chaindb.db,
+            execution_context,
+            header.state_root,
+            self.chain_context.warm_state_cache,
         )
 
         # run all of the transactions.
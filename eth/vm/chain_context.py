@@ -4,6 +4,7 @@ from typing import (
 
 from eth.abc import (
     ChainContextAPI,
+    WarmStateCacheAPI,
 )
 from eth.validation import (
     validate_uint256,
@@ -11,16 +12,25 @@ from eth.validation import (
 
 
 class ChainContext(ChainContextAPI):
-    __slots__ = ["_chain_id"]
+    __slots__ = ["_chain_id", "_warm_state_cache"]
 
-    def __init__(self, chain_id: Optional[int]) -> None:
+    def __init__(
+        self,
+        chain_id: Optional[int],
+        warm_state_cache: Optional[WarmStateCacheAPI] = None,
+    ) -> None:
         if chain_id is None:
             chain_id = 0  # Default value (invalid for public networks)
         # Due to EIP-155's definition of Chain ID,
         # the number that needs to be RLP encoded is `CHAINID * 2 + 36`
         validate_uint256(chain_id)
         self._chain_id = chain_id
+        self._warm_state_cache = warm_state_cache
 
     @property
     def chain_id(self) -> int:
         return self._chain_id
+
+    @property
+    def warm_state_cache(self) -> Optional[WarmStateCacheAPI]:
+        return self._warm_state_cache
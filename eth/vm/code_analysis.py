@@ -0,0 +1,262 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from lru import (
+    LRU,
+)
+
+from eth.abc import (
+    ComputationAPI,
+    OpcodeAPI,
+)
+from eth.vm.logic import (
+    stack,
+)
+from eth.vm.logic.invalid import (
+    InvalidOpcode,
+)
+from eth.vm.opcode import (
+    _FastOpcode,
+)
+from eth.vm.opcode_values import (
+    BALANCE,
+    CALL,
+    CALLCODE,
+    CALLDATACOPY,
+    CODECOPY,
+    CREATE,
+    CREATE2,
+    DELEGATECALL,
+    EXP,
+    EXTCODECOPY,
+    EXTCODEHASH,
+    EXTCODESIZE,
+    GAS,
+    JUMP,
+    JUMPDEST,
+    JUMPI,
+    LOG0,
+    LOG1,
+    LOG2,
+    LOG3,
+    LOG4,
+    MLOAD,
+    MSTORE,
+    MSTORE8,
+    PUSH1,
+    PUSH32,
+    RETURN,
+    RETURNDATACOPY,
+    REVERT,
+    SELFDESTRUCT,
+    SHA3,
+    SLOAD,
+    SSTORE,
+    STATICCALL,
+    STOP,
+)
+from eth.vm.superinstructions import (
+    Instruction,
+    fuse_superinstructions,
+)
+
+# PUSH_ opcodes built from these logic functions only read their immediate from the
+# code, so the analyzed code can push the pre-decoded value directly.
+_PUSH_LOGIC_FNS = {getattr(stack, f"push{size}"): size for size in range(1, 33)}
+
+# Opcodes that end a basic block: control flow and halting opcodes, plus every
+# opcode that reads the remaining gas or charges dynamic gas, so that it never sees
+# the static gas of the instructions after it already charged. Otherwise a dynamic
+# charge could run out of gas where the byte-at-a-time loop fails later with another
+# error. Any opcode that is not a _FastOpcode also ends its block, because it
+# charges its own gas.
+BASIC_BLOCK_TERMINATORS = frozenset(
+    (
+        STOP,
+        JUMP,
+        JUMPI,
+        RETURN,
+        REVERT,
+        SELFDESTRUCT,
+        GAS,
+        SSTORE,
+        CALL,
+        CALLCODE,
+        DELEGATECALL,
+        STATICCALL,
+        CREATE,
+        CREATE2,
+        EXP,
+        SHA3,
+        BALANCE,
+        EXTCODESIZE,
+        EXTCODECOPY,
+        EXTCODEHASH,
+        CALLDATACOPY,
+        CODECOPY,
+        RETURNDATACOPY,
+        MLOAD,
+        MSTORE,
+        MSTORE8,
+        SLOAD,
+        LOG0,
+        LOG1,
+        LOG2,
+        LOG3,
+        LOG4,
+    )
+)
+
+ANALYZED_CODE_CACHE_SIZE = 256
+_analyzed_code_cache: "LRU[Tuple[Type[ComputationAPI], bytes, bool], AnalyzedCode]" = (
+    LRU(ANALYZED_CODE_CACHE_SIZE)
+)
+
+
+class BasicBlock:
+    """
+    A straight run of instructions that is always executed from its first
+    instruction, so its static gas can be charged all at once on entry.
+
+    Each instruction is a ``(fn, immediate, next_pc)`` tuple, where ``fn`` is the
+    logic function of a :class:`~eth.vm.opcode._FastOpcode` (whose static gas is
+    part of ``static_gas``) or the opcode itself, which charges its own gas.
+    """
+
+    __slots__ = ["static_gas", "instructions"]
+
+    def __init__(
+        self,
+        static_gas: int,
+        instructions: Tuple[Tuple[Callable[..., Any], Optional[bytes], int], ...],
+    ) -> None:
+        self.static_gas = static_gas
+        self.instructions = instructions
+
+
+class AnalyzedCode:
+    """
+    Bytecode decoded once against the opcodes of a single fork.
+
+    Each list is indexed by program counter and has one entry per byte of code,
+    decoded as if execution started at that position, exactly like the
+    byte-at-a-time :class:`~eth.vm.code_stream.CodeStream` iteration would. A final
+    entry at ``len(code)`` holds the implicit ``STOP`` past the end of the code.
+
+    ``immediates`` holds the padded push data of a PUSH_ at that position, or
+    ``None`` for every other opcode, and ``next_pcs`` the program counter of the
+    following instruction.
+
+    ``basic_blocks`` is filled in lazily by :meth:`build_basic_block`, for the
+    positions that execution enters a block at.
+    """
+
+    __slots__ = [
+        "code_bytes",
+        "code_length",
+        "opcode_fns",
+        "immediates",
+        "next_pcs",
+        "basic_blocks",
+    ]
+
+    def __init__(
+        self,
+        code_bytes: bytes,
+        opcode_fns: List[Instruction],
+        immediates: List[Optional[bytes]],
+        next_pcs: List[int],
+    ) -> None:
+        self.code_bytes = code_bytes
+        self.code_length = len(code_bytes)
+        self.opcode_fns = opcode_fns
+        self.immediates = immediates
+        self.next_pcs = next_pcs
+        self.basic_blocks: List[Optional[BasicBlock]] = [None] * self.code_length
+
+    def build_basic_block(self, start: int) -> BasicBlock:
+        code_bytes = self.code_bytes
+        code_length = self.code_length
+
+        static_gas = 0
+        instructions = []
+        pc = start
+        while pc < code_length:
+            opcode_fn = self.opcode_fns[pc]
+            next_pc = self.next_pcs[pc]
+
+            if isinstance(opcode_fn, _FastOpcode):
+                static_gas += opcode_fn.gas_cost
+                instructions.append((opcode_fn.logic_fn, self.immediates[pc], next_pc))
+                if code_bytes[pc] in BASIC_BLOCK_TERMINATORS:
+                    break
+            else:
+                instructions.append((opcode_fn, None, next_pc))
+                break
+
+            if next_pc < code_length and code_bytes[next_pc] == JUMPDEST:
+                # a JUMPDEST can be entered from elsewhere, so it starts a new block
+                break
+            pc = next_pc
+
+        basic_block = BasicBlock(static_gas, tuple(instructions))
+        self.basic_blocks[start] = basic_block
+        return basic_block
+
+
+def analyze_code(code_bytes: bytes, opcodes: Dict[int, OpcodeAPI]) -> AnalyzedCode:
+    opcode_fns: List[Instruction] = []
+    immediates: List[Optional[bytes]] = []
+    next_pcs: List[int] = []
+
+    for position, opcode in enumerate(code_bytes + bytes((STOP,))):
+        try:
+            opcode_fn = opcodes[opcode]
+        except KeyError:
+            opcode_fn = InvalidOpcode(opcode)
+
+        push_size = 0
+        if PUSH1 <= opcode <= PUSH32 and isinstance(opcode_fn, _FastOpcode):
+            push_size = _PUSH_LOGIC_FNS.get(opcode_fn.logic_fn, 0)
+
+        if push_size:
+            data_start = position + 1
+            raw_value = code_bytes[data_start : data_start + push_size]
+            immediates.append(raw_value.ljust(push_size, b"\x00"))
+            next_pcs.append(data_start + push_size)
+        else:
+            immediates.append(None)
+            next_pcs.append(position + 1)
+
+        opcode_fns.append(opcode_fn)
+
+    return AnalyzedCode(code_bytes, opcode_fns, immediates, next_pcs)
+
+
+def get_analyzed_code(
+    code_bytes: bytes,
+    computation_class: Type[ComputationAPI],
+    fuse: bool = False,
+) -> AnalyzedCode:
+    """
+    Return the analyzed form of ``code_bytes`` for the opcodes of
+    ``computation_class``, decoding it only if it is not already in the
+    process-wide cache. If ``fuse`` is set, common opcode sequences are replaced
+    with superinstructions.
+    """
+    key = (computation_class, code_bytes, fuse)
+    try:
+        return _analyzed_code_cache[key]
+    except KeyError:
+        analyzed_code = analyze_code(code_bytes, computation_class.opcodes)
+        if fuse:
+            fuse_superinstructions(analyzed_code)
+        _analyzed_code_cache[key] = analyzed_code
+        return analyzed_code
@@ -2,7 +2,10 @@ import contextlib
 import logging
 from typing import (
     Iterator,
-    Set,
+)
+
+from lru import (
+    LRU,
 )
 
 from eth.abc import (
@@ -17,13 +20,50 @@ from eth.vm.opcode_values import (
     STOP,
 )
 
+# Bitmaps of valid opcode positions are shared process-wide, keyed by the code
+# itself. Python caches the hash of a bytes object, so the repeated lookups of a
+# hot contract cost no more than a dict access, without hashing the code again.
+VALID_OPCODE_BITMAP_CACHE_SIZE = 1024
+_valid_opcode_bitmaps: "LRU[bytes, bytes]" = LRU(VALID_OPCODE_BITMAP_CACHE_SIZE)
+
+
+def _analyze_valid_opcode_positions(code_bytes: bytes) -> bytes:
+    """
+    Walk the code once, setting a bit for every position that holds an opcode (as
+    opposed to the data following a PUSH_). Bit ``i`` lives in byte ``i >> 3``.
+    """
+    bitmap = bytearray((len(code_bytes) + 7) >> 3)
+    length = len(code_bytes)
+    position = 0
+    while position < length:
+        bitmap[position >> 3] |= 1 << (position & 7)
+        opcode = code_bytes[position]
+        if PUSH1 <= opcode <= PUSH32:
+            # skip over the push data, which is never a valid opcode
+            position += opcode - PUSH1 + 2
+        else:
+            position += 1
+    return bytes(bitmap)
+
+
+def get_valid_opcode_bitmap(code_bytes: bytes) -> bytes:
+    """
+    Return the bitmap of valid opcode positions for ``code_bytes``, analyzing the
+    code only if it is not already in the process-wide cache.
+    """
+    try:
+        return _valid_opcode_bitmaps[code_bytes]
+    except KeyError:
+        bitmap = _analyze_valid_opcode_positions(code_bytes)
+        _valid_opcode_bitmaps[code_bytes] = bitmap
+        return bitmap
+
 
 class CodeStream(CodeStreamAPI):
     __slots__ = [
         "_length_cache",
         "_raw_code_bytes",
-        "invalid_positions",
-        "valid_positions",
+        "_valid_opcode_bitmap",
         "program_counter",
     ]
 
@@ -38,8 +78,8 @@ class CodeStream(CodeStreamAPI):
         self.program_counter = 0
         self._raw_code_bytes = code_bytes
         self._length_cache = len(code_bytes)
-        self.invalid_positions: Set[int] = set()
-        self.valid_positions: Set[int] = set()
+        # analyzed lazily, since most code is executed without any jumps
+        self._valid_opcode_bitmap: bytes = None
 
     def read(self, size: int) -> bytes:
         old_program_counter = self.program_counter
@@ -83,45 +123,14 @@ class CodeStream(CodeStreamAPI):
         finally:
             self.program_counter = anchor_pc
 
-    def _potentially_disqualifying_opcode_positions(
-        self, position: int
-    ) -> Iterator[int]:
-        # Look at the last 32 positions (from 1 byte back to 32 bytes back).
-        # Don't attempt to look at negative positions.
-        deepest_lookback = min(32, position)
-        # iterate in reverse, because PUSH32 is more common than others
-        for bytes_back in range(deepest_lookback, 0, -1):
-            earlier_position = position - bytes_back
-            opcode = self._raw_code_bytes[earlier_position]
-            if PUSH1 + (bytes_back - 1) <= opcode <= PUSH32:
-                # that PUSH1, if two bytes back, isn't disqualifying
-                # PUSH32 in any of the bytes back is disqualifying
-                yield earlier_position
-
     def is_valid_opcode(self, position: int) -> bool:
         if position >= self._length_cache:
             return False
-        elif position in self.invalid_positions:
-            return False
-        elif position in self.valid_positions:
-            return True
-        else:
-            # An opcode is not valid, iff it is the "data" following a PUSH_
-            # So we look at the previous 32 bytes (PUSH32 being the largest) to see if
-            # there is a PUSH_ before the opcode in this position.
-            for disqualifier in self._potentially_disqualifying_opcode_positions(
-                position
-            ):
-                # Now that we found a PUSH_ before this position,
-                # we check if *that* PUSH is valid
-                if self.is_valid_opcode(disqualifier):
-                    # If the PUSH_ valid, then the current position is invalid
-                    self.invalid_positions.add(position)
-                    return False
-                # Otherwise, keep looking for other potentially
-                # disqualifying PUSH_ codes
-
-            # We didn't find any valid PUSH_ opcodes in the 32 bytes
-            # before position; it's valid
-            self.valid_positions.add(position)
-            return True
+
+        bitmap = self._valid_opcode_bitmap
+        if bitmap is None:
+            bitmap = get_valid_opcode_bitmap(self._raw_code_bytes)
+            self._valid_opcode_bitmap = bitmap
+
+        # An opcode is not valid, iff it is the "data" following a PUSH_
+        return bool(bitmap[position >> 3] & (1 << (position & 7)))
@@ -1,4 +1,7 @@
 import itertools
+from time import (
+    perf_counter_ns,
+)
 from types import (
     TracebackType,
 )
@@ -6,6 +9,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Tuple,
@@ -34,12 +38,16 @@ from eth._utils.numeric import (
 from eth.abc import (
     CodeStreamAPI,
     ComputationAPI,
+    ExecutionEngineAPI,
     GasMeterAPI,
+    KeccakMemoAPI,
     MemoryAPI,
     MessageAPI,
     OpcodeAPI,
     StackAPI,
     StateAPI,
+    TracerAPI,
+    TraceStep,
     TransactionContextAPI,
 )
 from eth.constants import (
@@ -50,17 +58,27 @@ from eth.exceptions import (
     Halt,
     VMError,
 )
+from eth.precompiles.caching import (
+    PrecompileResultCache,
+)
 from eth.typing import (
     BytesOrView,
 )
 from eth.validation import (
     validate_canonical_address,
     validate_is_bytes,
+    validate_is_bytes_or_view,
     validate_uint256,
 )
+from eth.vm.code_analysis import (
+    get_analyzed_code,
+)
 from eth.vm.code_stream import (
     CodeStream,
 )
+from eth.vm.execution_engine import (
+    get_execution_engine,
+)
 from eth.vm.gas_meter import (
     GasMeter,
 )
@@ -73,8 +91,19 @@ from eth.vm.memory import (
 from eth.vm.message import (
     Message,
 )
+from eth.vm.opcode import (
+    _FastOpcode,
+)
+from eth.vm.profiling import (
+    ExecutionProfiler,
+    ProfiledFrame,
+)
 from eth.vm.stack import (
     Stack,
+    to_int,
+)
+from eth.vm.superinstructions import (
+    OpcodeNGramProfiler,
 )
 
 
@@ -117,19 +146,48 @@ class BaseComputation(ComputationAPI, Configurable):
     transaction_context: TransactionContextAPI = None
     code: CodeStreamAPI = None
     children: List[ComputationAPI] = None
-    return_data: bytes = b""
+    return_data: BytesOrView = b""
     accounts_to_delete: Dict[Address, Address] = None
 
     _memory: MemoryAPI = None
     _stack: StackAPI = None
     _gas_meter: GasMeterAPI = None
     _error: VMError = None
-    _output: bytes = b""
+    _output: BytesOrView = b""
     _log_entries: List[Tuple[int, Address, Tuple[int, ...], bytes]] = None
 
     # VM configuration
     opcodes: Dict[int, OpcodeAPI] = None
+    # Set to UncheckedStack to skip validating every value pushed on the stack
+    stack_class: Type[StackAPI] = Stack
+    # Set to PreallocatedMemory to reserve memory capacity ahead of its size
+    memory_class: Type[MemoryAPI] = Memory
+    # Set to True to reuse the stack and memory of finished child computations
+    use_resource_pool: bool = False
+    # Set to False to step through the raw code stream instead (e.g. for debugging)
+    use_analyzed_code: bool = True
+    # Set to True to charge the static gas of each basic block once, on entry
+    use_basic_block_gas: bool = False
+    # Set to True to run common opcode sequences as single superinstructions
+    use_superinstructions: bool = False
+    # Set to a profiler to count the opcode sequences run, on the code stream
+    opcode_ngram_profiler: OpcodeNGramProfiler = None
+    # Set to a tracer to report every opcode run, on the code stream. A tracer set on
+    # the state takes its place
+    tracer: TracerAPI = None
+    # Set to a profiler to count the time and gas of every opcode run, on the code
+    # stream
+    execution_profiler: ExecutionProfiler = None
+    # Set to an engine to run the code of this class of computations with it, instead
+    # of the engine named by the EXECUTION_ENGINE_CLASS environment variable
+    execution_engine: ExecutionEngineAPI = None
+    # Set to a KeccakMemo to reuse the hashes of short SHA3 preimages
+    keccak_memo: KeccakMemoAPI = None
+    # Set to a cache to reuse the results of the precompiles at the cacheable addresses
+    precompile_result_cache: PrecompileResultCache = None
     _precompiles: Dict[Address, Callable[[ComputationAPI], ComputationAPI]] = None
+    # The precompiles whose output and gas only depend on their input
+    _cacheable_precompiles: FrozenSet[Address] = frozenset()
 
     def __init__(
         self,
@@ -146,8 +204,13 @@ class BaseComputation(ComputationAPI, Configurable):
 
         self.children = []
         self.accounts_to_delete = {}
-        self._stack = Stack()
-        self._memory = Memory()
+        if self.use_resource_pool:
+            resource_pool = transaction_context.resource_pool
+            self._stack = resource_pool.acquire(self.stack_class)
+            self._memory = resource_pool.acquire(self.memory_class)
+        else:
+            self._stack = self.stack_class()
+            self._memory = self.memory_class()
         self._log_entries = []
 
     def _configure_gas_meter(self) -> GasMeter:
@@ -206,8 +269,19 @@ class BaseComputation(ComputationAPI, Configurable):
     ) -> ComputationAPI:
         child_computation = self.generate_child_computation(child_msg)
         self.add_child_computation(child_computation)
+        if self.use_resource_pool:
+            self._release_resources(child_computation)
         return child_computation
 
+    def _release_resources(self, child_computation: ComputationAPI) -> None:
+        # Nothing reads the stack or memory of a child after it returns: its output
+        # was already copied out of its memory.
+        resource_pool = self.transaction_context.resource_pool
+        resource_pool.release(child_computation._stack)
+        resource_pool.release(child_computation._memory)
+        child_computation._stack = None
+        child_computation._memory = None
+
     def generate_child_computation(
         self,
         child_msg: MessageAPI,
@@ -232,16 +306,16 @@ class BaseComputation(ComputationAPI, Configurable):
     ) -> None:
         if child_computation.is_error:
             if child_computation.msg.is_create:
-                self.return_data = child_computation.output
+                self.return_data = child_computation.output_view
             elif child_computation.should_burn_gas:
                 self.return_data = b""
             else:
-                self.return_data = child_computation.output
+                self.return_data = child_computation.output_view
         else:
             if child_computation.msg.is_create:
                 self.return_data = b""
             else:
-                self.return_data = child_computation.output
+                self.return_data = child_computation.output_view
         self.children.append(child_computation)
 
     # -- gas consumption -- #
@@ -325,23 +399,113 @@ class BaseComputation(ComputationAPI, Configurable):
         message: MessageAPI,
         transaction_context: TransactionContextAPI,
     ) -> ComputationAPI:
-        with cls(state, message, transaction_context) as computation:
-            if message.is_create and computation.is_origin_computation:
-                # If computation is from a create transaction, consume initcode gas if
-                # >= Shanghai. CREATE and CREATE2 are handled in the opcode
-                # implementations.
-                cls.consume_initcode_gas_cost(computation)
-
-            # Early exit on pre-compiles
-            precompile = computation.precompiles.get(message.code_address, NO_RESULT)
-            if precompile is not NO_RESULT:
-                precompile(computation)
-                return computation
-
-            show_debug2 = computation.logger.show_debug2
-
-            opcode_lookup = computation.opcodes
-            for opcode in computation.code:
+        if state.tracer is not None:
+            tracer = state.tracer
+        else:
+            tracer = cls.tracer
+        profiler = cls.execution_profiler
+        frame = None
+        try:
+            with cls(state, message, transaction_context) as computation:
+                if message.is_create and computation.is_origin_computation:
+                    # If computation is from a create transaction, consume initcode
+                    # gas if >= Shanghai. CREATE and CREATE2 are handled in the
+                    # opcode implementations.
+                    cls.consume_initcode_gas_cost(computation)
+
+                # Pre-compiles run instead of any code
+                precompile = computation.precompiles.get(
+                    message.code_address, NO_RESULT
+                )
+                if precompile is not NO_RESULT:
+                    precompile(computation)
+                # Pick the loop once, so that the loop that runs when nothing is
+                # traced never checks for tracing
+                elif (
+                    computation.logger.show_debug2
+                    or cls.opcode_ngram_profiler is not None
+                    or tracer is not None
+                ):
+                    cls._execute_traced_code_stream(computation, tracer)
+                elif profiler is not None:
+                    frame = profiler.start_computation(computation)
+                    start_gas = computation.get_gas_remaining()
+                    start_ns = perf_counter_ns()
+                    cls._execute_profiled_code_stream(computation, frame)
+                elif cls.execution_engine is not None:
+                    cls.execution_engine.execute(computation)
+                else:
+                    get_execution_engine().execute(computation)
+        finally:
+            # The frame ends after the error handling of the computation, so that
+            # the gas burned by an error is charged to this computation rather than
+            # to the opcode of the caller
+            if frame is not None:
+                profiler.end_computation(
+                    frame,
+                    perf_counter_ns() - start_ns,
+                    start_gas - computation.get_gas_remaining(),
+                )
+
+        if tracer is not None:
+            tracer.on_computation_end(computation)
+
+        return computation
+
+    @classmethod
+    def execute_code(cls, computation: ComputationAPI) -> None:
+        """
+        Run the code of ``computation`` with the built-in loop that this class is
+        configured for. This is what
+        :class:`~eth.vm.execution_engine.PyEVMExecutionEngine` runs.
+        """
+        if not cls.use_analyzed_code:
+            cls._execute_code_stream(computation)
+        elif cls.use_basic_block_gas:
+            cls._execute_basic_blocks(computation)
+        else:
+            cls._execute_analyzed_code(computation)
+
+    @classmethod
+    def _execute_code_stream(cls, computation: ComputationAPI) -> None:
+        """
+        Step through the code one byte at a time, looking up each opcode as it is
+        read. Slower than :meth:`_execute_analyzed_code`.
+        """
+        opcode_lookup = computation.opcodes
+        for opcode in computation.code:
+            try:
+                opcode_fn = opcode_lookup[opcode]
+            except KeyError:
+                opcode_fn = InvalidOpcode(opcode)
+
+            try:
+                opcode_fn(computation=computation)
+            except Halt:
+                break
+
+    @classmethod
+    def _execute_traced_code_stream(
+        cls, computation: ComputationAPI, tracer: Optional[TracerAPI]
+    ) -> None:
+        """
+        Step through the code like :meth:`_execute_code_stream`, but log every
+        opcode when debug2 logging is enabled, feed the opcode n-gram profiler, and
+        report every opcode to ``tracer``, if there is one.
+        """
+        show_debug2 = computation.logger.show_debug2
+        ngram_profiler = cls.opcode_ngram_profiler
+        trace: List[Tuple[int, int, str]] = None
+        if ngram_profiler is not None:
+            trace = []
+
+        opcode_lookup = computation.opcodes
+        code = computation.code
+        # the position of each opcode, which is also where the implicit STOP past the
+        # end of the code is
+        pc = code.program_counter
+        try:
+            for opcode in code:
                 try:
                     opcode_fn = opcode_lookup[opcode]
                 except KeyError:
@@ -354,16 +518,215 @@ class BaseComputation(ComputationAPI, Configurable):
                         "OPCODE: 0x%x (%s) | pc: %s | stack: %s",
                         opcode,
                         opcode_fn.mnemonic,
-                        max(0, computation.code.program_counter - 1),
+                        pc,
                         base_comp._stack,
                     )
 
+                if trace is not None:
+                    trace.append((pc, opcode, opcode_fn.mnemonic))
+
+                if tracer is not None:
+                    tracer.on_step(
+                        cls._get_trace_step(computation, tracer, pc, opcode, opcode_fn)
+                    )
+
                 try:
                     opcode_fn(computation=computation)
                 except Halt:
                     break
+                pc = code.program_counter
+        finally:
+            if trace is not None:
+                ngram_profiler.record_trace(trace)
 
-        return computation
+    @classmethod
+    def _execute_profiled_code_stream(
+        cls, computation: ComputationAPI, frame: ProfiledFrame
+    ) -> None:
+        """
+        Step through the code like :meth:`_execute_code_stream`, timing every
+        opcode and the gas it uses into ``frame`` of the execution profiler.
+        """
+        record_opcode = frame.record_opcode
+        gas_meter = cast(BaseComputation, computation)._gas_meter
+
+        opcode_lookup = computation.opcodes
+        code = computation.code
+        pc = code.program_counter
+        try:
+            for opcode in code:
+                try:
+                    opcode_fn = opcode_lookup[opcode]
+                except KeyError:
+                    opcode_fn = InvalidOpcode(opcode)
+
+                gas_before = gas_meter.gas_remaining
+                nested_ns = frame.nested_ns
+                nested_gas = frame.nested_gas
+                opcode_start_ns = perf_counter_ns()
+                try:
+                    opcode_fn(computation=computation)
+                except Halt:
+                    break
+                finally:
+                    # leave out the time and gas of any computation the opcode ran
+                    record_opcode(
+                        pc,
+                        opcode_fn.mnemonic,
+                        perf_counter_ns()
+                        - opcode_start_ns
+                        - (frame.nested_ns - nested_ns),
+                        gas_before
+                        - gas_meter.gas_remaining
+                        - (frame.nested_gas - nested_gas),
+                    )
+                pc = code.program_counter
+        except VMError:
+            # the gas that the error burns is charged to this opcode once the
+            # computation ends
+            frame.error_pc = pc
+            raise
+
+    @classmethod
+    def _get_trace_step(
+        cls,
+        computation: ComputationAPI,
+        tracer: TracerAPI,
+        pc: int,
+        opcode: int,
+        opcode_fn: OpcodeAPI,
+    ) -> TraceStep:
+        # We dig into some internals for the trace
+        stack = cast(Stack, computation._stack)
+        memory_size = len(computation._memory)
+
+        if tracer.capture_stack:
+            stack_values: Tuple[int, ...] = tuple(
+                to_int(value) for value in stack.values
+            )
+        else:
+            stack_values = None
+
+        if tracer.capture_memory:
+            memory: bytes = computation.memory_read_bytes(0, memory_size)
+        else:
+            memory = None
+
+        return TraceStep(
+            pc=pc,
+            op=opcode,
+            op_name=opcode_fn.mnemonic,
+            gas=computation._gas_meter.gas_remaining,
+            gas_cost=getattr(opcode_fn, "gas_cost", 0),
+            depth=computation.msg.depth + 1,
+            refund=computation._gas_meter.gas_refunded,
+            memory_size=memory_size,
+            stack=stack_values,
+            memory=memory,
+        )
+
+    @classmethod
+    def _execute_analyzed_code(cls, computation: ComputationAPI) -> None:
+        """
+        Walk the pre-decoded form of the code, which is shared by every execution
+        of the same code on this computation class.
+        """
+        # This is the hottest loop in the VM. Look up everything up front.
+        analyzed_code = get_analyzed_code(
+            computation.msg.code, cls, cls.use_superinstructions
+        )
+        code_length = analyzed_code.code_length
+        opcode_fns = analyzed_code.opcode_fns
+        immediates = analyzed_code.immediates
+        next_pcs = analyzed_code.next_pcs
+
+        code = computation.code
+        consume_gas = computation.consume_gas
+        stack_push_bytes = computation.stack_push_bytes
+
+        try:
+            while True:
+                pc = code.program_counter
+                if pc >= code_length:
+                    # like the code stream, run a single STOP past the end of code
+                    opcode_fns[code_length](computation=computation)
+                    break
+
+                # opcodes expect the program counter to point past themselves
+                code.program_counter = pc + 1
+                immediate = immediates[pc]
+                if immediate is None:
+                    opcode_fns[pc](computation=computation)
+                else:
+                    # analysis only pre-decodes the immediates of _FastOpcode pushes
+                    push_opcode = cast(_FastOpcode, opcode_fns[pc])
+                    consume_gas(push_opcode.gas_cost, push_opcode.mnemonic)
+                    code.program_counter = next_pcs[pc]
+                    stack_push_bytes(immediate)
+        except Halt:
+            pass
+
+    @classmethod
+    def _execute_basic_blocks(cls, computation: ComputationAPI) -> None:
+        """
+        Like :meth:`_execute_analyzed_code`, but charge the summed static gas of each
+        basic block on entry, instead of once per instruction. Dynamic gas is still
+        charged by the opcodes themselves, which always end their block, so they see
+        the same gas remaining as they would one instruction at a time.
+
+        A block whose static gas is more than the gas remaining is charged one
+        instruction at a time, so that running out of gas raises the very same
+        error at the very same instruction.
+        """
+        analyzed_code = get_analyzed_code(
+            computation.msg.code, cls, cls.use_superinstructions
+        )
+        code_length = analyzed_code.code_length
+        opcode_fns = analyzed_code.opcode_fns
+        immediates = analyzed_code.immediates
+        next_pcs = analyzed_code.next_pcs
+        basic_blocks = analyzed_code.basic_blocks
+        build_basic_block = analyzed_code.build_basic_block
+
+        code = computation.code
+        gas_meter = computation.get_gas_meter()
+        consume_gas = computation.consume_gas
+        stack_push_bytes = computation.stack_push_bytes
+
+        try:
+            while True:
+                pc = code.program_counter
+                if pc >= code_length:
+                    # like the code stream, run a single STOP past the end of code
+                    opcode_fns[code_length](computation=computation)
+                    break
+
+                basic_block = basic_blocks[pc]
+                if basic_block is None:
+                    basic_block = build_basic_block(pc)
+
+                if basic_block.static_gas <= gas_meter.gas_remaining:
+                    consume_gas(basic_block.static_gas, "basic block")
+                    for fn, immediate, next_pc in basic_block.instructions:
+                        code.program_counter = next_pc
+                        if immediate is None:
+                            fn(computation)
+                        else:
+                            stack_push_bytes(immediate)
+                else:
+                    for _ in range(len(basic_block.instructions)):
+                        pc = code.program_counter
+                        code.program_counter = pc + 1
+                        immediate = immediates[pc]
+                        if immediate is None:
+                            opcode_fns[pc](computation=computation)
+                        else:
+                            push_opcode = cast(_FastOpcode, opcode_fns[pc])
+                            consume_gas(push_opcode.gas_cost, push_opcode.mnemonic)
+                            code.program_counter = next_pcs[pc]
+                            stack_push_bytes(immediate)
+        except Halt:
+            pass
 
     # -- error handling -- #
     @property
@@ -439,9 +802,12 @@ class BaseComputation(ComputationAPI, Configurable):
 
             self._memory.extend(start_position, size)
 
-    def memory_write(self, start_position: int, size: int, value: bytes) -> None:
+    def memory_write(self, start_position: int, size: int, value: BytesOrView) -> None:
         return self._memory.write(start_position, size, value)
 
+    def memory_write_unchecked(self, start_position: int, value: BytesOrView) -> None:
+        return self._memory.write_unchecked(start_position, value)
+
     def memory_read(self, start_position: int, size: int) -> memoryview:
         return self._memory.read(start_position, size)
 
@@ -452,8 +818,11 @@ class BaseComputation(ComputationAPI, Configurable):
     def get_gas_meter(self) -> GasMeterAPI:
         return self._gas_meter
 
-    def consume_gas(self, amount: int, reason: str) -> None:
-        return self._gas_meter.consume_gas(amount, reason)
+    # Gas is consumed by every opcode. Proxy directly to the gas meter, like the
+    # stack methods.
+    @cached_property
+    def consume_gas(self) -> Callable[[int, str], None]:
+        return self._gas_meter.consume_gas
 
     def return_gas(self, amount: int) -> None:
         return self._gas_meter.return_gas(amount)
@@ -498,6 +867,14 @@ class BaseComputation(ComputationAPI, Configurable):
     def stack_pop_ints(self) -> Callable[[int], Tuple[int, ...]]:
         return self._stack.pop_ints
 
+    @cached_property
+    def stack_pop2_ints(self) -> Callable[[], Tuple[int, int]]:
+        return self._stack.pop2_ints
+
+    @cached_property
+    def stack_pop3_ints(self) -> Callable[[], Tuple[int, int, int]]:
+        return self._stack.pop3_ints
+
     @cached_property
     def stack_pop_bytes(self) -> Callable[[int], Tuple[bytes, ...]]:
         return self._stack.pop_bytes
@@ -531,19 +908,34 @@ class BaseComputation(ComputationAPI, Configurable):
     def output(self) -> bytes:
         if self.should_erase_return_data:
             return b""
+        elif type(self._output) is bytes:
+            return self._output
         else:
+            # materialize a view once, when the output leaves the EVM
+            self._output = bytes(self._output)
             return self._output
 
     @output.setter
-    def output(self, value: bytes) -> None:
-        validate_is_bytes(value)
+    def output(self, value: BytesOrView) -> None:
+        validate_is_bytes_or_view(value, title="Computation output")
         self._output = value
 
+    @property
+    def output_view(self) -> BytesOrView:
+        if self.should_erase_return_data:
+            return b""
+        else:
+            return self._output
+
     # -- opcode API -- #
     @property
     def precompiles(self) -> Dict[Address, Callable[[ComputationAPI], Any]]:
         if self._precompiles is None:
             return {}
+        elif self.precompile_result_cache is not None:
+            return self.precompile_result_cache.get_precompiles(
+                type(self), self._precompiles, self._cacheable_precompiles
+            )
         else:
             return self._precompiles
 
@@ -0,0 +1,176 @@
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Tuple,
+    Type,
+    cast,
+)
+
+from eth_utils import (
+    encode_hex,
+)
+
+from eth._utils.module_loading import (
+    import_string,
+)
+from eth.abc import (
+    ComputationAPI,
+    ExecutionEngineAPI,
+)
+from eth.exceptions import (
+    VMError,
+)
+
+if TYPE_CHECKING:
+    from eth.vm.computation import BaseComputation  # noqa: F401
+
+DEFAULT_EXECUTION_ENGINE = "eth.vm.execution_engine.PyEVMExecutionEngine"
+
+
+class PyEVMExecutionEngine(ExecutionEngineAPI):
+    """
+    Run the code with the built-in loop that the class of the computation is
+    configured for.
+    """
+
+    def execute(self, computation: ComputationAPI) -> None:
+        computation_class = cast(Type["BaseComputation"], type(computation))
+        computation_class.execute_code(computation)
+
+    def __repr__(self) -> str:
+        return "PyEVMExecutionEngine()"
+
+
+class ExecutionEngineMismatch(Exception):
+    """
+    Raised when two execution engines disagree on the outcome of a computation.
+    """
+
+    pass
+
+
+class CrossCheckExecutionEngine(ExecutionEngineAPI):
+    """
+    Run the code of every computation on both ``engine`` and ``reference``, and raise
+    an :class:`ExecutionEngineMismatch` if the computations they leave behind differ.
+
+    ``reference`` runs first, on a copy of the computation, and its changes to the
+    state are reverted. Then ``engine`` runs on the computation itself. The nested
+    computations are run by the same engine as the computation that made the call,
+    and are compared as part of it, so that each computation only runs twice.
+
+    The computations are compared on their error, output, gas, logs, accounts to
+    delete and nested computations. The state they leave behind is not compared.
+    """
+
+    def __init__(
+        self, engine: ExecutionEngineAPI, reference: ExecutionEngineAPI
+    ) -> None:
+        self.engine = engine
+        self.reference = reference
+        self._running_engine: ExecutionEngineAPI = None
+
+    def execute(self, computation: ComputationAPI) -> None:
+        if self._running_engine is not None:
+            self._running_engine.execute(computation)
+            return
+
+        computation_class = cast(Type["BaseComputation"], type(computation))
+        reference_computation = computation_class(
+            computation.state, computation.msg, computation.transaction_context
+        )
+        # the computation may have been charged before its code runs, like the
+        # initcode gas of create transactions
+        reference_computation.consume_gas(
+            computation.get_gas_used(), reason="Gas used before the cross check"
+        )
+
+        snapshot = computation.state.snapshot()
+        try:
+            reference_error = self._run(self.reference, reference_computation)
+        finally:
+            computation.state.revert(snapshot)
+            # Nothing releases the stack and memory of the copy otherwise, since it
+            # is not the child of any computation
+            if reference_computation.use_resource_pool:
+                reference_computation._release_resources(reference_computation)
+        error = self._run(self.engine, computation)
+
+        reference_outcome = _summarize(reference_computation, reference_error)
+        outcome = _summarize(computation, error)
+        if outcome != reference_outcome:
+            raise ExecutionEngineMismatch(
+                f"Computation at {encode_hex(computation.msg.code_address)} gave "
+                f"{outcome!r} with "
+                f"{self.engine!r}, but {reference_outcome!r} with {self.reference!r}"
+            )
+
+        if error is not None:
+            raise error
+
+    def _run(self, engine: ExecutionEngineAPI, computation: ComputationAPI) -> VMError:
+        self._running_engine = engine
+        try:
+            engine.execute(computation)
+        except VMError as error:
+            return error
+        else:
+            return None
+        finally:
+            self._running_engine = None
+
+    def __repr__(self) -> str:
+        return f"CrossCheckExecutionEngine({self.engine!r}, {self.reference!r})"
+
+
+def _summarize(computation: ComputationAPI, error: VMError) -> Tuple[Any, ...]:
+    if error is None:
+        error_summary = None
+        gas_remaining = computation.get_gas_remaining()
+    else:
+        # Only the type of the error has to match, not the message
+        error_summary = type(error).__name__
+        # and the gas left does not matter if the error burns it all
+        gas_remaining = None if error.burns_gas else computation.get_gas_remaining()
+
+    return (
+        error_summary,
+        bytes(computation.output_view),
+        gas_remaining,
+        computation.get_gas_refund(),
+        computation.get_log_entries(),
+        computation.get_accounts_for_deletion(),
+        tuple(
+            _summarize(child, child.error if child.is_error else None)
+            for child in computation.children
+        ),
+    )
+
+
+def load_execution_engine() -> ExecutionEngineAPI:
+    """
+    Instantiate the engine named by the ``EXECUTION_ENGINE_CLASS`` environment
+    variable, or else :data:`DEFAULT_EXECUTION_ENGINE`.
+    """
+    import_path = os.environ.get("EXECUTION_ENGINE_CLASS", DEFAULT_EXECUTION_ENGINE)
+    return cast(Type[ExecutionEngineAPI], import_string(import_path))()
+
+
+_execution_engine: ExecutionEngineAPI = None
+
+
+def get_execution_engine() -> ExecutionEngineAPI:
+    global _execution_engine
+    if _execution_engine is None:
+        _execution_engine = load_execution_engine()
+    return _execution_engine
+
+
+def set_execution_engine(engine: ExecutionEngineAPI) -> None:
+    """
+    Run the code of all the computations that are not configured with an engine of
+    their own on ``engine`` from now on.
+    """
+    global _execution_engine
+    _execution_engine = engine
@@ -13,13 +13,14 @@ from eth._utils.address import (
 from eth._utils.numeric import (
     get_highest_bit_index,
 )
-from eth._utils.padding import (
-    zpad_right,
-)
 from eth.precompiles.modexp import (
+    extract_first_32_exponent_bytes,
     extract_lengths,
     modexp,
 )
+from eth.typing import (
+    BytesOrView,
+)
 from eth.vm.forks.berlin import (
     constants,
 )
@@ -54,16 +55,12 @@ def _calculate_iteration_count(
     return max(iteration_count, 1)
 
 
-def _compute_modexp_gas_fee_eip_2565(data: bytes) -> int:
+def _compute_modexp_gas_fee_eip_2565(data: BytesOrView) -> int:
     base_length, exponent_length, modulus_length = extract_lengths(data)
 
-    base_end_idx = 96 + base_length
-    exponent_end_idx = base_end_idx + exponent_length
-
-    first_32_exponent_bytes = zpad_right(
-        data[base_end_idx:exponent_end_idx],
-        to_size=min(exponent_length, 32),
-    )[:32]
+    first_32_exponent_bytes = extract_first_32_exponent_bytes(
+        data, base_length, exponent_length
+    )
     iteration_count = _calculate_iteration_count(
         exponent_length,
         first_32_exponent_bytes,
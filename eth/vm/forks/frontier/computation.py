@@ -41,6 +41,12 @@ FRONTIER_PRECOMPILES = {
     force_bytes_to_address(b"\x04"): precompiles.identity,
 }
 
+# IDENTITY is left out, as its output is a copy of its input, which is cheaper
+# than looking the input up
+FRONTIER_CACHEABLE_PRECOMPILES = frozenset(
+    (force_bytes_to_address(b"\x02"), force_bytes_to_address(b"\x03"))
+)
+
 
 class FrontierComputation(BaseComputation):
     """
@@ -51,6 +57,7 @@ class FrontierComputation(BaseComputation):
     # Override
     opcodes = FRONTIER_OPCODES
     _precompiles = FRONTIER_PRECOMPILES  # type: ignore # https://github.com/python/mypy/issues/708 # noqa: E501
+    _cacheable_precompiles = FRONTIER_CACHEABLE_PRECOMPILES
 
     @classmethod
     def apply_message(
@@ -54,10 +54,21 @@ from .validation import (
 
 class FrontierTransactionExecutor(BaseTransactionExecutor):
     def validate_transaction(self, transaction: SignedTransactionAPI) -> None:
-        # Validate the transaction
-        transaction.validate()
+        # Validate the transaction, unless it was validated ahead of time
+        prevalidation = self.vm_state.get_transaction_prevalidation(transaction)
+        if prevalidation is None:
+            transaction.validate()
+        elif prevalidation.error is not None:
+            raise prevalidation.error
         self.vm_state.validate_transaction(transaction)
 
+    def get_intrinsic_gas(self, transaction: SignedTransactionAPI) -> int:
+        prevalidation = self.vm_state.get_transaction_prevalidation(transaction)
+        if prevalidation is None:
+            return transaction.intrinsic_gas
+        else:
+            return prevalidation.intrinsic_gas
+
     def build_evm_message(self, transaction: SignedTransactionAPI) -> MessageAPI:
         # Use vm_state.get_gas_price instead of transaction_context.gas_price so
         #   that we can run get_transaction_result (aka~ eth_call) and estimate_gas.
@@ -75,7 +86,7 @@ class FrontierTransactionExecutor(BaseTransactionExecutor):
         self.vm_state.increment_nonce(transaction.sender)
 
         # Setup VM Message
-        message_gas = transaction.gas - transaction.intrinsic_gas
+        message_gas = transaction.gas - self.get_intrinsic_gas(transaction)
 
         if transaction.to == CREATE_CONTRACT_ADDRESS:
             contract_address = generate_contract_address(
@@ -60,7 +60,7 @@ class LondonTransactionExecutor(BerlinTransactionExecutor):
         self.vm_state.increment_nonce(transaction.sender)
 
         # Setup VM Message
-        message_gas = transaction.gas - transaction.intrinsic_gas
+        message_gas = transaction.gas - self.get_intrinsic_gas(transaction)
 
         if transaction.to == CREATE_CONTRACT_ADDRESS:
             contract_address = generate_contract_address(
@@ -0,0 +1,56 @@
+from eth_hash.auto import (
+    keccak,
+)
+from lru import (
+    LRU,
+)
+
+from eth._utils.caching import (
+    CacheStats,
+)
+from eth.abc import (
+    KeccakMemoAPI,
+)
+
+KECCAK_MEMO_SIZE = 8192
+
+# Covers the 64-byte (key, slot) preimages of Solidity mappings, and those of
+# mappings nested in them
+MAX_MEMOIZED_PREIMAGE_SIZE = 128
+
+
+class KeccakMemo(KeccakMemoAPI):
+    """
+    Bounded memo of the keccak hashes that the ``SHA3`` opcode computes, for
+    preimages of up to ``max_preimage_size`` bytes, so that the storage slots of
+    the same mapping keys are hashed once for all the computations that share it.
+
+    Hashing is pure, so a memo can be shared by every computation of a block, and
+    kept for the next ones.
+    """
+
+    def __init__(
+        self,
+        size: int = KECCAK_MEMO_SIZE,
+        max_preimage_size: int = MAX_MEMOIZED_PREIMAGE_SIZE,
+    ) -> None:
+        self.max_preimage_size = max_preimage_size
+        self.stats = CacheStats()
+        self._hashes: "LRU[bytes, bytes]" = LRU(size)
+
+    def keccak(self, preimage: bytes) -> bytes:
+        try:
+            hash_ = self._hashes[preimage]
+        except KeyError:
+            self.stats.misses += 1
+            hash_ = self._hashes[preimage] = keccak(preimage)
+        else:
+            self.stats.hits += 1
+        return hash_
+
+    def clear(self) -> None:
+        self._hashes.clear()
+        self.stats.reset()
+
+    def __repr__(self) -> str:
+        return f"KeccakMemo(size={len(self._hashes)}, {self.stats})"
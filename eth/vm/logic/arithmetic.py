@@ -19,7 +19,7 @@ def add(computation: ComputationAPI) -> None:
     """
     Addition
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     result = (left + right) & constants.UINT_256_MAX
 
@@ -30,7 +30,7 @@ def addmod(computation: ComputationAPI) -> None:
     """
     Modulo Addition
     """
-    left, right, mod = computation.stack_pop_ints(3)
+    left, right, mod = computation.stack_pop3_ints()
 
     if mod == 0:
         result = 0
@@ -44,7 +44,7 @@ def sub(computation: ComputationAPI) -> None:
     """
     Subtraction
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     result = (left - right) & constants.UINT_256_MAX
 
@@ -55,7 +55,7 @@ def mod(computation: ComputationAPI) -> None:
     """
     Modulo
     """
-    value, mod = computation.stack_pop_ints(2)
+    value, mod = computation.stack_pop2_ints()
 
     if mod == 0:
         result = 0
@@ -71,7 +71,7 @@ def smod(computation: ComputationAPI) -> None:
     """
     value, mod = map(
         unsigned_to_signed,
-        computation.stack_pop_ints(2),
+        computation.stack_pop2_ints(),
     )
 
     pos_or_neg = -1 if value < 0 else 1
@@ -88,7 +88,7 @@ def mul(computation: ComputationAPI) -> None:
     """
     Multiplication
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     result = (left * right) & constants.UINT_256_MAX
 
@@ -99,7 +99,7 @@ def mulmod(computation: ComputationAPI) -> None:
     """
     Modulo Multiplication
     """
-    left, right, mod = computation.stack_pop_ints(3)
+    left, right, mod = computation.stack_pop3_ints()
 
     if mod == 0:
         result = 0
@@ -112,7 +112,7 @@ def div(computation: ComputationAPI) -> None:
     """
     Division
     """
-    numerator, denominator = computation.stack_pop_ints(2)
+    numerator, denominator = computation.stack_pop2_ints()
 
     if denominator == 0:
         result = 0
@@ -128,7 +128,7 @@ def sdiv(computation: ComputationAPI) -> None:
     """
     numerator, denominator = map(
         unsigned_to_signed,
-        computation.stack_pop_ints(2),
+        computation.stack_pop2_ints(),
     )
 
     pos_or_neg = -1 if numerator * denominator < 0 else 1
@@ -146,7 +146,7 @@ def exp(computation: ComputationAPI, gas_per_byte: int) -> None:
     """
     Exponentiation
     """
-    base, exponent = computation.stack_pop_ints(2)
+    base, exponent = computation.stack_pop2_ints()
 
     bit_size = exponent.bit_length()
     byte_size = ceil8(bit_size) // 8
@@ -170,7 +170,7 @@ def signextend(computation: ComputationAPI) -> None:
     """
     Signed Extend
     """
-    bits, value = computation.stack_pop_ints(2)
+    bits, value = computation.stack_pop2_ints()
 
     if bits <= 31:
         testbit = bits * 8 + 7
@@ -189,7 +189,7 @@ def shl(computation: ComputationAPI) -> None:
     """
     Bitwise left shift
     """
-    shift_length, value = computation.stack_pop_ints(2)
+    shift_length, value = computation.stack_pop2_ints()
 
     if shift_length >= 256:
         result = 0
@@ -203,7 +203,7 @@ def shr(computation: ComputationAPI) -> None:
     """
     Bitwise right shift
     """
-    shift_length, value = computation.stack_pop_ints(2)
+    shift_length, value = computation.stack_pop2_ints()
 
     if shift_length >= 256:
         result = 0
@@ -217,7 +217,7 @@ def sar(computation: ComputationAPI) -> None:
     """
     Arithmetic bitwise right shift
     """
-    shift_length, value = computation.stack_pop_ints(2)
+    shift_length, value = computation.stack_pop2_ints()
     value = unsigned_to_signed(value)
 
     if shift_length >= 256:
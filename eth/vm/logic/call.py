@@ -170,12 +170,12 @@ class BaseCall(Opcode, ABC):
 
             if not child_computation.should_erase_return_data:
                 actual_output_size = min(
-                    memory_output_size, len(child_computation.output)
+                    memory_output_size, len(child_computation.output_view)
                 )
                 computation.memory_write(
                     memory_output_start_position,
                     actual_output_size,
-                    child_computation.output[:actual_output_size],
+                    child_computation.output_view[:actual_output_size],
                 )
 
             if child_computation.should_return_gas:
@@ -14,7 +14,7 @@ def lt(computation: ComputationAPI) -> None:
     """
     Lesser Comparison
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     if left < right:
         result = 1
@@ -28,7 +28,7 @@ def gt(computation: ComputationAPI) -> None:
     """
     Greater Comparison
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     if left > right:
         result = 1
@@ -44,7 +44,7 @@ def slt(computation: ComputationAPI) -> None:
     """
     left, right = map(
         unsigned_to_signed,
-        computation.stack_pop_ints(2),
+        computation.stack_pop2_ints(),
     )
 
     if left < right:
@@ -61,7 +61,7 @@ def sgt(computation: ComputationAPI) -> None:
     """
     left, right = map(
         unsigned_to_signed,
-        computation.stack_pop_ints(2),
+        computation.stack_pop2_ints(),
     )
 
     if left > right:
@@ -76,7 +76,7 @@ def eq(computation: ComputationAPI) -> None:
     """
     Equality
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     if left == right:
         result = 1
@@ -104,7 +104,7 @@ def and_op(computation: ComputationAPI) -> None:
     """
     Bitwise And
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     result = left & right
 
@@ -115,7 +115,7 @@ def or_op(computation: ComputationAPI) -> None:
     """
     Bitwise Or
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     result = left | right
 
@@ -126,7 +126,7 @@ def xor(computation: ComputationAPI) -> None:
     """
     Bitwise XOr
     """
-    left, right = computation.stack_pop_ints(2)
+    left, right = computation.stack_pop2_ints()
 
     result = left ^ right
 
@@ -148,7 +148,7 @@ def byte_op(computation: ComputationAPI) -> None:
     """
     Bitwise And
     """
-    position, value = computation.stack_pop_ints(2)
+    position, value = computation.stack_pop2_ints()
 
     if position >= 32:
         result = 0
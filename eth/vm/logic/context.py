@@ -59,7 +59,8 @@ def calldataload(computation: ComputationAPI) -> None:
     """
     start_position = computation.stack_pop1_int()
 
-    value = computation.msg.data_as_bytes[start_position : start_position + 32]
+    # slice the call data before copying it, as it may be a view of a long buffer
+    value = bytes(computation.msg.data[start_position : start_position + 32])
     padded_value = value.ljust(32, b"\x00")
     normalized_value = padded_value.lstrip(b"\x00")
 
@@ -76,7 +77,7 @@ def calldatacopy(computation: ComputationAPI) -> None:
         mem_start_position,
         calldata_start_position,
         size,
-    ) = computation.stack_pop_ints(3)
+    ) = computation.stack_pop3_ints()
 
     computation.extend_memory(mem_start_position, size)
 
@@ -85,12 +86,16 @@ def calldatacopy(computation: ComputationAPI) -> None:
 
     computation.consume_gas(copy_gas_cost, reason="CALLDATACOPY fee")
 
-    value = computation.msg.data_as_bytes[
+    value = computation.msg.data[
         calldata_start_position : calldata_start_position + size
     ]
-    padded_value = value.ljust(size, b"\x00")
+    computation.memory_write_unchecked(mem_start_position, value)
 
-    computation.memory_write(mem_start_position, size, padded_value)
+    missing_size = size - len(value)
+    if missing_size:
+        computation.memory_write_unchecked(
+            mem_start_position + len(value), bytes(missing_size)
+        )
 
 
 def chain_id(computation: ComputationAPI) -> None:
@@ -107,7 +112,7 @@ def codecopy(computation: ComputationAPI) -> None:
         mem_start_position,
         code_start_position,
         size,
-    ) = computation.stack_pop_ints(3)
+    ) = computation.stack_pop3_ints()
 
     computation.extend_memory(mem_start_position, size)
 
@@ -149,7 +154,7 @@ def extcodecopy_execute(computation: ComputationAPI) -> Tuple[Address, int]:
         mem_start_position,
         code_start_position,
         size,
-    ) = computation.stack_pop_ints(3)
+    ) = computation.stack_pop3_ints()
 
     computation.extend_memory(mem_start_position, size)
 
@@ -201,7 +206,7 @@ def returndatacopy(computation: ComputationAPI) -> None:
         mem_start_position,
         returndata_start_position,
         size,
-    ) = computation.stack_pop_ints(3)
+    ) = computation.stack_pop3_ints()
 
     if returndata_start_position + size > len(computation.return_data):
         raise OutOfBoundsRead(
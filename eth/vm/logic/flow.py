@@ -15,9 +15,7 @@ def stop(computation: ComputationAPI) -> None:
     raise Halt("STOP")
 
 
-def jump(computation: ComputationAPI) -> None:
-    jump_dest = computation.stack_pop1_int()
-
+def jump_to(computation: ComputationAPI, jump_dest: int) -> None:
     computation.code.program_counter = jump_dest
 
     next_opcode = computation.code.peek()
@@ -29,19 +27,17 @@ def jump(computation: ComputationAPI) -> None:
         raise InvalidInstruction("Jump resulted in invalid instruction")
 
 
-def jumpi(computation: ComputationAPI) -> None:
-    jump_dest, check_value = computation.stack_pop_ints(2)
+def jump(computation: ComputationAPI) -> None:
+    jump_dest = computation.stack_pop1_int()
 
-    if check_value:
-        computation.code.program_counter = jump_dest
+    jump_to(computation, jump_dest)
 
-        next_opcode = computation.code.peek()
 
-        if next_opcode != JUMPDEST:
-            raise InvalidJumpDestination("Invalid Jump Destination")
+def jumpi(computation: ComputationAPI) -> None:
+    jump_dest, check_value = computation.stack_pop2_ints()
 
-        if not computation.code.is_valid_opcode(jump_dest):
-            raise InvalidInstruction("Jump resulted in invalid instruction")
+    if check_value:
+        jump_to(computation, jump_dest)
 
 
 def jumpdest(computation: ComputationAPI) -> None:
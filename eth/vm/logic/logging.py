@@ -15,7 +15,7 @@ def log_XX(computation: ComputationAPI, topic_count: int) -> None:
     if topic_count < 0 or topic_count > 4:
         raise TypeError("Invalid log topic size.  Must be 0, 1, 2, 3, or 4")
 
-    mem_start_position, size = computation.stack_pop_ints(2)
+    mem_start_position, size = computation.stack_pop2_ints()
 
     if not topic_count:
         topics: Tuple[int, ...] = ()
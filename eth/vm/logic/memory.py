@@ -12,7 +12,7 @@ def mstore(computation: ComputationAPI) -> None:
 
     computation.extend_memory(start_position, 32)
 
-    computation.memory_write(start_position, 32, normalized_value)
+    computation.memory_write_unchecked(start_position, normalized_value)
 
 
 def mstore8(computation: ComputationAPI) -> None:
@@ -24,7 +24,7 @@ def mstore8(computation: ComputationAPI) -> None:
 
     computation.extend_memory(start_position, 1)
 
-    computation.memory_write(start_position, 1, normalized_value)
+    computation.memory_write_unchecked(start_position, normalized_value)
 
 
 def mload(computation: ComputationAPI) -> None:
@@ -14,16 +14,20 @@ from eth.abc import (
 
 
 def sha3(computation: ComputationAPI) -> None:
-    start_position, size = computation.stack_pop_ints(2)
+    start_position, size = computation.stack_pop2_ints()
 
     computation.extend_memory(start_position, size)
 
-    sha3_bytes = computation.memory_read_bytes(start_position, size)
-    word_count = ceil32(len(sha3_bytes)) // 32
+    word_count = ceil32(size) // 32
 
     gas_cost = constants.GAS_SHA3WORD * word_count
     computation.consume_gas(gas_cost, reason="SHA3: word gas cost")
 
-    result = keccak(sha3_bytes)
+    sha3_bytes = computation.memory_read_bytes(start_position, size)
+    keccak_memo = computation.keccak_memo
+    if keccak_memo is None or size > keccak_memo.max_preimage_size:
+        result = keccak(sha3_bytes)
+    else:
+        result = keccak_memo.keccak(sha3_bytes)
 
     computation.stack_push_bytes(result)
@@ -15,7 +15,7 @@ from eth.abc import (
 
 
 def sstore(computation: ComputationAPI) -> None:
-    slot, value = computation.stack_pop_ints(2)
+    slot, value = computation.stack_pop2_ints()
 
     current_value = computation.state.get_storage(
         address=computation.msg.storage_address,
@@ -87,7 +87,7 @@ def net_sstore(gas_schedule: NetSStoreGasSchedule, computation: ComputationAPI)
     """
     :return slot: where the new value was stored
     """
-    slot, value = computation.stack_pop_ints(2)
+    slot, value = computation.stack_pop2_ints()
 
     current_value = computation.state.get_storage(
         address=computation.msg.storage_address,
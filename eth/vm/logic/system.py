@@ -38,20 +38,21 @@ from .call import (
 
 
 def return_op(computation: ComputationAPI) -> None:
-    start_position, size = computation.stack_pop_ints(2)
+    start_position, size = computation.stack_pop2_ints()
 
     computation.extend_memory(start_position, size)
 
-    computation.output = computation.memory_read_bytes(start_position, size)
+    # a view, as memory is no longer written to once the computation halts
+    computation.output = computation.memory_read(start_position, size)
     raise Halt("RETURN")
 
 
 def revert(computation: ComputationAPI) -> None:
-    start_position, size = computation.stack_pop_ints(2)
+    start_position, size = computation.stack_pop2_ints()
 
     computation.extend_memory(start_position, size)
 
-    computation.output = computation.memory_read_bytes(start_position, size)
+    computation.output = computation.memory_read(start_position, size)
     raise Revert(computation.output)
 
 
@@ -147,7 +148,7 @@ class Create(Opcode):
         return contract_address
 
     def get_stack_data(self, computation: ComputationAPI) -> CreateOpcodeStackData:
-        endowment, memory_start, memory_length = computation.stack_pop_ints(3)
+        endowment, memory_start, memory_length = computation.stack_pop3_ints()
 
         return CreateOpcodeStackData(endowment, memory_start, memory_length)
 
@@ -6,8 +6,11 @@ from eth._utils.numeric import (
 from eth.abc import (
     MemoryAPI,
 )
+from eth.typing import (
+    BytesOrView,
+)
 from eth.validation import (
-    validate_is_bytes,
+    validate_is_bytes_or_view,
     validate_length,
     validate_lte,
     validate_uint256,
@@ -44,18 +47,86 @@ class Memory(MemoryAPI):
     def __len__(self) -> int:
         return len(self._bytes)
 
-    def write(self, start_position: int, size: int, value: bytes) -> None:
+    def write(self, start_position: int, size: int, value: BytesOrView) -> None:
         if size:
             validate_uint256(start_position)
             validate_uint256(size)
-            validate_is_bytes(value)
+            validate_is_bytes_or_view(value)
             validate_length(value, length=size)
             validate_lte(start_position + size, maximum=len(self))
 
             self._bytes[start_position : start_position + len(value)] = value
 
+    def write_unchecked(self, start_position: int, value: BytesOrView) -> None:
+        self._bytes[start_position : start_position + len(value)] = value
+
     def read(self, start_position: int, size: int) -> memoryview:
         return memoryview(self._bytes)[start_position : start_position + size]
 
     def read_bytes(self, start_position: int, size: int) -> bytes:
         return bytes(self._bytes[start_position : start_position + size])
+
+    def clear(self) -> None:
+        try:
+            del self._bytes[:]
+        except BufferError:
+            # a memoryview from read() still points into the buffer, so leave the
+            # buffer to the view and start a new one
+            self._bytes = bytearray()
+
+
+class PreallocatedMemory(Memory):
+    """
+    VM Memory that reserves capacity ahead of its size, growing it geometrically.
+
+    Only the logical size, which is what MSIZE and the memory expansion gas see, grows
+    by exactly what each expansion asks for. Every byte past the logical size is
+    still zero, since writes never go past it.
+    """
+
+    __slots__ = ["_size"]
+    logger = logging.getLogger("eth.vm.memory.PreallocatedMemory")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._size = 0
+
+    def extend(self, start_position: int, size: int) -> None:
+        if size == 0:
+            return
+
+        new_size = ceil32(start_position + size)
+        if new_size <= self._size:
+            return
+
+        capacity = len(self._bytes)
+        if new_size > capacity:
+            new_capacity = max(new_size, capacity * 2)
+            try:
+                self._bytes.extend(bytearray(new_capacity - capacity))
+            except BufferError:
+                # A memoryview created by read() is holding on to the buffer, see
+                # Memory.extend(). Only the logical size needs copying, and growing
+                # geometrically means this happens at most a logarithmic number of
+                # times, instead of on every expansion.
+                new_bytes = bytearray(new_capacity)
+                new_bytes[: self._size] = memoryview(self._bytes)[: self._size]
+                self._bytes = new_bytes
+
+        self._size = new_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        try:
+            # resizing fails if a memoryview from read() still points into the
+            # buffer, which must then keep its contents
+            self._bytes.append(0)
+        except BufferError:
+            self._bytes = bytearray()
+        else:
+            del self._bytes[-1]
+            # keep the reserved capacity, zeroed again
+            self._bytes[: self._size] = bytearray(self._size)
+        self._size = 0
@@ -5,6 +5,9 @@ from typing import (
     TypeVar,
 )
 
+from cached_property import (
+    cached_property,
+)
 from eth_utils import (
     ExtendedDebugLogger,
     get_extended_debug_logger,
@@ -55,7 +58,7 @@ class Opcode(Configurable, OpcodeAPI):
         if self.gas_cost is None:
             raise TypeError(f"Opcode class {type(self)} missing opcode gas_cost")
 
-    @property
+    @cached_property
     def logger(self) -> ExtendedDebugLogger:
         return get_extended_debug_logger(f"eth.vm.logic.{self.mnemonic}")
 
@@ -0,0 +1,74 @@
+from concurrent.futures import (
+    Executor,
+)
+from typing import (
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from eth_keys.datatypes import (
+    PublicKey,
+)
+from eth_utils import (
+    ValidationError,
+)
+
+from eth._utils.ecrecover import (
+    SignatureKey,
+    get_signature_key,
+    map_signature_checks,
+    recovery_cache,
+)
+from eth.abc import (
+    SignedTransactionAPI,
+    TransactionPrevalidation,
+)
+
+# The public key recovered by a prevalidation, to add to the recovery cache of the
+# process that asked for it
+RecoveredPublicKey = Tuple[SignatureKey, bytes]
+
+
+def _prevalidate_transaction(
+    transaction: SignedTransactionAPI,
+) -> Tuple[TransactionPrevalidation, Optional[RecoveredPublicKey]]:
+    # Runs in the worker processes, so it only takes and returns picklable values
+    intrinsic_gas = transaction.intrinsic_gas
+    try:
+        transaction.validate()
+    except ValidationError as error:
+        return TransactionPrevalidation(intrinsic_gas, error), None
+
+    # validating the signature recovered the public key, so this is a cache hit
+    signature_key = get_signature_key(transaction)
+    public_key = recovery_cache.recover_public_key(*signature_key)
+    return (
+        TransactionPrevalidation(intrinsic_gas, None),
+        (signature_key, public_key.to_bytes()),
+    )
+
+
+def prevalidate_transactions(
+    transactions: Sequence[SignedTransactionAPI],
+    executor: Executor = None,
+) -> Dict[SignedTransactionAPI, TransactionPrevalidation]:
+    """
+    Run the checks of ``transactions`` that do not depend on the state, including
+    the recovery of their senders, with
+    :func:`~eth._utils.ecrecover.map_signature_checks`.
+
+    Return the outcome of the checks of each transaction. The recovered senders are
+    added to the recovery cache.
+    """
+    prevalidations = {}
+    outcomes = map_signature_checks(_prevalidate_transaction, transactions, executor)
+    for transaction, (prevalidation, recovered) in zip(transactions, outcomes):
+        prevalidations[transaction] = prevalidation
+        if recovered is not None:
+            signature_key, public_key_bytes = recovered
+            if signature_key not in recovery_cache:
+                recovery_cache.add(signature_key, PublicKey(public_key_bytes))
+
+    return prevalidations
@@ -0,0 +1,219 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from eth_hash.auto import (
+    keccak,
+)
+from eth_typing import (
+    Hash32,
+)
+from eth_utils import (
+    encode_hex,
+)
+from lru import (
+    LRU,
+)
+
+from eth.abc import (
+    ComputationAPI,
+)
+
+# (executions, wall time in ns, gas)
+OpcodeStats = List[int]
+
+TKey = TypeVar("TKey")
+
+CODE_HASH_CACHE_SIZE = 1024
+
+
+class ProfiledFrame:
+    """
+    Bookkeeping for a single computation run by the profiler.
+
+    Opcodes are counted by position only while the computation runs, and merged into
+    the totals of the profiler once it is done, to keep the cost per opcode low.
+
+    ``nested_ns`` and ``nested_gas`` are the totals spent in the computations nested
+    in this one so far, which are left out of the numbers of the opcode that made the
+    call, so that every opcode is only charged for its own time and gas.
+
+    ``error_pc`` is the position of the opcode that failed with a VM error, if any,
+    which is also charged the gas that the error burns.
+    """
+
+    __slots__ = [
+        "code_hash",
+        "call_path",
+        "pc_stats",
+        "nested_ns",
+        "nested_gas",
+        "error_pc",
+    ]
+
+    def __init__(self, code_hash: Hash32, call_path: Tuple[str, ...]) -> None:
+        self.code_hash = code_hash
+        self.call_path = call_path
+        self.pc_stats: Dict[int, Tuple[str, OpcodeStats]] = {}
+        self.nested_ns = 0
+        self.nested_gas = 0
+        self.error_pc: Optional[int] = None
+
+    def record_opcode(self, pc: int, mnemonic: str, elapsed_ns: int, gas: int) -> None:
+        try:
+            _, stats = self.pc_stats[pc]
+        except KeyError:
+            self.pc_stats[pc] = (mnemonic, [1, elapsed_ns, gas])
+        else:
+            stats[0] += 1
+            stats[1] += elapsed_ns
+            stats[2] += gas
+
+
+class ExecutionProfiler:
+    """
+    Count the executions, wall time and gas of every opcode that computations run,
+    by opcode mnemonic, by position in a contract, and by call path.
+
+    Each opcode is charged its own time and gas only: the time and gas of a nested
+    call go to the opcodes of the called contract, not to the ``CALL``.
+    """
+
+    def __init__(self) -> None:
+        self.opcode_stats: Dict[str, OpcodeStats] = {}
+        self.hotspot_stats: Dict[Tuple[Hash32, int], OpcodeStats] = {}
+        self.stack_stats: Dict[Tuple[Tuple[str, ...], str], OpcodeStats] = {}
+        self._frames: List[ProfiledFrame] = []
+        self._code_hashes: "LRU[bytes, Hash32]" = LRU(CODE_HASH_CACHE_SIZE)
+
+    #
+    # Recording, driven by the computation
+    #
+    def start_computation(self, computation: ComputationAPI) -> ProfiledFrame:
+        code = computation.msg.code
+        try:
+            code_hash = self._code_hashes[code]
+        except KeyError:
+            code_hash = self._code_hashes[code] = Hash32(keccak(code))
+
+        address = encode_hex(computation.msg.code_address)
+        if self._frames:
+            call_path = self._frames[-1].call_path + (address,)
+        else:
+            call_path = (address,)
+
+        frame = ProfiledFrame(code_hash, call_path)
+        self._frames.append(frame)
+        return frame
+
+    def end_computation(self, frame: ProfiledFrame, total_ns: int, gas: int) -> None:
+        """
+        Record that the computation of ``frame`` took ``total_ns`` and used ``gas``,
+        including everything nested in it and the gas burned by an error.
+        """
+        self._frames.pop()
+        if self._frames:
+            caller_frame = self._frames[-1]
+            caller_frame.nested_ns += total_ns
+            caller_frame.nested_gas += gas
+
+        if frame.error_pc is not None:
+            _, error_stats = frame.pc_stats[frame.error_pc]
+            error_stats[2] += (
+                gas
+                - frame.nested_gas
+                - sum(stats[2] for _, stats in frame.pc_stats.values())
+            )
+
+        code_hash = frame.code_hash
+        call_path = frame.call_path
+        for pc, (mnemonic, stats) in frame.pc_stats.items():
+            _add_stats(self.opcode_stats, mnemonic, stats)
+            _add_stats(self.hotspot_stats, (code_hash, pc), stats)
+            _add_stats(self.stack_stats, (call_path, mnemonic), stats)
+
+    def reset(self) -> None:
+        self.opcode_stats.clear()
+        self.hotspot_stats.clear()
+        self.stack_stats.clear()
+
+    #
+    # Reporting
+    #
+    def format_opcode_table(self, count: int = 20) -> str:
+        """
+        Return a table of the ``count`` opcodes that took the most time.
+        """
+        return _format_table(
+            "Opcode",
+            ((mnemonic, stats) for mnemonic, stats in self.opcode_stats.items()),
+            count,
+        )
+
+    def format_hotspot_table(self, count: int = 20) -> str:
+        """
+        Return a table of the ``count`` positions in contract code that took the
+        most time, as ``code_hash:pc``.
+        """
+        return _format_table(
+            "Code hash:pc",
+            (
+                (f"{encode_hex(code_hash)}:{pc}", stats)
+                for (code_hash, pc), stats in self.hotspot_stats.items()
+            ),
+            count,
+        )
+
+    def iter_collapsed_stacks(self) -> Iterable[str]:
+        """
+        Yield the time spent in each opcode under each call path as lines of
+        collapsed stacks, like ``0xaa..;0xcc..;SSTORE 12345``, with the time in ns.
+        The frames are the addresses of the contracts on the call path, so their
+        position is the call depth. Feed the lines to ``flamegraph.pl``.
+        """
+        for (call_path, mnemonic), stats in self.stack_stats.items():
+            yield f"{';'.join(call_path)};{mnemonic} {stats[1]}"
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        with open(path, "w") as collapsed_file:
+            for line in self.iter_collapsed_stacks():
+                collapsed_file.write(line + "\n")
+
+
+def _add_stats(
+    stats_by_key: Dict[TKey, OpcodeStats], key: TKey, stats: OpcodeStats
+) -> None:
+    try:
+        total_stats = stats_by_key[key]
+    except KeyError:
+        stats_by_key[key] = list(stats)
+    else:
+        total_stats[0] += stats[0]
+        total_stats[1] += stats[1]
+        total_stats[2] += stats[2]
+
+
+def _format_table(
+    caption: str,
+    rows: Iterable[Tuple[str, OpcodeStats]],
+    count: int,
+) -> str:
+    sorted_rows = sorted(rows, key=lambda row: row[1][1], reverse=True)
+    total_ns = sum(stats[1] for _, stats in sorted_rows) or 1
+
+    lines = [
+        f"{caption:<80}  {'Executions':>12}  {'Time (ms)':>12}  {'Avg (ns)':>10}"
+        f"  {'Time %':>7}  {'Gas':>14}"
+    ]
+    for key, (executions, elapsed_ns, gas) in sorted_rows[:count]:
+        lines.append(
+            f"{key:<80}  {executions:>12}  {elapsed_ns / 1e6:>12.3f}"
+            f"  {elapsed_ns // executions:>10}  {elapsed_ns / total_ns:>7.1%}"
+            f"  {gas:>14}"
+        )
+    return "\n".join(lines)
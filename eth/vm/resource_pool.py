@@ -0,0 +1,79 @@
+from typing import (
+    Dict,
+    List,
+    Type,
+    Union,
+    cast,
+)
+
+from eth.abc import (
+    MemoryAPI,
+    ResourcePoolAPI,
+    StackAPI,
+    TResource,
+)
+
+
+class ResourcePoolStats:
+    """
+    Count the stacks and memories that computations allocated, and the ones they
+    reused from a :class:`ComputationResourcePool` instead.
+    """
+
+    __slots__ = ["allocated", "reused"]
+
+    def __init__(self) -> None:
+        self.allocated = 0
+        self.reused = 0
+
+    @property
+    def allocation_savings(self) -> float:
+        """
+        The fraction of acquired stacks and memories that did not need allocating.
+        """
+        acquired = self.allocated + self.reused
+        if acquired:
+            return self.reused / acquired
+        else:
+            return 0.0
+
+    def reset(self) -> None:
+        self.allocated = 0
+        self.reused = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ResourcePoolStats(allocated={self.allocated}, reused={self.reused}, "
+            f"allocation_savings={self.allocation_savings:.1%})"
+        )
+
+
+class ComputationResourcePool(ResourcePoolAPI):
+    """
+    Per-transaction pool of the stacks and memories of finished child computations.
+
+    A parent computation releases the stack and memory of each child once the child
+    returns, and the next child created in the same transaction acquires them instead
+    of allocating new ones.
+    """
+
+    __slots__ = ["_released"]
+
+    # Totals across all the pools, to show how many allocations pooling saves
+    stats = ResourcePoolStats()
+
+    def __init__(self) -> None:
+        self._released: Dict[type, List[Union[StackAPI, MemoryAPI]]] = {}
+
+    def acquire(self, resource_class: Type[TResource]) -> TResource:
+        released = self._released.get(resource_class)
+        if released:
+            self.stats.reused += 1
+            return cast(TResource, released.pop())
+        else:
+            self.stats.allocated += 1
+            return resource_class()
+
+    def release(self, resource: TResource) -> None:
+        resource.clear()
+        self._released.setdefault(type(resource), []).append(resource)
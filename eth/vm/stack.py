@@ -117,6 +117,36 @@ class Stack(StackAPI):
     def pop_ints(self, num_items: int) -> Tuple[int, ...]:
         return tuple(to_int(x) for x in self.pop_any(num_items))
 
+    def pop2_ints(self) -> Tuple[int, int]:
+        #
+        # Note: This function is optimized for speed over readability.
+        # Popping a fixed number of items avoids the slicing and the generator
+        # of pop_ints().
+        #
+        if len(self.values) < 2:
+            raise InsufficientStack(
+                "Wanted %d stack items, only had %d",
+                2,
+                len(self.values),
+            )
+
+        pop = self._pop
+        return to_int(pop()), to_int(pop())
+
+    def pop3_ints(self) -> Tuple[int, int, int]:
+        #
+        # Note: This function is optimized for speed over readability.
+        #
+        if len(self.values) < 3:
+            raise InsufficientStack(
+                "Wanted %d stack items, only had %d",
+                3,
+                len(self.values),
+            )
+
+        pop = self._pop
+        return to_int(pop()), to_int(pop()), to_int(pop())
+
     def pop_bytes(self, num_items: int) -> Tuple[bytes, ...]:
         return tuple(to_bytes(x) for x in self.pop_any(num_items))
 
@@ -136,6 +166,9 @@ class Stack(StackAPI):
         except IndexError:
             raise InsufficientStack(f"Insufficient stack items for DUP{position}")
 
+    def clear(self) -> None:
+        self.values.clear()
+
     def _stack_items_str(self) -> Iterable[str]:
         for val in self.values:
             if isinstance(val, int):
@@ -151,6 +184,31 @@ class Stack(StackAPI):
         return str(list(self._stack_items_str()))
 
 
+class UncheckedStack(Stack):
+    """
+    VM Stack that skips validating the type and range of every pushed value.
+
+    Opcode logic only ever pushes 256 bit integers and 32 byte strings, so the
+    validation of :class:`Stack` only catches bugs in the VM itself. The stack
+    limit is still enforced, since that is part of the EVM rules.
+    """
+
+    __slots__: List[str] = []
+    logger = logging.getLogger("eth.vm.stack.UncheckedStack")
+
+    def push_int(self, value: int) -> None:
+        if len(self.values) > 1023:
+            raise FullStack("Stack limit reached")
+
+        self._append(value)
+
+    def push_bytes(self, value: bytes) -> None:
+        if len(self.values) > 1023:
+            raise FullStack("Stack limit reached")
+
+        self._append(value)
+
+
 def to_int(x: Any) -> int:
     if isinstance(x, int):
         return x
@@ -1,6 +1,11 @@
+from concurrent.futures import (
+    Executor,
+)
 import contextlib
 from typing import (
+    Dict,
     Iterator,
+    Optional,
     Sequence,
     Tuple,
     Type,
@@ -33,6 +38,8 @@ from eth.abc import (
     StateAPI,
     TransactionContextAPI,
     TransactionExecutorAPI,
+    TransactionPrevalidation,
+    WarmStateCacheAPI,
     WithdrawalAPI,
 )
 from eth.constants import (
@@ -41,13 +48,22 @@ from eth.constants import (
 from eth.typing import (
     JournalDBCheckpoint,
 )
+from eth.vm.prevalidation import (
+    prevalidate_transactions,
+)
 
 
 class BaseState(Configurable, StateAPI):
     #
     # Set from __init__
     #
-    __slots__ = ["_db", "execution_context", "_account_db"]
+    __slots__ = [
+        "_db",
+        "execution_context",
+        "_account_db",
+        "_transaction_prevalidations",
+        "tracer",
+    ]
 
     computation_class: Type[ComputationAPI] = None
     transaction_context_class: Type[TransactionContextAPI] = None
@@ -59,10 +75,21 @@ class BaseState(Configurable, StateAPI):
         db: AtomicDatabaseAPI,
         execution_context: ExecutionContextAPI,
         state_root: Hash32,
+        warm_state_cache: WarmStateCacheAPI = None,
     ) -> None:
         self._db = db
         self.execution_context = execution_context
-        self._account_db = self.get_account_db_class()(db, state_root)
+        # Account database classes that predate the warm state cache do not take it
+        if warm_state_cache is None:
+            self._account_db = self.get_account_db_class()(db, state_root)
+        else:
+            self._account_db = self.get_account_db_class()(
+                db, state_root, warm_state_cache
+            )
+        self._transaction_prevalidations: Dict[
+            SignedTransactionAPI, TransactionPrevalidation
+        ] = {}
+        self.tracer = None
 
     #
     # Logging
@@ -275,6 +302,23 @@ class BaseState(Configurable, StateAPI):
     def get_transaction_executor(self) -> TransactionExecutorAPI:
         return self.transaction_executor_class(self)
 
+    def prevalidate_transactions(
+        self,
+        transactions: Sequence[SignedTransactionAPI],
+        executor: Executor = None,
+    ) -> None:
+        self._transaction_prevalidations = prevalidate_transactions(
+            transactions, executor
+        )
+
+    def get_transaction_prevalidation(
+        self, transaction: SignedTransactionAPI
+    ) -> Optional[TransactionPrevalidation]:
+        return self._transaction_prevalidations.get(transaction)
+
+    def clear_transaction_prevalidations(self) -> None:
+        self._transaction_prevalidations = {}
+
     def costless_execute_transaction(
         self, transaction: SignedTransactionAPI
     ) -> ComputationAPI:
@@ -0,0 +1,309 @@
+from collections import (
+    Counter,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from eth_utils import (
+    big_endian_to_int,
+)
+
+from eth import (
+    constants,
+)
+from eth.abc import (
+    ComputationAPI,
+    OpcodeAPI,
+)
+from eth.vm.logic import (
+    arithmetic,
+    comparison,
+    duplication,
+    flow,
+    swap,
+)
+from eth.vm.opcode import (
+    _FastOpcode,
+)
+from eth.vm.opcode_values import (
+    PUSH1,
+    PUSH32,
+)
+
+if TYPE_CHECKING:
+    from eth.vm.code_analysis import AnalyzedCode  # noqa: F401
+
+# (position, opcode, immediate, next_pc) of each opcode in a fused sequence
+FusedStep = Tuple[int, OpcodeAPI, Optional[bytes], int]
+
+
+#
+# Fused logic. Each function gets the computation and the argument decoded from
+# the sequence at analysis time, such as the value of a PUSH_.
+#
+def push_jump(computation: ComputationAPI, jump_dest: int) -> None:
+    flow.jump_to(computation, jump_dest)
+
+
+def push_jumpi(computation: ComputationAPI, jump_dest: int) -> None:
+    if computation.stack_pop1_int():
+        flow.jump_to(computation, jump_dest)
+
+
+def iszero_push_jumpi(computation: ComputationAPI, jump_dest: int) -> None:
+    if computation.stack_pop1_int() == 0:
+        flow.jump_to(computation, jump_dest)
+
+
+def push_add(computation: ComputationAPI, value: int) -> None:
+    result = (computation.stack_pop1_int() + value) & constants.UINT_256_MAX
+
+    computation.stack_push_int(result)
+
+
+def dup_swap(computation: ComputationAPI, positions: Tuple[int, int]) -> None:
+    dup_position, swap_position = positions
+    computation.stack_dup(dup_position)
+    computation.stack_swap(swap_position)
+
+
+class FusedOpcode:
+    """
+    A superinstruction: a fixed sequence of opcodes run as a single instruction,
+    charging their summed static gas at once.
+
+    Fused opcodes are not opcodes of a fork: they are only built by code analysis,
+    which runs them in place of the first opcode of their sequence.
+
+    When the gas or the stack height could make any opcode in the sequence fail,
+    the opcodes are charged and run one at a time instead, so that failures are
+    exactly the same as without fusion.
+    """
+
+    __slots__ = (
+        "mnemonic",
+        "gas_cost",
+        "fused_fn",
+        "argument",
+        "next_pc",
+        "min_stack_size",
+        "max_stack_size",
+        "steps",
+    )
+
+    def __init__(
+        self,
+        fused_fn: Callable[[ComputationAPI, Any], None],
+        argument: Any,
+        steps: Sequence[FusedStep],
+        min_stack_size: int,
+        max_stack_size: int,
+    ) -> None:
+        fast_opcodes = [cast(_FastOpcode, opcode_fn) for _, opcode_fn, _, _ in steps]
+        self.mnemonic = "+".join(opcode.mnemonic for opcode in fast_opcodes)
+        self.gas_cost = sum(opcode.gas_cost for opcode in fast_opcodes)
+        self.fused_fn = fused_fn
+        self.argument = argument
+        self.next_pc = steps[-1][3]
+        self.min_stack_size = min_stack_size
+        self.max_stack_size = max_stack_size
+        self.steps = tuple(steps)
+
+    def __call__(self, computation: ComputationAPI) -> None:
+        # Stack sizes itself through a slot, which StackAPI does not declare
+        stack_size = len(computation._stack)  # type: ignore
+        if (
+            self.gas_cost <= computation._gas_meter.gas_remaining
+            and self.min_stack_size <= stack_size <= self.max_stack_size
+        ):
+            computation.consume_gas(self.gas_cost, self.mnemonic)
+            computation.code.program_counter = self.next_pc
+            self.fused_fn(computation, self.argument)
+        else:
+            code = computation.code
+            for position, opcode_fn, immediate, next_pc in self.steps:
+                code.program_counter = position + 1
+                if immediate is None:
+                    opcode_fn(computation=computation)
+                else:
+                    push_opcode = cast(_FastOpcode, opcode_fn)
+                    computation.consume_gas(push_opcode.gas_cost, push_opcode.mnemonic)
+                    code.program_counter = next_pc
+                    computation.stack_push_bytes(immediate)
+
+
+# What analyzed code runs at each position: an opcode, or a superinstruction
+Instruction = Union[OpcodeAPI, FusedOpcode]
+
+
+#
+# Fusion patterns
+#
+# Each pattern gets the steps starting at a position, and returns a fused opcode
+# for the steps at the start of the sequence it matches, or None.
+#
+_MAX_STACK_SIZE = 1024
+
+_DUP_LOGIC_FNS = {getattr(duplication, f"dup{n}"): n for n in range(1, 17)}
+_SWAP_LOGIC_FNS = {getattr(swap, f"swap{n}"): n for n in range(1, 17)}
+
+
+def _logic_fn(step: FusedStep) -> Optional[Callable[..., Any]]:
+    opcode_fn = step[1]
+    if isinstance(opcode_fn, _FastOpcode) and step[2] is None:
+        return opcode_fn.logic_fn
+    else:
+        return None
+
+
+def _push_value(step: FusedStep) -> Optional[int]:
+    immediate = step[2]
+    if immediate is None:
+        return None
+    else:
+        return big_endian_to_int(immediate)
+
+
+def _fuse_push_jump(steps: Sequence[FusedStep]) -> Optional[FusedOpcode]:
+    if len(steps) < 2:
+        return None
+    jump_dest = _push_value(steps[0])
+    if jump_dest is None:
+        return None
+    elif _logic_fn(steps[1]) is flow.jump:
+        return FusedOpcode(push_jump, jump_dest, steps[:2], 0, _MAX_STACK_SIZE - 1)
+    elif _logic_fn(steps[1]) is flow.jumpi:
+        return FusedOpcode(push_jumpi, jump_dest, steps[:2], 1, _MAX_STACK_SIZE - 1)
+    else:
+        return None
+
+
+def _fuse_iszero_push_jumpi(steps: Sequence[FusedStep]) -> Optional[FusedOpcode]:
+    if len(steps) < 3 or _logic_fn(steps[0]) is not comparison.iszero:
+        return None
+    jump_dest = _push_value(steps[1])
+    if jump_dest is None or _logic_fn(steps[2]) is not flow.jumpi:
+        return None
+    return FusedOpcode(iszero_push_jumpi, jump_dest, steps[:3], 1, _MAX_STACK_SIZE - 1)
+
+
+def _fuse_push_add(steps: Sequence[FusedStep]) -> Optional[FusedOpcode]:
+    if len(steps) < 2:
+        return None
+    value = _push_value(steps[0])
+    if value is None or _logic_fn(steps[1]) is not arithmetic.add:
+        return None
+    return FusedOpcode(push_add, value, steps[:2], 1, _MAX_STACK_SIZE - 1)
+
+
+def _fuse_dup_swap(steps: Sequence[FusedStep]) -> Optional[FusedOpcode]:
+    if len(steps) < 2:
+        return None
+    dup_position = _DUP_LOGIC_FNS.get(_logic_fn(steps[0]))
+    swap_position = _SWAP_LOGIC_FNS.get(_logic_fn(steps[1]))
+    if dup_position is None or swap_position is None:
+        return None
+    return FusedOpcode(
+        dup_swap,
+        (dup_position, swap_position),
+        steps[:2],
+        # DUPn needs n items, then SWAPm needs m + 1 items after the DUP
+        max(dup_position, swap_position),
+        _MAX_STACK_SIZE - 1,
+    )
+
+
+FUSION_PATTERNS: Tuple[Callable[[Sequence[FusedStep]], Optional[FusedOpcode]], ...] = (
+    _fuse_iszero_push_jumpi,
+    _fuse_push_jump,
+    _fuse_push_add,
+    _fuse_dup_swap,
+)
+
+# The longest sequence any of the patterns fuse
+MAX_FUSED_LENGTH = 3
+
+
+def fuse_superinstructions(analyzed_code: "AnalyzedCode") -> None:
+    """
+    Replace the opcode at every position that starts a known sequence with the
+    fused opcode for the sequence, in place.
+
+    Only the entry for the first position of a sequence changes, so execution that
+    jumps into the middle of a sequence still runs the original opcodes.
+    """
+    code_length = analyzed_code.code_length
+    opcode_fns = analyzed_code.opcode_fns
+    immediates = analyzed_code.immediates
+    next_pcs = analyzed_code.next_pcs
+
+    for position in range(code_length):
+        steps: List[FusedStep] = []
+        pc = position
+        while pc < code_length and len(steps) < MAX_FUSED_LENGTH:
+            # only the positions before this one are fused yet
+            opcode_fn = cast(OpcodeAPI, opcode_fns[pc])
+            steps.append((pc, opcode_fn, immediates[pc], next_pcs[pc]))
+            pc = next_pcs[pc]
+
+        for pattern in FUSION_PATTERNS:
+            fused_opcode = pattern(steps)
+            if fused_opcode is not None:
+                opcode_fns[position] = fused_opcode
+                immediates[position] = None
+                next_pcs[position] = fused_opcode.next_pc
+                break
+
+
+class OpcodeNGramProfiler:
+    """
+    Count how often each sequence of consecutive opcodes runs, to find the
+    sequences worth fusing into superinstructions.
+
+    Only opcodes that follow each other in the code are counted together: a taken
+    jump starts a new sequence.
+    """
+
+    def __init__(self, max_length: int = 4) -> None:
+        self.max_length = max_length
+        self.counts: "Counter[Tuple[str, ...]]" = Counter()
+
+    def record_trace(self, trace: Sequence[Tuple[int, int, str]]) -> None:
+        """
+        Count the n-grams in a trace of ``(pc, opcode, mnemonic)`` of the opcodes
+        run by a single computation, in the order they ran.
+        """
+        run: List[str] = []
+        expected_pc = None
+        for pc, opcode, mnemonic in trace:
+            if pc != expected_pc:
+                run = []
+            run.append(mnemonic)
+            for length in range(2, min(len(run), self.max_length) + 1):
+                self.counts[tuple(run[-length:])] += 1
+
+            if PUSH1 <= opcode <= PUSH32:
+                expected_pc = pc + opcode - PUSH1 + 2
+            else:
+                expected_pc = pc + 1
+
+    def most_common(self, count: int = 20) -> List[Tuple[Tuple[str, ...], int]]:
+        return self.counts.most_common(count)
+
+    def format_report(self, count: int = 20) -> str:
+        lines = [f"{'Executions':>12}  Opcodes"]
+        for ngram, executions in self.most_common(count):
+            lines.append(f"{executions:>12}  {' '.join(ngram)}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        self.counts.clear()
@@ -0,0 +1,72 @@
+import json
+from typing import (
+    Any,
+    Dict,
+    TextIO,
+)
+
+from eth_utils import (
+    encode_hex,
+)
+
+from eth.abc import (
+    ComputationAPI,
+    TracerAPI,
+    TraceStep,
+)
+
+
+class JSONLinesTracer(TracerAPI):
+    """
+    Write every step to ``stream`` as a line of JSON, in the format of EIP-3155, as
+    soon as it runs. A summary line follows once the outermost computation is done.
+
+    The stack and the memory are only written if ``capture_stack`` and
+    ``capture_memory`` are set, since both can be large for every step of a block.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        capture_stack: bool = False,
+        capture_memory: bool = False,
+    ) -> None:
+        self.stream = stream
+        self.capture_stack = capture_stack
+        self.capture_memory = capture_memory
+
+    def on_step(self, step: TraceStep) -> None:
+        line: Dict[str, Any] = {
+            "pc": step.pc,
+            "op": step.op,
+            "gas": hex(step.gas),
+            "gasCost": hex(step.gas_cost),
+            "memSize": step.memory_size,
+        }
+        if step.stack is not None:
+            line["stack"] = [hex(value) for value in step.stack]
+        if step.memory is not None:
+            line["memory"] = encode_hex(step.memory)
+        line["depth"] = step.depth
+        line["refund"] = step.refund
+        line["opName"] = step.op_name
+
+        self._write_line(line)
+
+    def on_computation_end(self, computation: ComputationAPI) -> None:
+        if computation.msg.depth > 0:
+            return
+
+        summary: Dict[str, Any] = {
+            "output": computation.output.hex(),
+            "gasUsed": hex(computation.get_gas_used()),
+            "pass": computation.is_success,
+        }
+        if computation.is_error:
+            summary["error"] = str(computation.error)
+
+        self._write_line(summary)
+
+    def _write_line(self, line: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(line, separators=(",", ":")))
+        self.stream.write("\n")
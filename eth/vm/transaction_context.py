@@ -5,16 +5,20 @@ from eth_typing import (
 )
 
 from eth.abc import (
+    ResourcePoolAPI,
     TransactionContextAPI,
 )
 from eth.validation import (
     validate_canonical_address,
     validate_uint256,
 )
+from eth.vm.resource_pool import (
+    ComputationResourcePool,
+)
 
 
 class BaseTransactionContext(TransactionContextAPI):
-    __slots__ = ["_gas_price", "_origin", "_log_counter"]
+    __slots__ = ["_gas_price", "_origin", "_log_counter", "_resource_pool"]
 
     def __init__(self, gas_price: int, origin: Address) -> None:
         validate_uint256(gas_price, title="TransactionContext.gas_price")
@@ -22,6 +26,7 @@ class BaseTransactionContext(TransactionContextAPI):
         validate_canonical_address(origin, title="TransactionContext.origin")
         self._origin = origin
         self._log_counter = itertools.count()
+        self._resource_pool: ResourcePoolAPI = None
 
     def get_next_log_counter(self) -> int:
         return next(self._log_counter)
@@ -33,3 +38,9 @@ class BaseTransactionContext(TransactionContextAPI):
     @property
     def origin(self) -> Address:
         return self._origin
+
+    @property
+    def resource_pool(self) -> ResourcePoolAPI:
+        if self._resource_pool is None:
+            self._resource_pool = ComputationResourcePool()
+        return self._resource_pool
@@ -0,0 +1,74 @@
+import logging
+from typing import (
+    Sequence,
+)
+
+from _utils.reporting import (
+    DefaultStat,
+)
+
+from eth._utils.blake2.compression import (
+    Blake2b,
+)
+from eth.precompiles.blake2 import (
+    GAS_COST_PER_ROUND,
+    blake2b_compress,
+)
+
+from .base_benchmark import (
+    BaseBenchmark,
+)
+
+H_STARTING_STATE = (Blake2b.IV[0] ^ 0x01010040,) + Blake2b.IV[1:]
+BLOCK = tuple(range(16))
+T_OFFSET_COUNTERS = (128, 0)
+
+
+class Blake2CompressBenchmark(BaseBenchmark):
+    """
+    Time the BLAKE2 F compression of the precompile, with the compiled backend if it
+    is installed, for growing numbers of rounds, to show the cost per round.
+    """
+
+    def __init__(
+        self, round_counts: Sequence[int] = (12, 1000, 100000), num_runs: int = 3
+    ) -> None:
+        self.round_counts = round_counts
+        self.num_runs = num_runs
+
+    @property
+    def name(self) -> str:
+        return "BLAKE2 F compression"
+
+    def execute(self) -> DefaultStat:
+        total_stat = DefaultStat()
+        logging.info(f"Backend: {blake2b_compress.__module__}")
+
+        for num_rounds in self.round_counts:
+            # the fastest run is the one least disturbed by everything else
+            value = min(
+                (
+                    self.as_timed_result(
+                        lambda num_rounds=num_rounds: self.compress(num_rounds)
+                    )
+                    for _ in range(self.num_runs)
+                ),
+                key=lambda timed_result: timed_result.duration,
+            )
+
+            stat = DefaultStat(
+                caption=f"{num_rounds} rounds",
+                total_seconds=value.duration,
+                total_gas=num_rounds * GAS_COST_PER_ROUND,
+            )
+            total_stat = total_stat.cumulate(stat)
+            self.print_stat_line(stat)
+            ns_per_round = value.duration / num_rounds * 1e9
+            logging.info(f"{num_rounds} rounds: {ns_per_round:.1f} ns / round")
+
+        return total_stat
+
+    def compress(self, num_rounds: int) -> bytes:
+        return blake2b_compress(
+            num_rounds, H_STARTING_STATE, BLOCK, T_OFFSET_COUNTERS, True
+        )
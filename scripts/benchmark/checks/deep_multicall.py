@@ -0,0 +1,136 @@
+import logging
+
+from _utils.chain_plumbing import (
+    FUNDED_ADDRESS,
+)
+from _utils.reporting import (
+    DefaultStat,
+)
+from eth_typing import (
+    Address,
+)
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.abc import (
+    StateAPI,
+)
+from eth.chains.mainnet import (
+    MAINNET_VMS,
+)
+from eth.consensus import (
+    ConsensusContext,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.chain import (
+    ChainDB,
+)
+from eth.vm.chain_context import (
+    ChainContext,
+)
+from eth.vm.message import (
+    Message,
+)
+
+from .base_benchmark import (
+    BaseBenchmark,
+)
+
+# CALLDATACOPY all the call data to memory at 0, RETURN it
+ECHO_CODE = "0x366000600037366000f3"
+
+RELAY_CODE_TEMPLATE = (
+    # CALLDATACOPY all the call data to memory at 0
+    "0x366000600037"
+    # CALL the next contract with it, with all the gas
+    "60006000366000600073{}5af150"
+    # RETURNDATACOPY what it returned to memory at 0, and RETURN that
+    "3d600060003e3d6000f3"
+)
+
+
+def _get_address(depth: int) -> Address:
+    # clear of the precompiles
+    return Address((0x10000 + depth).to_bytes(20, "big"))
+
+
+class DeepMulticallBenchmark(BaseBenchmark):
+    """
+    Time a chain of contracts that each pass all their call data on to the next,
+    and return what it returned, like nested multicalls with large batches, to show
+    the cost of moving call data and return data between frames.
+    """
+
+    def __init__(
+        self, depth: int = 16, data_size: int = 256 * 1024, num_runs: int = 3
+    ) -> None:
+        self.depth = depth
+        self.data_size = data_size
+        self.num_runs = num_runs
+
+    @property
+    def name(self) -> str:
+        return "Deep multicall"
+
+    def execute(self) -> DefaultStat:
+        vm_class = MAINNET_VMS[-1]
+        db = AtomicDB()
+        vm = vm_class(
+            vm_class.create_genesis_header(),
+            ChainDB(db),
+            ChainContext(1),
+            ConsensusContext(db),
+        )
+        state = vm.state
+        for depth in range(self.depth - 1):
+            relay_code = RELAY_CODE_TEMPLATE.format(_get_address(depth + 1).hex())
+            state.set_code(_get_address(depth), decode_hex(relay_code))
+        state.set_code(_get_address(self.depth - 1), decode_hex(ECHO_CODE))
+
+        # the fastest run is the one least disturbed by everything else
+        value = min(
+            (
+                self.as_timed_result(lambda: self.run_multicall(state))
+                for _ in range(self.num_runs)
+            ),
+            key=lambda timed_result: timed_result.duration,
+        )
+
+        stat = DefaultStat(
+            caption=f"{self.depth} frames",
+            total_seconds=value.duration,
+            total_gas=value.wrapped_value,
+        )
+        total_stat = DefaultStat().cumulate(stat)
+        self.print_stat_line(stat)
+
+        # every frame moves the data down and back up
+        megabytes = 2 * self.depth * self.data_size / 2**20
+        logging.info(f"{megabytes / value.duration:.1f} MiB passed between frames / s")
+        return total_stat
+
+    def run_multicall(self, state: StateAPI) -> int:
+        data = bytes(range(256)) * (self.data_size // 256)
+        message = Message(
+            to=_get_address(0),
+            sender=FUNDED_ADDRESS,
+            value=0,
+            data=data,
+            code=state.get_code(_get_address(0)),
+            gas=10**9,
+        )
+        transaction_context = state.get_transaction_context_class()(
+            gas_price=1,
+            origin=FUNDED_ADDRESS,
+        )
+
+        computation = state.computation_class.apply_computation(
+            state, message, transaction_context
+        )
+        computation.raise_if_error()
+        if computation.output != data:
+            raise Exception("Invariant: the data came back changed")
+        return computation.get_gas_used()
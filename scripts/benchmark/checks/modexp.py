@@ -0,0 +1,111 @@
+import json
+import logging
+from typing import (
+    Iterable,
+    Tuple,
+)
+
+from _utils.reporting import (
+    DefaultStat,
+)
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.precompiles.modexp import (
+    _modexp,
+)
+from eth.vm.forks.berlin.computation import (
+    _compute_modexp_gas_fee_eip_2565,
+)
+
+from .base_benchmark import (
+    BaseBenchmark,
+)
+
+# The vectors of EIP-2565, which are priced close to their cost
+VECTORS_FILE = "tests/core/vm/fixtures/modexp_precompile_test_vectors.json"
+
+# The gas that a single call to the precompile may be given
+GAS_LIMIT = 30_000_000
+
+
+def _encode_input(
+    base_length: int, exponent_length: int, modulus_length: int, arguments: bytes
+) -> bytes:
+    lengths = (base_length, exponent_length, modulus_length)
+    return b"".join(length.to_bytes(32, "big") for length in lengths) + arguments
+
+
+# Inputs that are expensive to read or to compute, beyond those of EIP-2565
+ADVERSARIAL_VECTORS = (
+    # declares arguments far longer than the call data, and runs out of gas
+    ("huge_lengths", _encode_input(2**32, 2**32, 2**32, b"\xff" * 64)),
+    # a long exponent with a power of two modulus
+    (
+        "power_of_two_modulus",
+        _encode_input(256, 1024, 256, b"\x03" * 256 + b"\xff" * 1024 + b"\x01"),
+    ),
+    # an exponent of one with a long modulus, priced at the minimum
+    (
+        "exponent_one",
+        _encode_input(512, 1, 512, b"\xfe" * 512 + b"\x01" + b"\xfd" * 512),
+    ),
+)
+
+
+def get_vectors() -> Iterable[Tuple[str, bytes]]:
+    with open(VECTORS_FILE) as vectors_file:
+        for vector in json.load(vectors_file):
+            yield vector["name"], decode_hex(vector["input"])
+    yield from ADVERSARIAL_VECTORS
+
+
+class ModexpBenchmark(BaseBenchmark):
+    """
+    Time the MODEXP precompile of Berlin, gas calculation included, on the vectors of
+    EIP-2565 and on some adversarial ones, to compare the time spent with the gas
+    charged.
+    """
+
+    def __init__(self, num_runs: int = 5) -> None:
+        self.num_runs = num_runs
+
+    @property
+    def name(self) -> str:
+        return "MODEXP precompile"
+
+    def execute(self) -> DefaultStat:
+        total_stat = DefaultStat()
+
+        for caption, data in get_vectors():
+            # the fastest run is the one least disturbed by everything else
+            value = min(
+                (
+                    self.as_timed_result(lambda data=data: self.run_modexp(data))
+                    for _ in range(self.num_runs)
+                ),
+                key=lambda timed_result: timed_result.duration,
+            )
+
+            stat = DefaultStat(
+                caption=caption,
+                total_seconds=value.duration,
+                total_gas=value.wrapped_value,
+            )
+            total_stat = total_stat.cumulate(stat)
+            self.print_stat_line(stat)
+
+        return total_stat
+
+    def run_modexp(self, data: bytes) -> int:
+        # like the precompile: the arguments are only read once the gas is paid for
+        view = memoryview(data)
+        gas = _compute_modexp_gas_fee_eip_2565(view)
+        if gas <= GAS_LIMIT:
+            _modexp(view)
+            return gas
+        else:
+            # only the time it takes to reject the call is measured
+            logging.debug(f"Out of gas: {gas} > {GAS_LIMIT}")
+            return 0
@@ -0,0 +1,152 @@
+from _utils.chain_plumbing import (
+    FUNDED_ADDRESS,
+)
+from _utils.reporting import (
+    DefaultStat,
+)
+from eth_typing import (
+    Address,
+)
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.abc import (
+    StateAPI,
+)
+from eth.chains.mainnet import (
+    MAINNET_VMS,
+)
+from eth.consensus import (
+    ConsensusContext,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.chain import (
+    ChainDB,
+)
+from eth.vm.chain_context import (
+    ChainContext,
+)
+from eth.vm.message import (
+    Message,
+)
+
+from .base_benchmark import (
+    BaseBenchmark,
+)
+
+# clear of the precompiles
+CONTRACT_ADDRESS = Address((0x10000).to_bytes(20, "big"))
+
+RECURSE_CODE_TEMPLATE = (
+    # CALLDATALOAD the depth, and JUMPI past the CALL if it is 0
+    "600035801561{:04x}57"
+    # MSTORE depth - 1 at 0
+    "60019003600052"
+    # CALL this same contract with it, with all the gas
+    "60006000602060006000305af1"
+)
+
+# JUMPDEST, POP the result of the CALL or the depth
+AFTER_RECURSE_CODE = "5b50"
+
+# REVERT without any data
+REVERT_CODE = "60006000fd"
+
+
+def _get_account_address(index: int) -> Address:
+    return Address((0x20000 + index).to_bytes(20, "big"))
+
+
+def _get_nested_revert_code(num_accounts: int) -> bytes:
+    # PUSH20 the address, BALANCE, POP
+    read_balances = "".join(
+        f"73{_get_account_address(index).hex()}3150" for index in range(num_accounts)
+    )
+    after_recurse_offset = (
+        len(read_balances) + len(RECURSE_CODE_TEMPLATE.format(0))
+    ) // 2
+    return decode_hex(
+        read_balances
+        + RECURSE_CODE_TEMPLATE.format(after_recurse_offset)
+        + AFTER_RECURSE_CODE
+        + read_balances
+        + REVERT_CODE
+    )
+
+
+class NestedRevertsBenchmark(BaseBenchmark):
+    """
+    Time a contract that reads the balances of a set of accounts, calls itself
+    again until it is ``depth`` frames deep, reads the same balances again once the
+    nested call reverted, and then reverts too, like a bundle of calls that keep
+    failing, to show the cost of reloading the accounts after every revert.
+    """
+
+    def __init__(
+        self, depth: int = 128, num_accounts: int = 64, num_runs: int = 3
+    ) -> None:
+        self.depth = depth
+        self.num_accounts = num_accounts
+        self.num_runs = num_runs
+
+    @property
+    def name(self) -> str:
+        return "Nested reverts"
+
+    def execute(self) -> DefaultStat:
+        vm_class = MAINNET_VMS[-1]
+        db = AtomicDB()
+        vm = vm_class(
+            vm_class.create_genesis_header(),
+            ChainDB(db),
+            ChainContext(1),
+            ConsensusContext(db),
+        )
+        state = vm.state
+        for index in range(self.num_accounts):
+            state.set_balance(_get_account_address(index), index + 1)
+        state.set_code(CONTRACT_ADDRESS, _get_nested_revert_code(self.num_accounts))
+
+        # the fastest run is the one least disturbed by everything else
+        value = min(
+            (
+                self.as_timed_result(lambda: self.run_nested_reverts(state))
+                for _ in range(self.num_runs)
+            ),
+            key=lambda timed_result: timed_result.duration,
+        )
+
+        stat = DefaultStat(
+            caption=f"{self.depth} frames",
+            total_seconds=value.duration,
+            total_gas=value.wrapped_value,
+        )
+        total_stat = DefaultStat().cumulate(stat)
+        self.print_stat_line(stat)
+        return total_stat
+
+    def run_nested_reverts(self, state: StateAPI) -> int:
+        message = Message(
+            to=CONTRACT_ADDRESS,
+            sender=FUNDED_ADDRESS,
+            value=0,
+            data=(self.depth - 1).to_bytes(32, "big"),
+            code=state.get_code(CONTRACT_ADDRESS),
+            gas=10**9,
+        )
+        transaction_context = state.get_transaction_context_class()(
+            gas_price=1,
+            origin=FUNDED_ADDRESS,
+        )
+
+        computation = state.computation_class.apply_computation(
+            state, message, transaction_context
+        )
+        if not computation.is_error:
+            raise Exception("Invariant: the outermost call must revert")
+        if len(computation.children) != 1:
+            raise Exception("Invariant: every call but the deepest must recurse")
+        return computation.get_gas_used()
@@ -0,0 +1,158 @@
+import logging
+from typing import (
+    Callable,
+    Type,
+)
+
+from _utils.chain_plumbing import (
+    FUNDED_ADDRESS,
+    SECOND_ADDRESS,
+)
+from _utils.reporting import (
+    DefaultStat,
+)
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.abc import (
+    ComputationAPI,
+    StateAPI,
+)
+from eth.chains.mainnet import (
+    MAINNET_VMS,
+)
+from eth.consensus import (
+    ConsensusContext,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.chain import (
+    ChainDB,
+)
+from eth.vm.chain_context import (
+    ChainContext,
+)
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.message import (
+    Message,
+)
+from eth.vm.profiling import (
+    ExecutionProfiler,
+)
+
+from .base_benchmark import (
+    BaseBenchmark,
+)
+
+# PUSH3 <iterations> JUMPDEST PUSH1 1 SWAP1 SUB DUP1 PUSH1 4 JUMPI STOP
+LOOP_CODE_TEMPLATE = "0x62{:06x}5b60019003806004570000"
+# JUMPDEST PUSH1 SWAP1 SUB DUP1 PUSH1 JUMPI
+OPCODES_PER_ITERATION = 7
+
+
+def _run_traced_loop(computation: ComputationAPI) -> None:
+    # The loop picked when debug2 logging or profiling is on, but without either,
+    # so only the cost of checking for them on every opcode is measured
+    type(computation)._execute_traced_code_stream(computation, None)
+
+
+def _run_untraced_loop(computation: ComputationAPI) -> None:
+    type(computation)._execute_code_stream(computation)
+
+
+def _run_profiled_loop(computation: ComputationAPI) -> None:
+    profiler = ExecutionProfiler()
+    frame = profiler.start_computation(computation)
+    type(computation)._execute_profiled_code_stream(computation, frame)
+    profiler.end_computation(frame, 0, 0)
+
+
+def _run_analyzed_loop(computation: ComputationAPI) -> None:
+    type(computation)._execute_analyzed_code(computation)
+
+
+class OpcodeLoopBenchmark(BaseBenchmark):
+    """
+    Time a tight loop of cheap opcodes through each interpreter loop, to show the
+    per-opcode overhead of checking for tracing in the loop, and of profiling.
+    """
+
+    def __init__(self, num_iterations: int = 20000, num_runs: int = 5) -> None:
+        self.num_iterations = num_iterations
+        self.num_runs = num_runs
+
+    @property
+    def name(self) -> str:
+        return "Opcode loop"
+
+    def execute(self) -> DefaultStat:
+        total_stat = DefaultStat()
+
+        vm_class = MAINNET_VMS[-1]
+        db = AtomicDB()
+        vm = vm_class(
+            vm_class.create_genesis_header(),
+            ChainDB(db),
+            ChainContext(1),
+            ConsensusContext(db),
+        )
+        state = vm.state
+        num_opcodes = self.num_iterations * OPCODES_PER_ITERATION
+
+        loops = (
+            ("traced loop", _run_traced_loop),
+            ("untraced loop", _run_untraced_loop),
+            ("profiled loop", _run_profiled_loop),
+            ("analyzed loop", _run_analyzed_loop),
+        )
+        for caption, run_loop in loops:
+            # the fastest run is the one least disturbed by everything else
+            value = min(
+                (
+                    self.as_timed_result(
+                        lambda run_loop=run_loop: self.run_loop(state, run_loop)
+                    )
+                    for _ in range(self.num_runs)
+                ),
+                key=lambda timed_result: timed_result.duration,
+            )
+
+            stat = DefaultStat(
+                caption=caption,
+                total_seconds=value.duration,
+                total_gas=value.wrapped_value,
+            )
+            total_stat = total_stat.cumulate(stat)
+            self.print_stat_line(stat)
+            logging.info(
+                f"{caption}: {value.duration / num_opcodes * 1e9:.1f} ns / opcode"
+            )
+
+        return total_stat
+
+    def run_loop(
+        self, state: StateAPI, run_loop: Callable[[ComputationAPI], None]
+    ) -> int:
+        computation_class: Type[BaseComputation] = state.computation_class
+        message = Message(
+            to=SECOND_ADDRESS,
+            sender=FUNDED_ADDRESS,
+            value=0,
+            data=b"",
+            code=decode_hex(LOOP_CODE_TEMPLATE.format(self.num_iterations)),
+            gas=10**9,
+        )
+        transaction_context = state.get_transaction_context_class()(
+            gas_price=1,
+            origin=FUNDED_ADDRESS,
+        )
+
+        with computation_class(state, message, transaction_context) as computation:
+            run_loop(computation)
+
+        computation.raise_if_error()
+        return computation.get_gas_used()
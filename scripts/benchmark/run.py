@@ -19,6 +19,12 @@ from checks import (
     MineEmptyBlocksBenchmark,
     SimpleValueTransferBenchmark,
 )
+from checks.blake2_compress import (
+    Blake2CompressBenchmark,
+)
+from checks.deep_multicall import (
+    DeepMulticallBenchmark,
+)
 from checks.deploy_dos import (
     DOSContractCreateEmptyContractBenchmark,
     DOSContractDeployBenchmark,
@@ -32,6 +38,15 @@ from checks.erc20_interact import (
     ERC20TransferBenchmark,
     ERC20TransferFromBenchmark,
 )
+from checks.modexp import (
+    ModexpBenchmark,
+)
+from checks.nested_reverts import (
+    NestedRevertsBenchmark,
+)
+from checks.opcode_loop import (
+    OpcodeLoopBenchmark,
+)
 from checks.simple_value_transfers import (
     TO_EXISTING_ADDRESS_CONFIG,
     TO_NON_EXISTING_ADDRESS_CONFIG,
@@ -85,6 +100,11 @@ def run() -> None:
         DOSContractCreateEmptyContractBenchmark(),
         DOSContractRevertSstoreUint64Benchmark(),
         DOSContractRevertCreateEmptyContractBenchmark(),
+        OpcodeLoopBenchmark(),
+        Blake2CompressBenchmark(),
+        ModexpBenchmark(),
+        DeepMulticallBenchmark(),
+        NestedRevertsBenchmark(),
     ]
 
     for benchmark in benchmarks:
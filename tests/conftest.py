@@ -17,6 +17,12 @@ import rlp
 from eth import (
     constants,
 )
+from eth._utils.bn128 import (
+    CrossCheckBN128Backend,
+    ReferenceBN128Backend,
+    load_bn128_backend,
+    set_bn128_backend,
+)
 from eth.chains.base import (
     Chain,
     MiningChain,
@@ -30,9 +36,21 @@ from eth.consensus.noproof import (
 from eth.db.atomic import (
     AtomicDB,
 )
+from eth.precompiles.caching import (
+    PrecompileResultCache,
+)
 from eth.rlp.headers import (
     BlockHeader,
 )
+from eth.vm.computation import (
+    BaseComputation,
+)
+from eth.vm.execution_engine import (
+    CrossCheckExecutionEngine,
+    PyEVMExecutionEngine,
+    load_execution_engine,
+    set_execution_engine,
+)
 from eth.vm.forks import (
     ArrowGlacierVM,
     BerlinVM,
@@ -48,6 +66,15 @@ from eth.vm.forks import (
     SpuriousDragonVM,
     TangerineWhistleVM,
 )
+from eth.vm.keccak_memo import (
+    KeccakMemo,
+)
+from eth.vm.memory import (
+    PreallocatedMemory,
+)
+from eth.vm.stack import (
+    UncheckedStack,
+)
 
 #
 #  Setup DEBUG2 level logging.
@@ -285,6 +312,98 @@ def chain_without_block_validation_from_vm(request, base_db, genesis_state):
 
 def pytest_addoption(parser):
     parser.addoption("--fork", type=str, required=False)
+    parser.addoption(
+        "--basic-block-gas",
+        action="store_true",
+        help="Charge static gas per basic block in every computation",
+    )
+    parser.addoption(
+        "--unchecked-stack",
+        action="store_true",
+        help="Skip validating stack pushes in every computation",
+    )
+    parser.addoption(
+        "--preallocated-memory",
+        action="store_true",
+        help="Reserve memory capacity geometrically in every computation",
+    )
+    parser.addoption(
+        "--resource-pool",
+        action="store_true",
+        help="Reuse the stack and memory of finished child computations",
+    )
+    parser.addoption(
+        "--bn128-cross-check",
+        action="store_true",
+        help="Check every BN128 curve operation against the reference backend",
+    )
+    parser.addoption(
+        "--precompile-result-cache",
+        action="store_true",
+        help="Reuse the results of the pure hash precompiles in every computation",
+    )
+    parser.addoption(
+        "--keccak-memo",
+        action="store_true",
+        help="Reuse the hashes of short SHA3 preimages in every computation",
+    )
+    parser.addoption(
+        "--execution-engine-cross-check",
+        action="store_true",
+        help="Check every computation against the built-in execution engine",
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _basic_block_gas(request):
+    if request.config.getoption("--basic-block-gas"):
+        BaseComputation.use_basic_block_gas = True
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _unchecked_stack(request):
+    if request.config.getoption("--unchecked-stack"):
+        BaseComputation.stack_class = UncheckedStack
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _preallocated_memory(request):
+    if request.config.getoption("--preallocated-memory"):
+        BaseComputation.memory_class = PreallocatedMemory
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _resource_pool(request):
+    if request.config.getoption("--resource-pool"):
+        BaseComputation.use_resource_pool = True
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _bn128_cross_check(request):
+    if request.config.getoption("--bn128-cross-check"):
+        set_bn128_backend(
+            CrossCheckBN128Backend(load_bn128_backend(), ReferenceBN128Backend())
+        )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _precompile_result_cache(request):
+    if request.config.getoption("--precompile-result-cache"):
+        BaseComputation.precompile_result_cache = PrecompileResultCache()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _keccak_memo(request):
+    if request.config.getoption("--keccak-memo"):
+        BaseComputation.keccak_memo = KeccakMemo()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _execution_engine_cross_check(request):
+    if request.config.getoption("--execution-engine-cross-check"):
+        set_execution_engine(
+            CrossCheckExecutionEngine(load_execution_engine(), PyEVMExecutionEngine())
+        )
 
 
 @to_tuple
@@ -3,6 +3,12 @@ import pytest
 from eth.chains.base import (
     MiningChain,
 )
+from eth.db.account import (
+    AccountDB,
+)
+from eth.db.warm_state import (
+    WarmStateCache,
+)
 from eth.tools.builder.chain import (
     api,
 )
@@ -80,6 +86,44 @@ def test_import_block_with_reorg(mining_chain, funded_address_private_key):
     assert main_chain.get_canonical_head() == f_block_6.header
 
 
+class RecordingWarmStateCache(WarmStateCache):
+    def __init__(self, max_size):
+        super().__init__(max_size)
+        self.discarded_state_roots = []
+
+    def discard_state_roots(self, state_roots):
+        self.discarded_state_roots.append(set(state_roots))
+        super().discard_state_roots(state_roots)
+
+
+def test_import_block_with_reorg_discards_warm_state(mining_chain):
+    fork_chain = api.build(
+        mining_chain,
+        api.copy(),
+        api.mine_block(extra_data=b"fork-it"),
+        api.mine_blocks(2),
+    )
+    main_chain = api.build(mining_chain, api.mine_blocks(2))
+    warm_state_cache = RecordingWarmStateCache(2**20)
+    main_chain.warm_state_cache = warm_state_cache
+
+    old_blocks = tuple(main_chain.get_canonical_block_by_number(n) for n in (4, 5))
+    for block_number in (4, 5, 6):
+        main_chain.import_block(fork_chain.get_canonical_block_by_number(block_number))
+
+    assert warm_state_cache.discarded_state_roots == [
+        {block.header.state_root for block in old_blocks}
+    ]
+    head = main_chain.get_canonical_head()
+    assert warm_state_cache.state_root == head.state_root
+
+    state = main_chain.get_vm().state
+    uncached_account_db = AccountDB(main_chain.chaindb.db, head.state_root)
+    assert state.get_balance(head.coinbase) == uncached_account_db.get_balance(
+        head.coinbase
+    )
+
+
 def test_import_block_with_reorg_with_current_head_as_uncle(
     mining_chain, funded_address_private_key
 ):
@@ -21,6 +21,7 @@ from eth.vm import (
 )
 from eth.vm.code_stream import (
     CodeStream,
+    get_valid_opcode_bitmap,
 )
 
 
@@ -256,3 +257,35 @@ def test_new_vs_reference_code_stream_read_during_iter(read_idx, read_len, bytec
             assert latest.program_counter >= len(reference)
         else:
             assert latest.program_counter == reference.program_counter
+
+
+@given(
+    bytecode=st.binary(max_size=256),
+    data=st.data(),
+)
+def test_new_vs_reference_code_stream_is_valid_opcode(bytecode, data):
+    reference = SlowCodeStream(bytecode)
+    latest = CodeStream(bytecode)
+    index_st = st.integers(min_value=0, max_value=len(bytecode) + 33)
+    for index in data.draw(st.lists(index_st, max_size=64)):
+        assert latest.is_valid_opcode(index) is reference.is_valid_opcode(index)
+
+
+def test_valid_opcode_bitmap_is_shared_between_code_streams():
+    bytecode = b"\x60\x5b\x5b\x7f" + (b"\x5b" * 32) + b"\x5b"
+    first = CodeStream(bytecode)
+    assert first.is_valid_opcode(2) is True
+
+    second = CodeStream(bytes(bytearray(bytecode)))
+    assert get_valid_opcode_bitmap(bytecode) is first._valid_opcode_bitmap
+    assert second.is_valid_opcode(1) is False
+    assert second._valid_opcode_bitmap is first._valid_opcode_bitmap
+    assert [second.is_valid_opcode(i) for i in (0, 2, 3, 4, 35, 36, 37)] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+        True,
+        False,
+    ]
@@ -1,4 +1,6 @@
+import gc
 import pytest
+import weakref
 
 from eth_utils import (
     ValidationError,
@@ -37,6 +39,19 @@ def test_consume_gas(gas_meter, amount):
     assert gas_meter.gas_remaining == gas_meter.start_gas - amount
 
 
+def test_gas_meter_is_freed_without_garbage_collection():
+    gc.disable()
+    try:
+        meter = GasMeter(10)
+        meter.consume_gas(1, "reason")
+        meter_ref = weakref.ref(meter)
+        del meter
+        # a gas meter that refers to itself would only be freed by the collector
+        assert meter_ref() is None
+    finally:
+        gc.enable()
+
+
 def test_consume_gas_rejects_negative_values(gas_meter):
     with pytest.raises(ValidationError):
         gas_meter.consume_gas(-1, "reason")
@@ -8,9 +8,27 @@ from eth_utils import (
 from eth.chains.base import (
     MiningChain,
 )
+from eth.consensus import (
+    ConsensusContext,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.chain import (
+    ChainDB,
+)
 from eth.tools.factories.transaction import (
     new_transaction,
 )
+from eth.vm.chain_context import (
+    ChainContext,
+)
+from eth.vm.message import (
+    Message,
+)
+from eth.vm.transaction_context import (
+    BaseTransactionContext,
+)
 
 
 def fill_block(chain, from_, key, gas, data):
@@ -41,3 +59,53 @@ def fill_block(chain, from_, key, gas, data):
             assert new_header.gas_used <= new_header.gas_limit
 
     assert chain.get_vm().get_block().header.gas_used > 0
+
+
+CANONICAL_ADDRESS_A = b"\xaa" * 20
+CANONICAL_ADDRESS_B = b"\xbb" * 20
+
+
+def setup_genesis_vm(vm_class):
+    db = AtomicDB()
+    genesis_header = vm_class.create_genesis_header(difficulty=0, timestamp=0)
+    return vm_class(genesis_header, ChainDB(db), ChainContext(1), ConsensusContext(db))
+
+
+def run_code(vm, code, gas=100000, **computation_config):
+    state = vm.state
+    computation_class = state.computation_class.configure(**computation_config)
+    message = Message(
+        to=CANONICAL_ADDRESS_A,
+        sender=CANONICAL_ADDRESS_B,
+        value=0,
+        data=b"\x01" * 36,
+        code=code,
+        gas=gas,
+    )
+    transaction_context = BaseTransactionContext(
+        gas_price=1,
+        origin=CANONICAL_ADDRESS_B,
+    )
+
+    snapshot = state.snapshot()
+    computation = computation_class.apply_computation(
+        state,
+        message,
+        transaction_context,
+    )
+    state.revert(snapshot)
+    return computation
+
+
+def summarize_computation(computation):
+    return (
+        repr(computation._error),
+        computation.get_gas_remaining(),
+        computation.get_gas_refund(),
+        computation.output,
+        computation.code.program_counter,
+        tuple(computation._stack.values),
+        computation.memory_read_bytes(0, len(computation._memory)),
+        computation.get_log_entries(),
+        len(computation.children),
+    )
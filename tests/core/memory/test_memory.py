@@ -6,6 +6,7 @@ from eth_utils import (
 
 from eth.vm.memory import (
     Memory,
+    PreallocatedMemory,
 )
 
 
@@ -72,3 +73,59 @@ def test_read_returns_correct_bytes_from_memory(memory32):
     assert memory32.read(start_position=5, size=4) == b"1010"
     assert memory32.read(start_position=6, size=4) != b"1010"
     assert memory32.read(start_position=5, size=5) != b"1010"
+
+
+@pytest.mark.parametrize("memory_class", (Memory, PreallocatedMemory))
+def test_write_unchecked(memory_class):
+    memory = memory_class()
+    memory.extend(0, 32)
+    memory.write_unchecked(4, b"1010")
+    assert memory.read_bytes(0, 32) == bytes(4) + b"1010" + bytes(24)
+
+
+def test_preallocated_memory_reports_logical_size():
+    memory = PreallocatedMemory()
+    memory.extend(start_position=0, size=10)
+    assert len(memory) == 32
+    memory.extend(start_position=30, size=32)
+    assert len(memory) == 64
+    memory.extend(start_position=48, size=10)
+    assert len(memory) == 64
+    # capacity grows geometrically, ahead of the logical size
+    memory.extend(start_position=64, size=1)
+    assert len(memory) == 96
+    assert len(memory._bytes) == 128
+
+
+def test_preallocated_memory_rejects_writes_beyond_logical_size():
+    memory = PreallocatedMemory()
+    memory.extend(0, 64)
+    memory.extend(64, 1)
+    with pytest.raises(ValidationError):
+        memory.write(start_position=96, size=4, value=b"1010")
+
+
+def test_preallocated_memory_extends_within_capacity_while_viewed():
+    memory = PreallocatedMemory()
+    memory.extend(0, 64)
+    memory.extend(64, 1)
+    buffer = memory._bytes
+    memory.write(0, 4, b"1010")
+
+    view = memory.read(0, 4)
+    memory.extend(96, 32)
+    assert memory._bytes is buffer
+    assert len(memory) == 128
+    assert view == b"1010"
+
+
+def test_preallocated_memory_keeps_contents_when_growing_while_viewed():
+    memory = PreallocatedMemory()
+    memory.extend(0, 32)
+    memory.write(0, 4, b"1010")
+
+    view = memory.read(0, 4)
+    memory.extend(32, 64)
+    assert len(memory) == 96
+    assert memory.read_bytes(0, 96) == b"1010" + bytes(92)
+    assert view == b"1010"
@@ -1,4 +1,7 @@
+import hashlib
+import os
 import pytest
+import random
 
 from eth_utils import (
     ValidationError,
@@ -9,6 +12,7 @@ from eth._utils.blake2.coders import (
     extract_blake2b_parameters,
 )
 from eth._utils.blake2.compression import (
+    Blake2b,
     blake2b_compress,
 )
 
@@ -80,3 +84,27 @@ def test_blake2(input_hex, expected_result):
         )
 
         assert result_bytes.hex() == expected_result
+
+
+@pytest.mark.parametrize("message_size", (0, 3, 64, 128))
+def test_blake2_matches_hashlib(message_size):
+    # the digest of a message of one block is its compression with 12 rounds
+    message = os.urandom(message_size)
+    h_state = (Blake2b.IV[0] ^ 0x01010040,) + Blake2b.IV[1:]
+    block = message.ljust(128, b"\x00")
+
+    result = blake2b_compress(12, h_state, block, (message_size, 0), True)
+    assert result == hashlib.blake2b(message).digest()
+
+
+@pytest.mark.parametrize("num_rounds", (0, 1, 9, 10, 11, 12, 23, 100))
+def test_blake2_matches_compiled_backend(num_rounds):
+    compiled_blake2b = pytest.importorskip("blake2b")
+
+    for final_block_flag in (True, False):
+        h_state = tuple(random.getrandbits(64) for _ in range(8))
+        block = tuple(random.getrandbits(64) for _ in range(16))
+        t_offset_counters = (random.getrandbits(64), random.getrandbits(64))
+        parameters = (num_rounds, h_state, block, t_offset_counters, final_block_flag)
+
+        assert blake2b_compress(*parameters) == compiled_blake2b.compress(*parameters)
@@ -0,0 +1,187 @@
+import pytest
+
+from eth_utils import (
+    ValidationError,
+)
+from py_ecc import (
+    optimized_bn128 as bn128,
+)
+
+from eth._utils.bn128 import (
+    BaseBN128Backend,
+    BN128BackendMismatch,
+    CrossCheckBN128Backend,
+    PyEccBN128Backend,
+    ReferenceBN128Backend,
+    get_bn128_backend,
+    load_bn128_backend,
+    set_bn128_backend,
+)
+from eth.precompiles.ecadd import (
+    _ecadd,
+)
+from eth.precompiles.ecmul import (
+    _ecmull,
+)
+
+
+def _g1(point):
+    x, y = bn128.normalize(point)
+    return x.n, y.n
+
+
+def _g2(point):
+    x, y = bn128.normalize(point)
+    return x.coeffs[1], x.coeffs[0], y.coeffs[1], y.coeffs[0]
+
+
+G1 = _g1(bn128.G1)
+G2 = _g2(bn128.G2)
+INFINITY_G1 = (0, 0)
+INFINITY_G2 = (0, 0, 0, 0)
+
+cross_check_backend = CrossCheckBN128Backend(
+    PyEccBN128Backend(), ReferenceBN128Backend()
+)
+
+
+@pytest.mark.parametrize(
+    "pairs, expected",
+    (
+        ((), True),
+        (((G1, G2),), False),
+        (((G1, INFINITY_G2),), True),
+        (((INFINITY_G1, G2), (G1, INFINITY_G2)), True),
+        # e(2 * G1, G2) * e(-G1, 2 * G2) == 1
+        (
+            (
+                (_g1(bn128.multiply(bn128.G1, 2)), G2),
+                (_g1(bn128.neg(bn128.G1)), _g2(bn128.multiply(bn128.G2, 2))),
+            ),
+            True,
+        ),
+        (
+            (
+                (_g1(bn128.multiply(bn128.G1, 2)), G2),
+                (_g1(bn128.G1), _g2(bn128.multiply(bn128.G2, 2))),
+            ),
+            False,
+        ),
+    ),
+)
+def test_pairing_check_matches_reference(pairs, expected):
+    assert cross_check_backend.pairing_check(pairs) is expected
+
+
+@pytest.mark.parametrize(
+    "pairs",
+    (
+        # not on the curve
+        (((1, 3), G2),),
+        ((G1, (1, 2, 3, 4)),),
+        # coordinate greater than the field modulus
+        ((G1, (bn128.field_modulus,) + G2[1:]),),
+    ),
+)
+def test_pairing_check_rejects_invalid_points(pairs):
+    with pytest.raises(ValidationError):
+        cross_check_backend.pairing_check(pairs)
+
+
+def test_add_and_multiply_match_reference():
+    assert cross_check_backend.add(G1, G1) == cross_check_backend.multiply(G1, 2)
+    assert cross_check_backend.add(G1, INFINITY_G1) == G1
+    assert cross_check_backend.multiply(G1, 0) == INFINITY_G1
+    with pytest.raises(ValidationError):
+        cross_check_backend.add(G1, (1, 3))
+
+
+class WrongBackend(PyEccBN128Backend):
+    def add(self, p1, p2):
+        return p1
+
+    def multiply(self, point, scalar):
+        raise ValidationError("rejects everything")
+
+
+def test_cross_check_detects_mismatches():
+    backend = CrossCheckBN128Backend(WrongBackend(), ReferenceBN128Backend())
+    assert backend.add(G1, INFINITY_G1) == G1
+    with pytest.raises(BN128BackendMismatch):
+        backend.add(G1, G1)
+    # failing validation where the reference does not is a mismatch too
+    with pytest.raises(BN128BackendMismatch):
+        backend.multiply(G1, 2)
+
+
+def test_precompiles_use_configured_backend():
+    original_backend = get_bn128_backend()
+    set_bn128_backend(WrongBackend())
+    try:
+        # the wrong backend returns the first point, unvalidated
+        ones = int.from_bytes(b"\x01" * 32, "big")
+        assert _ecadd(b"\x01" * 128) == (ones, ones)
+    finally:
+        set_bn128_backend(original_backend)
+
+
+def test_load_bn128_backend(monkeypatch):
+    assert isinstance(load_bn128_backend(), PyEccBN128Backend)
+
+    monkeypatch.setenv("BN128_BACKEND_CLASS", "eth._utils.bn128.ReferenceBN128Backend")
+    assert isinstance(load_bn128_backend(), ReferenceBN128Backend)
+    assert isinstance(load_bn128_backend(), BaseBN128Backend)
+
+
+def test_cached_pairing_check_matches_uncached():
+    backend = PyEccBN128Backend(prepared_g2_cache_size=4)
+    pairs = (
+        (_g1(bn128.multiply(bn128.G1, 2)), G2),
+        (_g1(bn128.neg(bn128.G1)), _g2(bn128.multiply(bn128.G2, 2))),
+    )
+    assert backend.pairing_check(pairs) is True
+    assert (backend.prepared_g2_stats.hits, backend.prepared_g2_stats.misses) == (0, 2)
+
+    # the cached G2 points are paired with other G1 points
+    swapped_pairs = ((pairs[1][0], pairs[0][1]), (pairs[0][0], pairs[1][1]))
+    assert backend.pairing_check(swapped_pairs) is False
+    assert backend.pairing_check(pairs + ((G1, INFINITY_G2),)) is True
+    assert (backend.prepared_g2_stats.hits, backend.prepared_g2_stats.misses) == (4, 3)
+
+
+def test_invalid_g2_points_are_not_cached():
+    backend = PyEccBN128Backend(prepared_g2_cache_size=4)
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            backend.pairing_check(((G1, (1, 2, 3, 4)),))
+    assert backend.prepared_g2_stats.misses == 2
+
+
+def test_product_cache_is_bounded():
+    backend = PyEccBN128Backend(product_cache_size=2)
+    for scalar in (2, 3, 2, 4, 2):
+        assert backend.multiply(G1, scalar) == _g1(bn128.multiply(bn128.G1, scalar))
+    assert (backend.product_stats.hits, backend.product_stats.misses) == (2, 3)
+
+    backend.multiply(G1, 3)
+    assert backend.product_stats.misses == 4
+    assert backend.product_stats.hit_rate == pytest.approx(2 / 6)
+
+
+def test_caches_are_off_by_default():
+    backend = PyEccBN128Backend()
+    backend.multiply(G1, 2)
+    backend.pairing_check(((G1, G2),))
+    assert backend.product_stats.hits + backend.product_stats.misses == 0
+    assert backend.prepared_g2_stats.hits + backend.prepared_g2_stats.misses == 0
+
+
+def test_cached_backend_gives_precompiles_the_same_results():
+    original_backend = get_bn128_backend()
+    set_bn128_backend(PyEccBN128Backend(product_cache_size=4))
+    try:
+        data = b"".join(value.to_bytes(32, "big") for value in G1 + (5,))
+        assert _ecmull(data) == _ecmull(data) == _g1(bn128.multiply(bn128.G1, 5))
+        assert get_bn128_backend().product_stats.hits == 1
+    finally:
+        set_bn128_backend(original_backend)
@@ -0,0 +1,94 @@
+import hashlib
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.precompiles.caching import (
+    PrecompileResultCache,
+)
+from eth.vm.forks import (
+    FrontierVM,
+    ShanghaiVM,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+# PUSH32 0xaa..aa PUSH1 0 MSTORE
+STORE_INPUT = decode_hex("0x7f" + "aa" * 32 + "600052")
+# RETURN the 32 bytes at 0x20
+RETURN_OUTPUT = decode_hex("0x60206020f3")
+
+
+def _call_precompile(address, input_size=32, gas=0xFFFF):
+    # CALL(gas, address, value=0, in_offset=0, in_size=input_size, out_offset=0x20,
+    # out_size=0x20) then POP the result
+    return decode_hex(
+        "0x60206020"
+        + f"61{input_size:04x}"
+        + "6000600060"
+        + f"{address:02x}"
+        + f"62{gas:06x}f150"
+    )
+
+
+@pytest.mark.parametrize("VM", (FrontierVM, ShanghaiVM))
+@pytest.mark.parametrize("address", (2, 3))
+def test_cached_precompile_results_match(VM, address):
+    code = STORE_INPUT + _call_precompile(address) * 3 + RETURN_OUTPUT
+    cache = PrecompileResultCache()
+
+    expected = run_code(setup_genesis_vm(VM), code)
+    actual = run_code(setup_genesis_vm(VM), code, precompile_result_cache=cache)
+
+    assert summarize_computation(actual) == summarize_computation(expected)
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+    if address == 2:
+        assert actual.output == hashlib.sha256(b"\xaa" * 32).digest()
+
+
+def test_identity_is_not_cached():
+    cache = PrecompileResultCache()
+    run_code(
+        setup_genesis_vm(ShanghaiVM),
+        STORE_INPUT + _call_precompile(4) * 2,
+        precompile_result_cache=cache,
+    )
+    assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+
+def test_long_inputs_bypass_the_cache():
+    cache = PrecompileResultCache(max_input_size=32)
+    code = STORE_INPUT + _call_precompile(2, input_size=33) * 2 + RETURN_OUTPUT
+
+    expected = run_code(setup_genesis_vm(ShanghaiVM), code)
+    actual = run_code(setup_genesis_vm(ShanghaiVM), code, precompile_result_cache=cache)
+
+    assert summarize_computation(actual) == summarize_computation(expected)
+    assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+
+def test_failed_calls_are_not_cached():
+    cache = PrecompileResultCache()
+    # SHA256 of 32 bytes costs 72 gas
+    code = STORE_INPUT + _call_precompile(2, gas=71) * 2 + _call_precompile(2)
+    computation = run_code(
+        setup_genesis_vm(ShanghaiVM), code, precompile_result_cache=cache
+    )
+
+    assert [child.is_error for child in computation.children] == [True, True, False]
+    assert (cache.stats.hits, cache.stats.misses) == (0, 3)
+
+    # the cached result is charged the same gas, and runs out of gas the same way
+    computation = run_code(
+        setup_genesis_vm(ShanghaiVM),
+        STORE_INPUT + _call_precompile(2, gas=71) + _call_precompile(2),
+        precompile_result_cache=cache,
+    )
+    assert [child.is_error for child in computation.children] == [True, False]
+    assert [child.get_gas_used() for child in computation.children] == [71, 72]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 3)
@@ -3,6 +3,10 @@ import pytest
 from eth_utils import (
     ValidationError,
 )
+from hypothesis import (
+    given,
+    strategies as st,
+)
 
 from eth.exceptions import (
     FullStack,
@@ -10,6 +14,7 @@ from eth.exceptions import (
 )
 from eth.vm.stack import (
     Stack,
+    UncheckedStack,
 )
 
 
@@ -154,3 +159,77 @@ def test_swap_raises_InsufficientStack_appropriately(stack):
 def test_dup_raises_InsufficientStack_appropriately(stack):
     with pytest.raises(InsufficientStack):
         stack.dup(0)
+
+
+@pytest.mark.parametrize("stack_class", (Stack, UncheckedStack))
+def test_fixed_arity_pops_match_pop_ints(stack_class):
+    stack = stack_class()
+    for value in (1, b"\x02", 3, b"\x04", 5):
+        if isinstance(value, int):
+            stack.push_int(value)
+        else:
+            stack.push_bytes(value)
+
+    assert stack.pop2_ints() == (5, 4)
+    assert stack.pop3_ints() == (3, 2, 1)
+
+
+@pytest.mark.parametrize("stack_class", (Stack, UncheckedStack))
+@pytest.mark.parametrize("pop_method, num_items", (("pop2_ints", 2), ("pop3_ints", 3)))
+def test_fixed_arity_pops_raise_InsufficientStack_without_popping(
+    stack_class, pop_method, num_items
+):
+    stack = stack_class()
+    for num in range(num_items - 1):
+        stack.push_int(num)
+
+    with pytest.raises(InsufficientStack):
+        getattr(stack, pop_method)()
+    assert len(stack.values) == num_items - 1
+
+
+def test_unchecked_stack_does_not_exceed_1024_items():
+    stack = UncheckedStack()
+    for num in range(1024):
+        stack.push_int(num)
+    with pytest.raises(FullStack):
+        stack.push_int(1024)
+    with pytest.raises(FullStack):
+        stack.push_bytes(b"\x01")
+    with pytest.raises(FullStack):
+        stack.dup(1)
+
+
+_stack_operation = st.one_of(
+    st.tuples(st.just("push_int"), st.integers(min_value=0, max_value=2**256 - 1)),
+    st.tuples(st.just("push_bytes"), st.binary(max_size=32)),
+    st.tuples(st.just("pop1_any")),
+    st.tuples(st.just("pop2_ints")),
+    st.tuples(st.just("pop3_ints")),
+    st.tuples(
+        st.sampled_from(("pop_ints", "pop_bytes", "pop_any")),
+        st.integers(min_value=1, max_value=4),
+    ),
+    st.tuples(
+        st.sampled_from(("swap", "dup")),
+        st.integers(min_value=1, max_value=16),
+    ),
+)
+
+
+def _apply_stack_operation(stack, operation):
+    method_name, *args = operation
+    try:
+        return getattr(stack, method_name)(*args)
+    except InsufficientStack as exc:
+        return type(exc)
+
+
+@given(operations=st.lists(_stack_operation, max_size=64))
+def test_unchecked_stack_matches_stack(operations):
+    stack = Stack()
+    unchecked_stack = UncheckedStack()
+    for operation in operations:
+        expected = _apply_stack_operation(stack, operation)
+        assert _apply_stack_operation(unchecked_stack, operation) == expected
+        assert unchecked_stack.values == stack.values
@@ -0,0 +1,127 @@
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import pytest
+
+from eth_keys import (
+    keys,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+from eth_utils import (
+    decode_hex,
+    int_to_big_endian,
+    keccak,
+)
+
+from eth._utils.ecrecover import (
+    RecoveryCache,
+    get_signature_key,
+    recover_senders,
+    recovery_cache,
+)
+from eth._utils.padding import (
+    pad32,
+)
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.forks.spurious_dragon.transactions import (
+    SpuriousDragonTransaction,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+)
+
+PRIVATE_KEY = keys.PrivateKey(b"\x01" * 32)
+MESSAGE_HASH = keccak(b"message")
+
+
+@pytest.fixture
+def transactions():
+    return [
+        SpuriousDragonTransaction.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b"\xaa" * 20,
+            value=nonce,
+            data=b"",
+        ).as_signed_transaction(PRIVATE_KEY, chain_id=1)
+        for nonce in range(3)
+    ]
+
+
+def test_recovery_cache_recovers_each_signature_once():
+    cache = RecoveryCache(size=2)
+    v, r, s = PRIVATE_KEY.sign_msg_hash(MESSAGE_HASH).vrs
+
+    assert cache.recover_public_key(MESSAGE_HASH, v, r, s) == PRIVATE_KEY.public_key
+    assert cache.recover_public_key(MESSAGE_HASH, v, r, s) == PRIVATE_KEY.public_key
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+    cache.clear()
+    assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+    assert (MESSAGE_HASH, v, r, s) not in cache
+
+
+def test_recovery_cache_caches_bad_signatures():
+    cache = RecoveryCache()
+    # r=0 is not a point on the curve
+    for _ in range(2):
+        with pytest.raises(BadSignature):
+            cache.recover_public_key(MESSAGE_HASH, 0, 0, 1)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_recovery_cache_is_bounded():
+    cache = RecoveryCache(size=2)
+    signatures = [PRIVATE_KEY.sign_msg_hash(keccak(bytes((i,)))).vrs for i in range(3)]
+    for i, (v, r, s) in enumerate(signatures):
+        cache.recover_public_key(keccak(bytes((i,))), v, r, s)
+
+    v, r, s = signatures[0]
+    assert (keccak(b"\x00"), v, r, s) not in cache
+
+
+@pytest.mark.parametrize(
+    "executor_class", (None, ThreadPoolExecutor, ProcessPoolExecutor)
+)
+def test_recover_senders(transactions, executor_class):
+    recovery_cache.clear()
+    if executor_class is None:
+        senders = recover_senders(transactions)
+    else:
+        with executor_class(2) as executor:
+            senders = recover_senders(transactions, executor)
+
+    assert all(get_signature_key(tx) in recovery_cache for tx in transactions)
+    misses = recovery_cache.stats.misses
+    assert senders == tuple(tx.sender for tx in transactions)
+    # every sender was already recovered by the batch
+    assert recovery_cache.stats.misses == misses
+
+
+def test_ecrecover_precompile_uses_recovery_cache():
+    recovery_cache.clear()
+    v, r, s = PRIVATE_KEY.sign_msg_hash(MESSAGE_HASH).vrs
+    words = (MESSAGE_HASH, pad32(bytes((v + 27,))), pad32(int_to_big_endian(r)))
+    words += (pad32(int_to_big_endian(s)),)
+
+    # MSTORE the input at 0, STATICCALL ECRECOVER twice writing the output at 0x80,
+    # then RETURN the output
+    code = b"".join(
+        b"\x7f" + word + b"\x60" + bytes((i * 32,)) + b"\x52"
+        for i, word in enumerate(words)
+    )
+    code += decode_hex("0x60206080608060006001" + "61fffffa50") * 2
+    code += decode_hex("0x60206080f3")
+
+    computation = run_code(setup_genesis_vm(ShanghaiVM), code)
+
+    assert computation.output == pad32(PRIVATE_KEY.public_key.to_canonical_address())
+    assert (recovery_cache.stats.hits, recovery_cache.stats.misses) == (1, 1)
@@ -0,0 +1,185 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+from hypothesis import (
+    given,
+    settings,
+    strategies as st,
+)
+
+from eth.chains.mainnet import (
+    MAINNET_VMS,
+)
+from eth.vm.code_analysis import (
+    analyze_code,
+    get_analyzed_code,
+)
+from eth.vm.forks import (
+    FrontierVM,
+    ShanghaiVM,
+)
+from eth.vm.opcode_values import (
+    JUMP,
+    JUMPDEST,
+    JUMPI,
+    PUSH1,
+    PUSH32,
+    STOP,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+
+def assert_same_execution(vm, code):
+    expected = summarize_computation(run_code(vm, code, use_analyzed_code=False))
+    actual = summarize_computation(run_code(vm, code, use_analyzed_code=True))
+    assert actual == expected
+    fused = summarize_computation(run_code(vm, code, use_superinstructions=True))
+    assert fused == expected
+
+
+def assert_same_execution_with_basic_block_gas(vm, code):
+    expected = summarize_computation(run_code(vm, code, use_analyzed_code=False))
+    actual = summarize_computation(run_code(vm, code, use_basic_block_gas=True))
+    assert actual == expected
+    fused = summarize_computation(
+        run_code(vm, code, use_basic_block_gas=True, use_superinstructions=True)
+    )
+    assert fused == expected
+
+
+@pytest.fixture(params=(FrontierVM, ShanghaiVM))
+def vm(request):
+    return setup_genesis_vm(request.param)
+
+
+@pytest.mark.parametrize(
+    "code",
+    (
+        b"",
+        # PUSH2 then PC, so the PC must account for the push data
+        decode_hex("0x61010258"),
+        # PUSH32 truncated by the end of the code
+        decode_hex("0x7f0102"),
+        # PUSH1 truncated by the end of the code, with a following STOP
+        decode_hex("0x60"),
+        # count down from 3 in a loop: PUSH1 3 JUMPDEST PUSH1 1 SWAP1 SUB DUP1
+        # PUSH1 2 JUMPI
+        decode_hex("0x60035b600190038060025700"),
+        # jump into push data
+        decode_hex("0x600356605b00"),
+        # jump to a position that is not a JUMPDEST
+        decode_hex("0x6004565b00"),
+        # jump past the end of the code
+        decode_hex("0x61ffff56"),
+        # an invalid opcode after some pushes
+        decode_hex("0x6001600201fe"),
+        # MSTORE a PUSH32 value and RETURN it
+        decode_hex("0x7f" + "ab" * 32 + "60005260206000f3"),
+        # run out of gas in an infinite loop
+        decode_hex("0x5b600056"),
+    ),
+)
+def test_analyzed_code_matches_code_stream(vm, code):
+    assert_same_execution(vm, code)
+    assert_same_execution_with_basic_block_gas(vm, code)
+
+
+_JUMPY_OPCODES = (JUMP, JUMPI, JUMPDEST, STOP)
+
+
+@st.composite
+def _bytecode(draw):
+    sections = draw(
+        st.lists(
+            st.one_of(
+                st.binary(min_size=1, max_size=8),
+                st.sampled_from(_JUMPY_OPCODES).map(lambda op: bytes((op,))),
+                st.tuples(
+                    st.integers(min_value=PUSH1, max_value=PUSH32),
+                    st.binary(max_size=32),
+                ).map(lambda push: bytes((push[0],)) + push[1]),
+            ),
+            max_size=32,
+        )
+    )
+    return b"".join(sections)
+
+
+@given(code=_bytecode())
+@settings(max_examples=200, deadline=None)
+def test_fuzzy_analyzed_code_matches_code_stream(code):
+    vm = setup_genesis_vm(MAINNET_VMS[-1])
+    assert_same_execution(vm, code)
+    assert_same_execution_with_basic_block_gas(vm, code)
+
+
+@pytest.mark.parametrize("gas", range(0, 60))
+def test_basic_block_gas_runs_out_of_gas_at_the_same_instruction(vm, gas):
+    # PUSH1 3 JUMPDEST PUSH1 1 SWAP1 SUB DUP1 PUSH1 2 JUMPI PUSH1 1 PUSH1 0 MSTORE
+    code = decode_hex("0x60035b60019003806002576001600052")
+    expected = run_code(vm, code, use_analyzed_code=False, gas=gas)
+    actual = run_code(vm, code, use_basic_block_gas=True, gas=gas)
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+@pytest.mark.parametrize("gas", range(0, 30))
+def test_basic_block_gas_fails_dynamic_charges_at_the_same_instruction(vm, gas):
+    # PUSH1 0x42 PUSH1 0 MSTORE ADD ADD, where the ADDs underflow the stack once
+    # the memory expansion of MSTORE was charged
+    code = decode_hex("0x604260005201" + "01")
+    expected = run_code(vm, code, use_analyzed_code=False, gas=gas)
+    actual = run_code(vm, code, use_basic_block_gas=True, gas=gas)
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+def test_basic_blocks_end_at_jumps_jumpdests_and_gas_reads():
+    shanghai_class = ShanghaiVM._state_class.computation_class
+    # PUSH1 1 PUSH1 2 ADD JUMPDEST GAS POP PUSH1 0 JUMP
+    analyzed = analyze_code(
+        decode_hex("0x60016002015b5a50600056"), shanghai_class.opcodes
+    )
+
+    first_block = analyzed.build_basic_block(0)
+    assert first_block.static_gas == 3 + 3 + 3
+    assert len(first_block.instructions) == 3
+
+    gas_block = analyzed.build_basic_block(5)
+    assert gas_block.static_gas == 1 + 2
+    assert len(gas_block.instructions) == 2
+
+    jump_block = analyzed.build_basic_block(7)
+    assert jump_block.static_gas == 2 + 3 + 8
+    assert len(jump_block.instructions) == 3
+    assert analyzed.basic_blocks[7] is jump_block
+
+
+def test_analyzed_code_is_cached_per_computation_class():
+    code = decode_hex("0x60016002015b00")
+    frontier_class = FrontierVM._state_class.computation_class
+    shanghai_class = ShanghaiVM._state_class.computation_class
+
+    analyzed = get_analyzed_code(code, frontier_class)
+    assert get_analyzed_code(code, frontier_class) is analyzed
+    assert get_analyzed_code(code, shanghai_class) is not analyzed
+
+
+def test_analyze_code_decodes_push_immediates():
+    frontier_class = FrontierVM._state_class.computation_class
+    analyzed = analyze_code(decode_hex("0x6101025b7f03"), frontier_class.opcodes)
+
+    assert analyzed.code_length == 6
+    assert analyzed.immediates[0] == b"\x01\x02"
+    assert analyzed.next_pcs[0] == 3
+    assert analyzed.immediates[3] is None
+    assert analyzed.next_pcs[3] == 4
+    # a truncated push is padded with zeroes, and skips past the end of the code
+    assert analyzed.immediates[4] == b"\x03" + b"\x00" * 31
+    assert analyzed.next_pcs[4] == 37
+    # the implicit STOP past the end of the code
+    assert analyzed.opcode_fns[6].mnemonic == "STOP"
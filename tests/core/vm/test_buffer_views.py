@@ -0,0 +1,78 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+)
+
+RELAY_ADDRESS = b"\xcc" * 20
+ECHO_ADDRESS = b"\xdd" * 20
+
+# CALLDATACOPY all the call data to memory at 0, then RETURN it
+ECHO_CODE = decode_hex("0x366000600037366000f3")
+
+# CALLDATACOPY all the call data to memory at 0, CALL the echo contract with it,
+# then RETURNDATACOPY what it returned to memory at 0, and RETURN that
+RELAY_CODE = (
+    decode_hex("0x366000600037" + "60006000366000600073")
+    + ECHO_ADDRESS
+    + decode_hex("0x5af150" + "3d600060003e3d6000f3")
+)
+
+
+@pytest.fixture
+def vm():
+    vm = setup_genesis_vm(ShanghaiVM)
+    vm.state.set_code(RELAY_ADDRESS, RELAY_CODE)
+    vm.state.set_code(ECHO_ADDRESS, ECHO_CODE)
+    return vm
+
+
+def test_return_sets_a_view_of_memory(vm):
+    computation = run_code(vm, ECHO_CODE)
+
+    assert isinstance(computation.output_view, memoryview)
+    # the output materializes once, as bytes
+    assert type(computation.output) is bytes
+    assert computation.output == b"\x01" * 36
+    assert computation.output_view is computation.output
+
+
+@pytest.mark.parametrize("use_resource_pool", (False, True))
+def test_data_passes_through_frames_intact(vm, use_resource_pool):
+    # CALL the relay with the 36 bytes of call data, RETURNDATACOPY what it
+    # returned to memory at 0x40, then write over the memory at 0 and RETURN 0x40..
+    code = (
+        decode_hex("0x366000600037" + "60006000366000600073")
+        + RELAY_ADDRESS
+        + decode_hex("0x5af150" + "3d600060403e")
+        + decode_hex("0x60ff600052" + "3d6040f3")
+    )
+    computation = run_code(vm, code, gas=10**6, use_resource_pool=use_resource_pool)
+
+    assert computation.is_success
+    assert computation.output == b"\x01" * 36
+    # the relay passed the echo's output on as it was
+    relay_computation = computation.children[0]
+    assert relay_computation.output == b"\x01" * 36
+    assert relay_computation.children[0].output == b"\x01" * 36
+
+
+def test_calldatacopy_pads_past_the_end_of_the_data(vm):
+    # CALLDATACOPY 64 bytes from offset 4 to memory at 0, then RETURN them
+    computation = run_code(vm, decode_hex("0x6040600460003760406000f3"))
+    assert computation.output == b"\x01" * 32 + bytes(32)
+
+
+def test_calldataload_pads_past_the_end_of_the_data(vm):
+    # CALLDATALOAD at 20, then MSTORE it at 0 and RETURN it
+    code = decode_hex("0x601435" + "600052" + "60206000f3")
+    computation = run_code(vm, code)
+    assert computation.output == b"\x01" * 16 + bytes(16)
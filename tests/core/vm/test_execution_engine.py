@@ -0,0 +1,152 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.abc import (
+    ExecutionEngineAPI,
+)
+from eth.vm.execution_engine import (
+    CrossCheckExecutionEngine,
+    ExecutionEngineMismatch,
+    PyEVMExecutionEngine,
+    get_execution_engine,
+    load_execution_engine,
+    set_execution_engine,
+)
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.resource_pool import (
+    ComputationResourcePool,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+CALLEE_ADDRESS = b"\xcc" * 20
+
+# PUSH1 1 PUSH1 0 SSTORE PUSH1 0x42 PUSH1 0 MSTORE PUSH1 32 PUSH1 0 RETURN
+CALLEE_CODE = decode_hex("0x600160005560426000526020" + "6000f3")
+
+# CALL(gas=0xffff, to=callee, value=0, in_offset=0, in_size=0, out_offset=0,
+# out_size=32) then LOG0 of the output
+CALLER_CODE = (
+    decode_hex("0x60206000600060006000" + "73")
+    + CALLEE_ADDRESS
+    + decode_hex("0x61fffff1" + "60206000a0")
+)
+
+CODES = (
+    # PUSH1 2 PUSH1 0 SSTORE PUSH1 0 PUSH1 0 SSTORE
+    decode_hex("0x6002600055" + "6000600055"),
+    CALLER_CODE,
+    # PUSH1 1 PUSH1 0 MSTORE PUSH1 32 PUSH1 0 REVERT
+    decode_hex("0x6001600052" + "60206000fd"),
+    # PUSH1 1 INVALID
+    decode_hex("0x6001fe"),
+    # JUMPDEST PUSH1 0 JUMP, until it runs out of gas
+    decode_hex("0x5b600056"),
+)
+
+
+class CodeStreamEngine(ExecutionEngineAPI):
+    def execute(self, computation):
+        type(computation)._execute_code_stream(computation)
+
+
+class RecordingEngine(PyEVMExecutionEngine):
+    def __init__(self):
+        self.computations = []
+
+    def execute(self, computation):
+        self.computations.append(computation)
+        super().execute(computation)
+
+
+class GreedyEngine(PyEVMExecutionEngine):
+    def execute(self, computation):
+        computation.consume_gas(1, reason="Greedy engine")
+        super().execute(computation)
+
+
+@pytest.fixture
+def vm():
+    vm = setup_genesis_vm(ShanghaiVM)
+    vm.state.set_code(CALLEE_ADDRESS, CALLEE_CODE)
+    return vm
+
+
+@pytest.fixture
+def restore_execution_engine():
+    engine = get_execution_engine()
+    yield
+    set_execution_engine(engine)
+
+
+def test_default_engine_is_the_built_in_one(monkeypatch):
+    monkeypatch.delenv("EXECUTION_ENGINE_CLASS", raising=False)
+    assert isinstance(load_execution_engine(), PyEVMExecutionEngine)
+
+
+def test_engine_is_loaded_from_the_environment(monkeypatch):
+    monkeypatch.setenv(
+        "EXECUTION_ENGINE_CLASS", f"{__name__}.{CodeStreamEngine.__name__}"
+    )
+    assert isinstance(load_execution_engine(), CodeStreamEngine)
+
+
+def test_engine_of_the_computation_class_runs_nested_computations(vm):
+    engine = RecordingEngine()
+    computation = run_code(vm, CALLER_CODE, gas=10**6, execution_engine=engine)
+
+    assert engine.computations == [computation, computation.children[0]]
+    expected = run_code(vm, CALLER_CODE, gas=10**6)
+    assert summarize_computation(computation) == summarize_computation(expected)
+
+
+def test_engine_can_be_set_for_every_computation(vm, restore_execution_engine):
+    engine = RecordingEngine()
+    set_execution_engine(engine)
+    computation = run_code(vm, CALLER_CODE, gas=10**6)
+
+    assert engine.computations == [computation, computation.children[0]]
+    assert get_execution_engine() is engine
+
+
+@pytest.mark.parametrize("code", CODES)
+def test_cross_check_of_equivalent_engines(vm, code):
+    engine = CrossCheckExecutionEngine(CodeStreamEngine(), PyEVMExecutionEngine())
+    actual = run_code(vm, code, gas=10**6, execution_engine=engine)
+
+    expected = run_code(vm, code, gas=10**6)
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+def test_cross_check_finds_a_mismatch(vm):
+    engine = CrossCheckExecutionEngine(GreedyEngine(), PyEVMExecutionEngine())
+    with pytest.raises(ExecutionEngineMismatch):
+        run_code(vm, CALLER_CODE, gas=10**6, execution_engine=engine)
+
+
+@pytest.mark.parametrize("cross_check", (False, True))
+def test_cross_check_returns_resources_to_the_pool(vm, cross_check):
+    if cross_check:
+        engine = CrossCheckExecutionEngine(CodeStreamEngine(), PyEVMExecutionEngine())
+    else:
+        engine = None
+    stats = ComputationResourcePool.stats
+    allocated_before = stats.allocated
+
+    computation = run_code(
+        vm, CALLER_CODE, gas=10**6, use_resource_pool=True, execution_engine=engine
+    )
+
+    allocated = stats.allocated - allocated_before
+    released = computation.transaction_context.resource_pool._released
+    # only the stack and memory of the outermost computation are not back in the
+    # pool
+    assert sum(len(resources) for resources in released.values()) == allocated - 2
@@ -0,0 +1,71 @@
+from eth_hash.auto import (
+    keccak,
+)
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.keccak_memo import (
+    KeccakMemo,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+PREIMAGE = b"\xaa" * 32 + b"\xbb" * 32
+
+# MSTORE the preimage at 0
+STORE_PREIMAGE = decode_hex("0x7f" + "aa" * 32 + "600052" + "7f" + "bb" * 32 + "602052")
+
+
+def _sha3(size):
+    # PUSH2 size PUSH1 0 SHA3
+    return decode_hex(f"0x61{size:04x}600020")
+
+
+def test_memoized_sha3_matches_unmemoized():
+    code = STORE_PREIMAGE + _sha3(64) * 3 + _sha3(32)
+    memo = KeccakMemo()
+
+    expected = run_code(setup_genesis_vm(ShanghaiVM), code)
+    actual = run_code(setup_genesis_vm(ShanghaiVM), code, keccak_memo=memo)
+
+    assert summarize_computation(actual) == summarize_computation(expected)
+    assert actual._stack.values[0] == keccak(PREIMAGE)
+    assert (memo.stats.hits, memo.stats.misses) == (2, 2)
+
+
+def test_memo_is_shared_between_computations():
+    memo = KeccakMemo()
+    code = STORE_PREIMAGE + _sha3(64)
+
+    run_code(setup_genesis_vm(ShanghaiVM), code, keccak_memo=memo)
+    run_code(setup_genesis_vm(ShanghaiVM), code, keccak_memo=memo)
+
+    assert (memo.stats.hits, memo.stats.misses) == (1, 1)
+
+
+def test_long_preimages_bypass_the_memo():
+    memo = KeccakMemo(max_preimage_size=64)
+    code = STORE_PREIMAGE + _sha3(65) * 2
+
+    expected = run_code(setup_genesis_vm(ShanghaiVM), code)
+    actual = run_code(setup_genesis_vm(ShanghaiVM), code, keccak_memo=memo)
+
+    assert summarize_computation(actual) == summarize_computation(expected)
+    assert (memo.stats.hits, memo.stats.misses) == (0, 0)
+
+
+def test_memo_is_bounded():
+    memo = KeccakMemo(size=1)
+    for preimage in (b"\x01", b"\x02", b"\x01"):
+        assert memo.keccak(preimage) == keccak(preimage)
+    assert (memo.stats.hits, memo.stats.misses) == (0, 3)
+
+    memo.keccak(b"\x01")
+    assert memo.stats.hit_rate == 0.25
@@ -9,6 +9,7 @@ from eth_utils import (
 from eth.precompiles.modexp import (
     _compute_modexp_gas_fee_eip_198,
     _modexp,
+    _pow_modulo_power_of_two,
 )
 from eth.vm.forks.berlin.computation import (
     _compute_modexp_gas_fee_eip_2565,
@@ -51,3 +52,77 @@ def test_modexp_gas_fee_calculation_eip_2565(data, expected):
 def test_modexp_result(data, expected):
     actual = _modexp(data)
     assert actual == expected
+    assert _modexp(memoryview(data)) == expected
+
+
+def _encode_modexp_input(base, exponent, modulus, length=32):
+    return b"".join(
+        value.to_bytes(length, "big")
+        for value in (length, length, length, base, exponent, modulus)
+    )
+
+
+@pytest.mark.parametrize("modulus_bits", (1, 2, 3, 8, 64, 255))
+@pytest.mark.parametrize(
+    "base, exponent",
+    (
+        (0, 0),
+        (0, 5),
+        (1, 2**255),
+        (3, 0),
+        (3, 2**255 + 7),
+        (2**256 - 1, 2**200 + 1),
+        (2, 7),
+        (2, 2**255),
+        (12, 3),
+        (2**128, 1),
+        (6 * 2**100, 2),
+    ),
+)
+def test_modexp_power_of_two_modulus(base, exponent, modulus_bits):
+    modulus = 2**modulus_bits
+    expected = pow(base, exponent, modulus)
+    assert _pow_modulo_power_of_two(base, exponent, modulus) == expected
+    assert _modexp(_encode_modexp_input(base, exponent, modulus)) == expected
+
+
+@pytest.mark.parametrize("modulus", (2, 4, 8))
+@pytest.mark.parametrize("base", (3, 2**255 - 1))
+def test_modexp_power_of_two_modulus_with_large_exponent(base, modulus):
+    # cheap to ask for, so the result must not take a walk through every bit
+    exponent_length = 200_000
+    exponent = int.from_bytes(b"\xa7" * exponent_length, "big")
+    data = b"".join(
+        (
+            (32).to_bytes(32, "big"),
+            exponent_length.to_bytes(32, "big"),
+            (1).to_bytes(32, "big"),
+            base.to_bytes(32, "big"),
+            exponent.to_bytes(exponent_length, "big"),
+            modulus.to_bytes(1, "big"),
+        )
+    )
+    assert _modexp(data) == pow(base, exponent, modulus)
+
+
+@pytest.mark.parametrize("modulus", (0, 1))
+def test_modexp_trivial_modulus(modulus):
+    assert _modexp(_encode_modexp_input(3, 5, modulus)) == 0
+
+
+def test_modexp_gas_fee_from_declared_lengths_only():
+    # the declared lengths are far longer than the data
+    exponent_length = 2**200
+    length = 2**32
+    data = b"".join(
+        value.to_bytes(32, "big") for value in (length, exponent_length, length)
+    )
+
+    # the exponent is missing from the data, so its first bytes are zero
+    iteration_count = 8 * (exponent_length - 32)
+    assert _compute_modexp_gas_fee_eip_2565(data) == (
+        (length // 8) ** 2 * iteration_count // 3
+    )
+    assert _compute_modexp_gas_fee_eip_198(data) == (
+        (length**2 // 16 + 480 * length - 199680) * iteration_count // 20
+    )
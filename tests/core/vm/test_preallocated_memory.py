@@ -0,0 +1,92 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+from hypothesis import (
+    given,
+    settings,
+    strategies as st,
+)
+
+from eth.chains.mainnet import (
+    MAINNET_VMS,
+)
+from eth.vm.forks import (
+    FrontierVM,
+    ShanghaiVM,
+)
+from eth.vm.memory import (
+    Memory,
+    PreallocatedMemory,
+)
+from eth.vm.opcode_values import (
+    CALLDATACOPY,
+    MLOAD,
+    MSIZE,
+    MSTORE,
+    MSTORE8,
+    RETURN,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+
+def assert_same_execution_with_preallocated_memory(vm, code):
+    expected = run_code(vm, code, memory_class=Memory)
+    actual = run_code(vm, code, memory_class=PreallocatedMemory)
+    assert isinstance(actual._memory, PreallocatedMemory)
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+@pytest.mark.parametrize("vm_class", (FrontierVM, ShanghaiVM))
+@pytest.mark.parametrize(
+    "code",
+    (
+        # PUSH1 0xff PUSH1 0x40 MSTORE8 MSIZE
+        "0x60ff60405359",
+        # PUSH1 1 PUSH2 0x0100 MSTORE PUSH1 0 MLOAD MSIZE PUSH1 32 MSTORE MSIZE
+        "0x6001610100526000515960205259",
+        # CALLDATASIZE PUSH1 3 PUSH1 5 CALLDATACOPY, past the end of the calldata
+        "0x366003600537",
+        # PUSH1 0x20 PUSH1 0x00 PUSH1 0x00 CALLDATACOPY, then RETURN all of it
+        "0x6020600060003759600060f3",
+    ),
+)
+def test_preallocated_memory_matches_memory(vm_class, code):
+    assert_same_execution_with_preallocated_memory(
+        setup_genesis_vm(vm_class),
+        decode_hex(code),
+    )
+
+
+@st.composite
+def _memory_bytecode(draw):
+    # memory opcodes with small offsets, so that they rarely run out of gas
+    instructions = draw(
+        st.lists(
+            st.tuples(
+                st.sampled_from((MSTORE, MSTORE8, MLOAD, CALLDATACOPY, MSIZE)),
+                st.lists(st.integers(min_value=0, max_value=0x3FF), max_size=3),
+            ),
+            max_size=16,
+        )
+    )
+    code = b""
+    for opcode, arguments in instructions:
+        for argument in arguments:
+            code += b"\x61" + argument.to_bytes(2, "big")
+        code += bytes((opcode,))
+    return code + bytes((MSIZE, 0x60, 0x00, RETURN))
+
+
+@given(code=_memory_bytecode())
+@settings(max_examples=100, deadline=None)
+def test_fuzzy_preallocated_memory_matches_memory(code):
+    assert_same_execution_with_preallocated_memory(
+        setup_genesis_vm(MAINNET_VMS[-1]),
+        code,
+    )
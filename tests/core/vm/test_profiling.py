@@ -0,0 +1,162 @@
+import pytest
+
+from eth_hash.auto import (
+    keccak,
+)
+from eth_utils import (
+    decode_hex,
+    encode_hex,
+)
+
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.profiling import (
+    ExecutionProfiler,
+)
+from tests.core.helpers import (
+    CANONICAL_ADDRESS_A,
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+CALLEE_ADDRESS = b"\xcc" * 20
+FAILING_CALLEE_ADDRESS = b"\xdd" * 20
+
+# PUSH1 0x42 PUSH1 0 MSTORE PUSH1 32 PUSH1 0 RETURN
+CALLEE_CODE = decode_hex("0x604260005260206000f3")
+
+
+def _caller_code(callee_address):
+    # CALL(gas=0xffff, to=callee, value=0, in_offset=0, in_size=0, out_offset=0,
+    # out_size=32) then STOP
+    return (
+        decode_hex("0x60206000600060006000" + "73")
+        + callee_address
+        + decode_hex("0x61fffff100")
+    )
+
+
+CALLER_CODE = _caller_code(CALLEE_ADDRESS)
+
+
+@pytest.fixture
+def vm():
+    vm = setup_genesis_vm(ShanghaiVM)
+    vm.state.set_code(CALLEE_ADDRESS, CALLEE_CODE)
+    # PUSH1 1 then an invalid opcode
+    vm.state.set_code(FAILING_CALLEE_ADDRESS, decode_hex("0x6001fe"))
+    return vm
+
+
+def test_profiler_counts_opcodes(vm):
+    profiler = ExecutionProfiler()
+    # PUSH1 1 PUSH1 2 ADD PUSH1 3 ADD
+    code = decode_hex("0x600160020160030100")
+    run_code(vm, code, execution_profiler=profiler)
+
+    executions = {
+        mnemonic: stats[0] for mnemonic, stats in profiler.opcode_stats.items()
+    }
+    assert executions == {"PUSH1": 3, "ADD": 2, "STOP": 1}
+    gas = {mnemonic: stats[2] for mnemonic, stats in profiler.opcode_stats.items()}
+    assert gas == {"PUSH1": 9, "ADD": 6, "STOP": 0}
+
+    code_hash = keccak(code)
+    assert sorted(pc for _, pc in profiler.hotspot_stats) == [0, 2, 4, 5, 7, 8]
+    assert all(key[0] == code_hash for key in profiler.hotspot_stats)
+    assert profiler.hotspot_stats[(code_hash, 4)][:1] == [1]
+
+
+def test_profiler_charges_nested_calls_to_the_callee(vm):
+    profiler = ExecutionProfiler()
+    computation = run_code(vm, CALLER_CODE, execution_profiler=profiler)
+    assert computation.is_success
+
+    # every unit of gas is charged exactly once
+    total_gas = sum(stats[2] for stats in profiler.opcode_stats.values())
+    assert total_gas == computation.get_gas_used()
+
+    caller_path = (encode_hex(CANONICAL_ADDRESS_A),)
+    callee_path = caller_path + (encode_hex(CALLEE_ADDRESS),)
+    assert set(profiler.stack_stats) == {
+        (caller_path, "PUSH1"),
+        (caller_path, "PUSH2"),
+        (caller_path, "PUSH20"),
+        (caller_path, "CALL"),
+        (caller_path, "STOP"),
+        (callee_path, "PUSH1"),
+        (callee_path, "MSTORE"),
+        (callee_path, "RETURN"),
+    }
+    # PUSH1 0x42 PUSH1 0 MSTORE (with memory expansion) PUSH1 32 PUSH1 0
+    assert profiler.stack_stats[(callee_path, "PUSH1")][2] == 12
+    assert profiler.stack_stats[(callee_path, "MSTORE")][2] == 6
+
+    collapsed = list(profiler.iter_collapsed_stacks())
+    callee_mstore = (
+        f"{encode_hex(CANONICAL_ADDRESS_A)};{encode_hex(CALLEE_ADDRESS)};MSTORE"
+    )
+    assert any(line.startswith(callee_mstore + " ") for line in collapsed)
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in collapsed)
+
+
+def test_profiler_does_not_change_execution(vm):
+    expected = summarize_computation(run_code(vm, CALLER_CODE))
+    profiled = run_code(vm, CALLER_CODE, execution_profiler=ExecutionProfiler())
+    assert summarize_computation(profiled) == expected
+
+
+def test_profiler_records_failing_opcode(vm):
+    profiler = ExecutionProfiler()
+    # PUSH1 1 then an invalid opcode
+    computation = run_code(vm, decode_hex("0x6001fe"), execution_profiler=profiler)
+    assert computation.is_error
+    assert profiler.opcode_stats["INVALID"][0] == 1
+    assert profiler._frames == []
+
+
+def test_profiler_charges_burned_gas_to_the_failing_callee(vm):
+    profiler = ExecutionProfiler()
+    computation = run_code(
+        vm, _caller_code(FAILING_CALLEE_ADDRESS), execution_profiler=profiler
+    )
+    assert computation.is_success
+    (child,) = computation.children
+    assert child.is_error
+
+    total_gas = sum(stats[2] for stats in profiler.opcode_stats.values())
+    assert total_gas == computation.get_gas_used()
+
+    caller_path = (encode_hex(CANONICAL_ADDRESS_A),)
+    callee_path = caller_path + (encode_hex(FAILING_CALLEE_ADDRESS),)
+    # the invalid opcode is charged all the gas that the call had left
+    assert profiler.stack_stats[(callee_path, "PUSH1")][2] == 3
+    assert profiler.stack_stats[(callee_path, "INVALID")][2] == child.msg.gas - 3
+    assert profiler.stack_stats[(caller_path, "CALL")][2] < child.msg.gas
+    assert profiler._frames == []
+
+
+def test_profiler_tables(vm, tmp_path):
+    profiler = ExecutionProfiler()
+    run_code(vm, CALLER_CODE, execution_profiler=profiler)
+
+    opcode_lines = profiler.format_opcode_table(count=3).splitlines()
+    assert opcode_lines[0].startswith("Opcode")
+    assert len(opcode_lines) == 4
+
+    hotspot_lines = profiler.format_hotspot_table().splitlines()
+    assert len(hotspot_lines) == 1 + len(profiler.hotspot_stats)
+    assert any(encode_hex(keccak(CALLEE_CODE)) in line for line in hotspot_lines)
+
+    collapsed_path = tmp_path / "profile.folded"
+    profiler.write_collapsed_stacks(str(collapsed_path))
+    assert collapsed_path.read_text().splitlines() == list(
+        profiler.iter_collapsed_stacks()
+    )
+
+    profiler.reset()
+    assert profiler.opcode_stats == {}
+    assert profiler.hotspot_stats == {}
+    assert profiler.stack_stats == {}
@@ -0,0 +1,116 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.memory import (
+    Memory,
+    PreallocatedMemory,
+)
+from eth.vm.resource_pool import (
+    ComputationResourcePool,
+    ResourcePoolStats,
+)
+from eth.vm.stack import (
+    Stack,
+    UncheckedStack,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+CALLEE_ADDRESS = b"\xcc" * 20
+
+# PUSH1 0x42 PUSH1 0 MSTORE PUSH1 32 PUSH1 0 RETURN
+CALLEE_CODE = decode_hex("0x604260005260206000f3")
+
+
+def _call_callee(out_offset):
+    # CALL(gas, to, value=0, in_offset=0, in_size=0, out_offset, out_size=32)
+    return (
+        decode_hex("0x6020")
+        + bytes((0x60, out_offset))
+        + decode_hex("0x6000600060007f")
+        + CALLEE_ADDRESS.rjust(32, b"\x00")
+        + decode_hex("0x61fffff1")
+    )
+
+
+# call the callee three times, and return the three outputs
+CALLER_CODE = (
+    _call_callee(0) + _call_callee(32) + _call_callee(64) + decode_hex("0x60606000f3")
+)
+
+
+@pytest.fixture
+def stats():
+    original_stats = ComputationResourcePool.stats
+    ComputationResourcePool.stats = ResourcePoolStats()
+    yield ComputationResourcePool.stats
+    ComputationResourcePool.stats = original_stats
+
+
+@pytest.mark.parametrize("memory_class", (Memory, PreallocatedMemory))
+@pytest.mark.parametrize("stack_class", (Stack, UncheckedStack))
+def test_pooled_resources_are_cleared(stats, memory_class, stack_class):
+    pool = ComputationResourcePool()
+    stack = pool.acquire(stack_class)
+    memory = pool.acquire(memory_class)
+    stack.push_int(1)
+    memory.extend(0, 64)
+    memory.write(0, 4, b"1010")
+
+    pool.release(stack)
+    pool.release(memory)
+    assert pool.acquire(stack_class) is stack
+    assert pool.acquire(memory_class) is memory
+    assert stack.values == []
+    assert len(memory) == 0
+    memory.extend(0, 32)
+    assert memory.read_bytes(0, 32) == bytes(32)
+
+    assert stats.allocated == 2
+    assert stats.reused == 2
+    assert stats.allocation_savings == 0.5
+
+
+@pytest.mark.parametrize("memory_class", (Memory, PreallocatedMemory))
+def test_clearing_memory_keeps_outstanding_views(memory_class):
+    memory = memory_class()
+    memory.extend(0, 32)
+    memory.write(0, 4, b"1010")
+    view = memory.read(0, 4)
+
+    memory.clear()
+    memory.extend(0, 32)
+    memory.write(0, 4, b"0101")
+    assert view == b"1010"
+
+
+def test_pools_are_not_shared_between_resource_classes():
+    pool = ComputationResourcePool()
+    pool.release(Stack())
+    assert isinstance(pool.acquire(UncheckedStack), UncheckedStack)
+
+
+def test_child_computations_reuse_pooled_resources(stats):
+    vm = setup_genesis_vm(ShanghaiVM)
+    vm.state.set_code(CALLEE_ADDRESS, CALLEE_CODE)
+
+    expected = run_code(vm, CALLER_CODE, gas=10**6, use_resource_pool=False)
+    assert not stats.allocated
+
+    actual = run_code(vm, CALLER_CODE, gas=10**6, use_resource_pool=True)
+    assert summarize_computation(actual) == summarize_computation(expected)
+    assert actual.output == (b"\x00" * 31 + b"\x42") * 3
+
+    # the second and third calls reuse the stack and memory of the first
+    assert stats.allocated == 4
+    assert stats.reused == 4
+    assert all(child._stack is None for child in actual.children)
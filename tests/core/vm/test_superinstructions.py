@@ -0,0 +1,119 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.exceptions import (
+    FullStack,
+)
+from eth.vm.code_analysis import (
+    get_analyzed_code,
+)
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.superinstructions import (
+    FusedOpcode,
+    OpcodeNGramProfiler,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+SHANGHAI_COMPUTATION = ShanghaiVM._state_class.computation_class
+
+
+@pytest.mark.parametrize(
+    "code, fused_position, mnemonic",
+    (
+        # PUSH1 3 JUMP JUMPDEST
+        ("0x6003565b", 0, "PUSH1+JUMP"),
+        # PUSH2 0x0004 JUMPI JUMPDEST
+        ("0x610004575b", 0, "PUSH2+JUMPI"),
+        # ISZERO PUSH1 4 JUMPI JUMPDEST
+        ("0x156004575b", 0, "ISZERO+PUSH1+JUMPI"),
+        # PUSH1 0x20 ADD
+        ("0x602001", 0, "PUSH1+ADD"),
+        # PUSH1 1 DUP1 SWAP2
+        ("0x60018091", 2, "DUP1+SWAP2"),
+    ),
+)
+def test_common_sequences_are_fused(code, fused_position, mnemonic):
+    analyzed = get_analyzed_code(decode_hex(code), SHANGHAI_COMPUTATION, fuse=True)
+    fused_opcode = analyzed.opcode_fns[fused_position]
+    assert isinstance(fused_opcode, FusedOpcode)
+    assert fused_opcode.mnemonic == mnemonic
+    assert analyzed.next_pcs[fused_position] == fused_opcode.next_pc
+
+    unfused = get_analyzed_code(decode_hex(code), SHANGHAI_COMPUTATION)
+    assert not isinstance(unfused.opcode_fns[fused_position], FusedOpcode)
+    # the static gas of a superinstruction is the sum of its opcodes
+    assert fused_opcode.gas_cost == sum(step[1].gas_cost for step in fused_opcode.steps)
+
+
+@pytest.mark.parametrize(
+    "code",
+    (
+        # fill the stack with DUP1s, so PUSH1 0 JUMP overflows it
+        "0x6000" + "80" * 1023 + "60005600",
+        # fill the stack, so the PUSH1 of PUSH1 ADD overflows it
+        "0x6000" + "80" * 1023 + "600101",
+        # DUP1 SWAP1 on an empty stack
+        "0x8090",
+        # PUSH1 1 ADD on an empty stack
+        "0x600101",
+    ),
+)
+def test_superinstructions_fail_like_their_opcodes(code):
+    vm = setup_genesis_vm(ShanghaiVM)
+    code = decode_hex(code)
+    expected = run_code(vm, code, gas=10**6, use_analyzed_code=False)
+    actual = run_code(vm, code, gas=10**6, use_superinstructions=True)
+    assert expected.is_error
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+def test_superinstructions_out_of_gas_like_their_opcodes():
+    vm = setup_genesis_vm(ShanghaiVM)
+    # PUSH1 1 PUSH1 2 ADD, needing 9 gas
+    code = decode_hex("0x6001600201")
+    for gas in range(10):
+        expected = run_code(vm, code, gas=gas, use_analyzed_code=False)
+        actual = run_code(vm, code, gas=gas, use_superinstructions=True)
+        assert summarize_computation(actual) == summarize_computation(expected)
+
+
+def test_full_stack_is_checked_by_fused_opcodes():
+    vm = setup_genesis_vm(ShanghaiVM)
+    code = decode_hex("0x6000" + "80" * 1023 + "60005600")
+    computation = run_code(vm, code, gas=10**6, use_superinstructions=True)
+    assert isinstance(computation.error, FullStack)
+
+
+def test_opcode_ngram_profiler_counts_consecutive_opcodes():
+    vm = setup_genesis_vm(ShanghaiVM)
+    profiler = OpcodeNGramProfiler(max_length=3)
+    # PUSH1 3 JUMPDEST PUSH1 1 SWAP1 SUB DUP1 PUSH1 2 JUMPI
+    code = decode_hex("0x60035b600190038060025700")
+    run_code(vm, code, opcode_ngram_profiler=profiler)
+
+    # the loop runs three times
+    assert profiler.counts[("PUSH1", "JUMPI")] == 3
+    assert profiler.counts[("DUP1", "PUSH1", "JUMPI")] == 3
+    # the taken jumps back to the JUMPDEST are not consecutive opcodes
+    assert ("JUMPI", "JUMPDEST") not in profiler.counts
+    # the first JUMPDEST follows PUSH1 in the code
+    assert profiler.counts[("PUSH1", "JUMPDEST")] == 1
+    # falling through the last JUMPI is
+    assert profiler.counts[("JUMPI", "STOP")] == 1
+
+    assert profiler.most_common(1)[0][1] == 3
+    report_lines = profiler.format_report(5).splitlines()
+    assert len(report_lines) == 6
+    assert report_lines[1].split()[0] == "3"
+
+    profiler.reset()
+    assert not profiler.counts
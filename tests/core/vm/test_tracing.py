@@ -0,0 +1,161 @@
+import io
+import json
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+
+from eth.abc import (
+    TracerAPI,
+)
+from eth.vm.forks import (
+    ShanghaiVM,
+)
+from eth.vm.tracing import (
+    JSONLinesTracer,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+CALLEE_ADDRESS = b"\xcc" * 20
+
+# PUSH1 0x42 PUSH1 0 MSTORE PUSH1 32 PUSH1 0 RETURN
+CALLEE_CODE = decode_hex("0x604260005260206000f3")
+
+# CALL(gas=0xffff, to=callee, value=0, in_offset=0, in_size=0, out_offset=0,
+# out_size=32) then STOP
+CALLER_CODE = (
+    decode_hex("0x60206000600060006000" + "73")
+    + CALLEE_ADDRESS
+    + decode_hex("0x61fffff100")
+)
+
+
+class RecordingTracer(TracerAPI):
+    def __init__(self, capture_stack=False, capture_memory=False):
+        self.capture_stack = capture_stack
+        self.capture_memory = capture_memory
+        self.steps = []
+        self.ended = []
+
+    def on_step(self, step):
+        self.steps.append(step)
+
+    def on_computation_end(self, computation):
+        self.ended.append(computation)
+
+
+@pytest.fixture
+def vm():
+    vm = setup_genesis_vm(ShanghaiVM)
+    vm.state.set_code(CALLEE_ADDRESS, CALLEE_CODE)
+    return vm
+
+
+def test_tracer_receives_every_step(vm):
+    tracer = RecordingTracer()
+    # PUSH1 1 PUSH1 2 ADD
+    computation = run_code(vm, decode_hex("0x6001600201"), gas=100, tracer=tracer)
+
+    assert [step.op_name for step in tracer.steps] == ["PUSH1", "PUSH1", "ADD", "STOP"]
+    assert [step.pc for step in tracer.steps] == [0, 2, 4, 5]
+    assert [step.gas for step in tracer.steps] == [100, 97, 94, 91]
+    assert [step.gas_cost for step in tracer.steps] == [3, 3, 3, 0]
+    assert all(step.depth == 1 for step in tracer.steps)
+    # capturing the stack and memory is opt-in
+    assert all(step.stack is None for step in tracer.steps)
+    assert all(step.memory is None for step in tracer.steps)
+    assert tracer.ended == [computation]
+
+
+def test_tracer_captures_stack_and_memory(vm):
+    tracer = RecordingTracer(capture_stack=True, capture_memory=True)
+    # PUSH1 1 PUSH1 0 MSTORE8 PUSH1 2
+    run_code(vm, decode_hex("0x6001600053" + "6002"), tracer=tracer)
+
+    assert [step.stack for step in tracer.steps] == [(), (1,), (1, 0), (), (2,)]
+    assert tracer.steps[3].memory_size == 32
+    assert tracer.steps[3].memory == b"\x01" + bytes(31)
+
+
+def test_tracer_reports_nested_calls_in_order(vm):
+    tracer = RecordingTracer()
+    computation = run_code(vm, CALLER_CODE, gas=10**6, tracer=tracer)
+
+    depths_and_ops = [(step.depth, step.op_name) for step in tracer.steps]
+    call_index = depths_and_ops.index((1, "CALL"))
+    assert depths_and_ops[call_index + 1 : call_index + 8] == [
+        (2, "PUSH1"),
+        (2, "PUSH1"),
+        (2, "MSTORE"),
+        (2, "PUSH1"),
+        (2, "PUSH1"),
+        (2, "RETURN"),
+        (1, "STOP"),
+    ]
+    assert tracer.ended == [computation.children[0], computation]
+
+
+def test_tracer_set_on_state(vm):
+    class_tracer = RecordingTracer()
+    state_tracer = RecordingTracer()
+    vm.state.tracer = state_tracer
+    # the tracer of the state takes the place of the tracer of the class
+    computation = run_code(vm, CALLER_CODE, gas=10**6, tracer=class_tracer)
+
+    assert class_tracer.steps == []
+    assert {step.depth for step in state_tracer.steps} == {1, 2}
+    assert state_tracer.ended == [computation.children[0], computation]
+
+    vm.state.tracer = None
+    run_code(vm, CALLER_CODE, gas=10**6)
+    assert len(state_tracer.ended) == 2
+
+
+def test_tracing_does_not_change_execution(vm):
+    expected = run_code(vm, CALLER_CODE, gas=10**6)
+    actual = run_code(vm, CALLER_CODE, gas=10**6, tracer=RecordingTracer(True, True))
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+def test_json_lines_tracer_writes_eip3155_format(vm):
+    stream = io.StringIO()
+    tracer = JSONLinesTracer(stream, capture_stack=True, capture_memory=True)
+    # PUSH1 1 PUSH1 0 MSTORE8 PUSH1 1 PUSH1 0 RETURN
+    run_code(vm, decode_hex("0x600160005360016000f3"), gas=100, tracer=tracer)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[0] == {
+        "pc": 0,
+        "op": 0x60,
+        "gas": "0x64",
+        "gasCost": "0x3",
+        "memSize": 0,
+        "stack": [],
+        "memory": "0x",
+        "depth": 1,
+        "refund": 0,
+        "opName": "PUSH1",
+    }
+    assert lines[3]["stack"] == []
+    assert lines[3]["memory"] == "0x01" + "00" * 31
+    assert lines[5]["opName"] == "RETURN"
+    assert lines[5]["stack"] == ["0x1", "0x0"]
+    assert lines[-1] == {"output": "01", "gasUsed": hex(3 * 4 + 3 + 3), "pass": True}
+
+
+def test_json_lines_tracer_leaves_out_stack_and_memory_by_default(vm):
+    stream = io.StringIO()
+    # PUSH1 1 INVALID
+    run_code(vm, decode_hex("0x6001fe"), tracer=JSONLinesTracer(stream))
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) == 3
+    assert "stack" not in lines[0]
+    assert "memory" not in lines[0]
+    assert lines[-1]["pass"] is False
+    assert "error" in lines[-1]
@@ -0,0 +1,149 @@
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import pytest
+
+from eth_utils import (
+    ValidationError,
+    decode_hex,
+)
+
+from eth._utils.ecrecover import (
+    get_signature_key,
+    recovery_cache,
+)
+from eth.constants import (
+    GAS_TX,
+)
+from eth.tools.factories.transaction import (
+    new_transaction,
+)
+from eth.vm.prevalidation import (
+    prevalidate_transactions,
+)
+
+RECIPIENT = decode_hex("0xa94f5374fce5edbc8e2a8697c15331677e6ebf0c")
+
+
+@pytest.fixture
+def chain(chain_without_block_validation):
+    return chain_without_block_validation
+
+
+def _new_transactions(chain, funded_address, funded_address_private_key, count):
+    vm = chain.get_vm()
+    nonce = vm.state.get_nonce(funded_address)
+    return [
+        new_transaction(
+            vm,
+            funded_address,
+            RECIPIENT,
+            amount=100,
+            private_key=funded_address_private_key,
+            nonce=nonce + i,
+        )
+        for i in range(count)
+    ]
+
+
+def test_prevalidate_transactions(chain, funded_address, funded_address_private_key):
+    (valid_tx,) = _new_transactions(
+        chain, funded_address, funded_address_private_key, 1
+    )
+    low_gas_tx = new_transaction(
+        chain.get_vm(),
+        funded_address,
+        RECIPIENT,
+        private_key=funded_address_private_key,
+        gas=GAS_TX - 1,
+    )
+
+    prevalidations = prevalidate_transactions([valid_tx, low_gas_tx])
+
+    assert prevalidations[valid_tx].intrinsic_gas == GAS_TX
+    assert prevalidations[valid_tx].error is None
+    assert isinstance(prevalidations[low_gas_tx].error, ValidationError)
+
+
+def test_import_block_validates_each_transaction_once(
+    chain, funded_address, funded_address_private_key, monkeypatch
+):
+    transactions = _new_transactions(
+        chain, funded_address, funded_address_private_key, 3
+    )
+    new_block, _, _ = chain.build_block_with_transactions_and_withdrawals(transactions)
+
+    validated = []
+    transaction_class = type(transactions[0])
+    original_validate = transaction_class.validate
+
+    def validate(transaction):
+        validated.append(transaction)
+        original_validate(transaction)
+
+    monkeypatch.setattr(transaction_class, "validate", validate)
+
+    pending_header = chain.create_header_from_parent(chain.get_canonical_head())
+    expected_block, _ = chain.get_vm(pending_header).import_block(new_block)
+    assert validated == transactions
+
+    validated.clear()
+    validation_vm = chain.get_vm(pending_header)
+    with ThreadPoolExecutor(2) as executor:
+        validation_vm.transaction_prevalidation_executor = executor
+        block, _ = validation_vm.import_block(new_block)
+
+    assert block == expected_block
+    assert sorted(validated, key=transactions.index) == transactions
+    assert validation_vm.state.get_transaction_prevalidation(transactions[0]) is None
+
+
+def test_prevalidate_transactions_in_process_pool(
+    chain, funded_address, funded_address_private_key
+):
+    transactions = _new_transactions(
+        chain, funded_address, funded_address_private_key, 3
+    )
+    low_gas_tx = new_transaction(
+        chain.get_vm(),
+        funded_address,
+        RECIPIENT,
+        private_key=funded_address_private_key,
+        gas=GAS_TX - 1,
+    )
+    recovery_cache.clear()
+
+    with ProcessPoolExecutor(2) as executor:
+        prevalidations = prevalidate_transactions(transactions + [low_gas_tx], executor)
+
+    assert all(prevalidations[tx].error is None for tx in transactions)
+    assert isinstance(prevalidations[low_gas_tx].error, ValidationError)
+    # the senders recovered in the workers are cached in this process
+    assert all(get_signature_key(tx) in recovery_cache for tx in transactions)
+    assert recovery_cache.stats.misses == 0
+
+
+def test_invalid_transaction_fails_when_applied(
+    chain, funded_address, funded_address_private_key
+):
+    (valid_tx,) = _new_transactions(
+        chain, funded_address, funded_address_private_key, 1
+    )
+    low_gas_tx = new_transaction(
+        chain.get_vm(),
+        funded_address,
+        RECIPIENT,
+        private_key=funded_address_private_key,
+        gas=GAS_TX - 1,
+        nonce=valid_tx.nonce + 1,
+    )
+
+    applied = []
+    vm = chain.get_vm()
+    vm.transaction_applied_hook = lambda index, *args: applied.append(index)
+    with pytest.raises(ValidationError, match="Insufficient gas"):
+        vm.apply_all_transactions([valid_tx, low_gas_tx], vm.get_header())
+
+    # the valid transaction is still applied first
+    assert applied == [0]
@@ -0,0 +1,67 @@
+import pytest
+
+from eth_utils import (
+    decode_hex,
+)
+from hypothesis import (
+    given,
+    settings,
+    strategies as st,
+)
+
+from eth.chains.mainnet import (
+    MAINNET_VMS,
+)
+from eth.vm.forks import (
+    ByzantiumVM,
+    FrontierVM,
+    ShanghaiVM,
+)
+from eth.vm.stack import (
+    Stack,
+    UncheckedStack,
+)
+from tests.core.helpers import (
+    run_code,
+    setup_genesis_vm,
+    summarize_computation,
+)
+
+
+def assert_same_execution_with_unchecked_stack(vm, code):
+    expected = run_code(vm, code, stack_class=Stack)
+    actual = run_code(vm, code, stack_class=UncheckedStack)
+    assert isinstance(actual._stack, UncheckedStack)
+    assert summarize_computation(actual) == summarize_computation(expected)
+
+
+@pytest.mark.parametrize("vm_class", (FrontierVM, ByzantiumVM, ShanghaiVM))
+@pytest.mark.parametrize(
+    "code",
+    (
+        # PUSH1 2 PUSH1 3 EXP PUSH1 7 MULMOD PUSH1 5 SWAP1 SUB
+        "0x60026003600a6007096005900300",
+        # PUSH32 -1 PUSH1 2 SDIV PUSH1 3 SMOD PUSH1 0 SIGNEXTEND
+        "0x7f" + "ff" * 32 + "6002056003076000" + "0b",
+        # PUSH1 1 PUSH1 255 SHL PUSH1 1 SAR PUSH1 4 SHR BYTE
+        "0x600160ff1b60011d60041c1a",
+        # PUSH1 1 PUSH1 2 PUSH1 3 ADDMOD PUSH1 0 MSTORE CALLDATASIZE PUSH1 0 PUSH1 0
+        # CALLDATACOPY PUSH1 32 PUSH1 0 SHA3
+        "0x600160026003086000523660006000376020600020",
+        # SUB with a single item on the stack
+        "0x600103",
+        # ADDMOD with two items on the stack
+        "0x6001600208",
+    ),
+)
+def test_unchecked_stack_matches_stack(vm_class, code):
+    assert_same_execution_with_unchecked_stack(
+        setup_genesis_vm(vm_class),
+        decode_hex(code),
+    )
+
+
+@given(code=st.binary(max_size=64))
+@settings(max_examples=100, deadline=None)
+def test_fuzzy_unchecked_stack_matches_stack(code):
+    assert_same_execution_with_unchecked_stack(setup_genesis_vm(MAINNET_VMS[-1]), code)
@@ -79,3 +79,17 @@ def test_dont_log_missing_keys(DB):
 
     assert b"get-test" not in db_doesnt_log_missing.keys_read
     assert len(db_doesnt_log_missing.keys_read) == 0
+
+
+@pytest.mark.parametrize("log_missing_keys", (False, True))
+@pytest.mark.parametrize("DB", (KeyAccessLoggerAtomicDB, KeyAccessLoggerDB))
+def test_multi_get_logs_accesses(DB, log_missing_keys):
+    db = DB(MemoryDB(), log_missing_keys=log_missing_keys)
+    db.write_many([(b"present", b"value")])
+    assert len(db.keys_read) == 0
+
+    assert db.multi_get([b"present", b"missing"]) == (b"value", None)
+    if log_missing_keys:
+        assert db.keys_read == {b"present", b"missing"}
+    else:
+        assert db.keys_read == {b"present"}
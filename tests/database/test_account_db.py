@@ -155,6 +155,68 @@ def test_storage_deletion(account_db):
     assert account_db.get_storage(OTHER_ADDRESS, 1) == 321
 
 
+def test_storage_revert_restores_written_slots(account_db):
+    account_db.set_storage(ADDRESS, 0, 1)
+    account_db.set_storage(ADDRESS, 1, 1)
+    account_db.lock_changes()
+
+    outer = account_db.record()
+    account_db.set_storage(ADDRESS, 0, 2)
+    inner = account_db.record()
+    account_db.set_storage(ADDRESS, 0, 3)
+    account_db.set_storage(ADDRESS, 1, 0)
+    account_db.set_storage(ADDRESS, 2, 3)
+    account_db.commit(inner)
+
+    checkpoint = account_db.record()
+    account_db.set_storage(ADDRESS, 0, 4)
+    account_db.discard(checkpoint)
+
+    assert account_db.get_storage(ADDRESS, 0) == 3
+    assert account_db.get_storage(ADDRESS, 1) == 0
+    assert account_db.get_storage(ADDRESS, 2) == 3
+    assert account_db.get_storage(ADDRESS, 0, from_journal=False) == 1
+
+    account_db.discard(outer)
+    assert account_db.get_storage(ADDRESS, 0) == 1
+    assert account_db.get_storage(ADDRESS, 1) == 1
+    assert account_db.get_storage(ADDRESS, 2) == 0
+
+
+def test_storage_revert_across_deletion(account_db):
+    account_db.set_storage(ADDRESS, 0, 1)
+    account_db.lock_changes()
+    account_db.set_storage(ADDRESS, 1, 2)
+
+    checkpoint = account_db.record()
+    account_db.set_storage(ADDRESS, 2, 3)
+    account_db.delete_storage(ADDRESS)
+    account_db.set_storage(ADDRESS, 3, 4)
+    assert account_db.get_storage(ADDRESS, 0) == 0
+    assert account_db.get_storage(ADDRESS, 1) == 0
+    assert account_db.get_storage(ADDRESS, 3) == 4
+
+    account_db.discard(checkpoint)
+    assert account_db.get_storage(ADDRESS, 0) == 1
+    assert account_db.get_storage(ADDRESS, 1) == 2
+    assert account_db.get_storage(ADDRESS, 2) == 0
+    assert account_db.get_storage(ADDRESS, 3) == 0
+
+    expected_db = AccountDB(AtomicDB())
+    expected_db.set_storage(ADDRESS, 0, 1)
+    expected_db.set_storage(ADDRESS, 1, 2)
+    assert account_db.make_state_root() == expected_db.make_state_root()
+
+
+def test_storage_writes_are_encoded_when_locked(account_db):
+    account_db.set_storage(ADDRESS, 0, 1)
+    storage_db = account_db._get_address_store(ADDRESS)
+    assert len(storage_db._journal_storage.diff()) == 0
+
+    account_db.lock_changes()
+    assert storage_db.get(0, from_journal=False) == 1
+
+
 def test_account_db_storage_root(account_db):
     """
     Make sure that pruning doesn't screw up addresses
@@ -259,6 +321,31 @@ def test_has_changes_even_if_storage_root_returns_to_old_value(account_db):
     assert repeated_storage_root == original_storage_root
 
 
+def test_discard_only_evicts_reverted_accounts_from_cache(account_db):
+    account_db.set_balance(ADDRESS, 1)
+    account_db.set_balance(OTHER_ADDRESS, 2)
+
+    outer = account_db.record()
+    account_db.set_balance(ADDRESS, 10)
+    inner = account_db.record()
+    account_db.delete_account(OTHER_ADDRESS)
+    assert account_db.get_balance(OTHER_ADDRESS) == 0
+    account_db.commit(inner)
+
+    checkpoint = account_db.record()
+    account_db.set_nonce(ADDRESS, 5)
+    account_db.discard(checkpoint)
+
+    assert OTHER_ADDRESS in account_db._account_cache
+    assert ADDRESS not in account_db._account_cache
+    assert account_db.get_balance(ADDRESS) == 10
+    assert account_db.get_nonce(ADDRESS) == 0
+
+    account_db.discard(outer)
+    assert account_db.get_balance(ADDRESS) == 1
+    assert account_db.get_balance(OTHER_ADDRESS) == 2
+
+
 def test_meta_witness_basic_stats(account_db):
     account_db.get_balance(ADDRESS)
     account_db.get_code(ADDRESS)
@@ -213,3 +213,21 @@ def test_batch_db_commit_to_new_target_without_deletes(base_db, batch_db, base2_
     # changes should be reflected in the target database, not the backing database
     assert base2_db[b"key-2"] == b"origin-2"
     assert base_db[b"key-2"] == b"origin-2"
+
+
+@pytest.mark.parametrize("read_through_deletes", (False, True))
+def test_batch_db_multi_get(base_db, read_through_deletes):
+    base_db[b"deleted"] = b"base-value"
+    base_db[b"unchanged"] = b"base-value"
+    batch_db = BatchDB(base_db, read_through_deletes=read_through_deletes)
+    batch_db.write_many([(b"new", b"batch-value")])
+    del batch_db[b"deleted"]
+
+    deleted_value = b"base-value" if read_through_deletes else None
+    assert batch_db.multi_get([b"new", b"deleted", b"unchanged", b"missing"]) == (
+        b"batch-value",
+        deleted_value,
+        b"base-value",
+        None,
+    )
+    assert b"new" not in base_db
@@ -1,5 +1,8 @@
 import pytest
 
+from eth.abc import (
+    DatabaseAPI,
+)
 from eth.db.accesslog import (
     KeyAccessLoggerAtomicDB,
     KeyAccessLoggerDB,
@@ -16,6 +19,9 @@ from eth.db.batch import (
 from eth.db.cache import (
     CacheDB,
 )
+from eth.db.hash_trie import (
+    HashTrie,
+)
 from eth.db.journal import (
     JournalDB,
 )
@@ -60,3 +66,88 @@ def db(request):
 
 class TestDatabaseAPI(DatabaseAPITestSuite):
     pass
+
+
+class DictDatabase(DatabaseAPI):
+    """
+    A database that only implements the abstract methods of DatabaseAPI
+    """
+
+    def __init__(self):
+        self._data = {}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def set(self, key, value):
+        self[key] = value
+
+    def exists(self, key):
+        return key in self._data
+
+    def delete(self, key):
+        self._data.pop(key, None)
+
+
+class TestDatabaseAPIDefaults(DatabaseAPITestSuite):
+    @pytest.fixture
+    def db(self):
+        return DictDatabase()
+
+
+@pytest.mark.parametrize(
+    "wrapper_class",
+    (JournalDB, BatchDB, AtomicDB, CacheDB, KeyAccessLoggerDB, HashTrie),
+)
+def test_wrappers_of_plain_mappings(wrapper_class):
+    # some wrappers wrap tries, which are not databases
+    wrapped = {b"key-1": b"value-1"}
+    db = wrapper_class(wrapped)
+
+    db.write_many([(b"key-2", b"value-2")])
+
+    if wrapper_class is HashTrie:
+        assert db.multi_get([b"key-2", b"key-3"]) == (b"value-2", None)
+    else:
+        assert db.multi_get([b"key-1", b"key-2", b"key-3"]) == (
+            b"value-1",
+            b"value-2",
+            None,
+        )
+
+
+class RecordingMemoryDB(MemoryDB):
+    def __init__(self):
+        super().__init__()
+        self.read_keys = []
+        self.written_keys = []
+
+    def __getitem__(self, key):
+        self.read_keys.append(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self.written_keys.append(key)
+        super().__setitem__(key, value)
+
+
+def test_memory_db_subclass_sees_every_batched_access():
+    db = RecordingMemoryDB()
+
+    db.write_many([(b"key-1", b"value-1"), (b"key-2", b"value-2")])
+    assert db.written_keys == [b"key-1", b"key-2"]
+
+    assert db.multi_get([b"key-2", b"missing"]) == (b"value-2", None)
+    assert db.read_keys == [b"key-2", b"missing"]
@@ -522,6 +522,38 @@ def test_journal_persist_delete_fail_then_persist():
     assert b"delete-me" not in db
 
 
+def test_multi_get_reads_through_journal(journal_db, memory_db):
+    memory_db[b"wrapped"] = b"wrapped-value"
+    memory_db[b"deleted"] = b"deleted-value"
+    journal_db[b"local"] = b"local-value"
+    journal_db[b"deleted-local"] = b"value"
+    del journal_db[b"deleted"]
+    del journal_db[b"deleted-local"]
+
+    keys = [b"local", b"wrapped", b"deleted", b"deleted-local", b"missing"]
+    assert journal_db.multi_get(keys) == (
+        b"local-value",
+        b"wrapped-value",
+        None,
+        None,
+        None,
+    )
+
+
+def test_write_many_can_be_discarded(journal_db, memory_db):
+    journal_db[b"1"] = b"A"
+    checkpoint = journal_db.record()
+    journal_db.write_many([(b"1", b"B"), (b"2", b"B")])
+    assert journal_db.multi_get([b"1", b"2"]) == (b"B", b"B")
+
+    journal_db.discard(checkpoint)
+    assert journal_db.multi_get([b"1", b"2"]) == (b"A", None)
+
+    journal_db.write_many([(b"2", b"C")])
+    journal_db.persist()
+    assert memory_db.kv_store == {b"1": b"A", b"2": b"C"}
+
+
 class MemoryDBSetRaisesKeyError(MemoryDB):
     def __setitem__(self, *args):
         raise KeyError(
@@ -712,6 +744,32 @@ def test_journal_db_commit_then_discard(journal_db):
     assert 1 not in journal_db
 
 
+def test_journal_db_keys_changed_since(journal_db, memory_db):
+    memory_db[b"wrapped"] = b"unchanged"
+    journal_db[b"before"] = b"A"
+    outer = journal_db.record()
+    journal_db[b"outer"] = b"B"
+    inner = journal_db.record()
+    journal_db[b"inner"] = b"C"
+    del journal_db[b"before"]
+    journal_db.commit(inner)
+    journal_db[b"after-commit"] = b"D"
+
+    assert journal_db.keys_changed_since(outer) == {
+        b"outer",
+        b"inner",
+        b"before",
+        b"after-commit",
+    }
+    assert journal_db.keys_changed_since(journal_db.record()) == set()
+
+    journal_db.discard(outer)
+    assert journal_db.keys_changed_since(journal_db.record()) == set()
+
+    with pytest.raises(ValidationError):
+        journal_db.keys_changed_since(outer)
+
+
 class JournalComparison(RuleBasedStateMachine):
     """
     Compare an older version of JournalDB against a newer, optimized one.
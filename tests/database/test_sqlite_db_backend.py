@@ -0,0 +1,147 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import pytest
+import threading
+import time
+
+from eth.db import (
+    get_db_backend,
+)
+from eth.db.backends.sqlite import (
+    SQLiteDB,
+)
+from eth.tools.db.atomic import (
+    AtomicDatabaseBatchAPITestSuite,
+)
+from eth.tools.db.base import (
+    DatabaseAPITestSuite,
+)
+
+
+# Sets db backend to sqlite
+@pytest.fixture
+def config_env(monkeypatch):
+    monkeypatch.setenv("CHAIN_DB_BACKEND_CLASS", "eth.db.backends.sqlite.SQLiteDB")
+
+
+@pytest.fixture
+def db_path(tmpdir):
+    return str(tmpdir.join("sqlite_db_path"))
+
+
+@pytest.fixture
+def sqlite_db(db_path):
+    sqlite_db = SQLiteDB(db_path)
+    yield sqlite_db
+    sqlite_db.close()
+
+
+@pytest.fixture
+def db(sqlite_db):
+    return sqlite_db
+
+
+@pytest.fixture
+def atomic_db(sqlite_db):
+    return sqlite_db
+
+
+class TestSQLiteDatabaseAPI(DatabaseAPITestSuite):
+    pass
+
+
+class TestSQLiteAtomicBatch(AtomicDatabaseBatchAPITestSuite):
+    pass
+
+
+def test_raises_if_db_path_is_not_specified(config_env):
+    with pytest.raises(TypeError):
+        get_db_backend()
+
+
+def test_get_db_backend(config_env, db_path):
+    db = get_db_backend(db_path=db_path)
+    assert isinstance(db, SQLiteDB)
+    db.close()
+
+
+def test_writes_persist_after_reopening(db_path):
+    db = SQLiteDB(db_path)
+    db[b"unbatched"] = b"1"
+    with db.atomic_batch() as batch:
+        batch[b"batched"] = b"2"
+        del batch[b"unbatched"]
+    db.close()
+
+    reopened_db = SQLiteDB(db_path, page_cache_size=1024 * 1024)
+    assert reopened_db.get(b"batched") == b"2"
+    assert b"unbatched" not in reopened_db
+    reopened_db.close()
+
+
+def test_failed_batch_writes_nothing(sqlite_db):
+    sqlite_db[b"1"] = b"A"
+
+    with pytest.raises(ValueError):
+        with sqlite_db.atomic_batch() as batch:
+            batch[b"1"] = b"B"
+            batch[b"2"] = b"B"
+            raise ValueError("Abort the batch")
+
+    assert sqlite_db[b"1"] == b"A"
+    assert b"2" not in sqlite_db
+
+
+def test_write_many_and_multi_get(sqlite_db):
+    # more keys than fit in a single select
+    items = tuple((i.to_bytes(4, "big"), bytes([i % 256]) * 3) for i in range(2500))
+    sqlite_db.write_many(items)
+
+    keys = [key for key, _ in items] + [b"missing"]
+    expected = tuple(value for _, value in items) + (None,)
+    assert sqlite_db.multi_get(keys) == expected
+    assert sqlite_db.multi_get([]) == ()
+
+
+def test_failed_write_many_writes_nothing(sqlite_db):
+    with pytest.raises(Exception):
+        sqlite_db.write_many(((b"1", b"A"), (b"2", None)))
+
+    assert sqlite_db.multi_get([b"1", b"2"]) == (None, None)
+
+
+def test_used_from_other_threads(sqlite_db):
+    def write_and_read(i):
+        key = i.to_bytes(4, "big")
+        sqlite_db.write_many(((key, b"A"), (key + b"-2", b"B")))
+        sqlite_db[key + b"-3"] = b"C"
+        return sqlite_db.multi_get([key, key + b"-2", key + b"-3"])
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(write_and_read, range(20)))
+
+    assert results == [(b"A", b"B", b"C")] * 20
+
+
+def test_failed_write_many_keeps_the_writes_of_other_threads(sqlite_db):
+    started = threading.Event()
+
+    def failing_items():
+        yield b"1", b"A"
+        started.set()
+        # give the other thread time to try to write while the transaction is open
+        time.sleep(0.05)
+        raise ValueError("Abort the write")
+
+    def write_other_key():
+        started.wait()
+        sqlite_db[b"other"] = b"B"
+
+    other_thread = threading.Thread(target=write_other_key)
+    other_thread.start()
+    with pytest.raises(ValueError):
+        sqlite_db.write_many(failing_items())
+    other_thread.join()
+
+    assert sqlite_db.multi_get([b"1", b"other"]) == (None, b"B")
@@ -0,0 +1,195 @@
+import pytest
+
+from eth_hash.auto import (
+    keccak,
+)
+
+from eth.constants import (
+    BLANK_ROOT_HASH,
+)
+from eth.db.account import (
+    AccountDB,
+)
+from eth.db.atomic import (
+    AtomicDB,
+)
+from eth.db.warm_state import (
+    ENTRY_OVERHEAD,
+    WarmStateCache,
+)
+
+ADDRESS = b"\xaa" * 20
+OTHER_ADDRESS = b"\xbb" * 20
+CODE = b"\x60\x00" * 16
+ROOT_A = b"\x01" * 32
+ROOT_B = b"\x02" * 32
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def cache():
+    return WarmStateCache(2**20)
+
+
+def _build_state(base_db, cache, state_root=BLANK_ROOT_HASH):
+    account_db = AccountDB(base_db, state_root, cache)
+    account_db.set_balance(ADDRESS, 10)
+    account_db.set_code(ADDRESS, CODE)
+    account_db.set_storage(ADDRESS, 1, 100)
+    account_db.set_storage(ADDRESS, 2, 200)
+    account_db.set_balance(OTHER_ADDRESS, 20)
+    account_db.lock_changes()
+    account_db.persist()
+    return account_db.state_root
+
+
+def test_cache_is_bounded_by_size():
+    entry_size = 20 + 32 + ENTRY_OVERHEAD
+    cache = WarmStateCache(3 * entry_size)
+    addresses = [bytes([index]) * 20 for index in range(4)]
+
+    for address in addresses[:3]:
+        cache.set_account(address, b"\x00" * 32)
+    assert cache.size == 3 * entry_size
+
+    # reading the oldest entry makes the second one the least recently used
+    assert cache.get_account(addresses[0]) == b"\x00" * 32
+    cache.set_account(addresses[3], b"\x00" * 32)
+
+    assert cache.size == 3 * entry_size
+    assert cache.get_account(addresses[1]) is None
+    assert cache.get_account(addresses[0]) is not None
+    assert cache.get_account(addresses[3]) is not None
+
+
+def test_entry_larger_than_cache_is_not_kept():
+    cache = WarmStateCache(1000)
+    cache.set_code(keccak(b"\x00" * 2000), b"\x00" * 2000)
+
+    assert cache.size == 0
+    assert cache.get_code(keccak(b"\x00" * 2000)) is None
+
+
+def test_apply_changes_carries_over_unchanged_entries(cache):
+    cache.apply_changes(None, ROOT_A, {ADDRESS: b"a", OTHER_ADDRESS: b"b"}, {}, ())
+    cache.set_storage(ADDRESS, b"\x01", b"1")
+    cache.set_storage(OTHER_ADDRESS, b"\x01", b"2")
+    cache.set_storage(OTHER_ADDRESS, b"\x02", b"3")
+
+    cache.apply_changes(
+        ROOT_A,
+        ROOT_B,
+        {ADDRESS: b"c"},
+        {OTHER_ADDRESS: {b"\x02": b"4"}},
+        {OTHER_ADDRESS},
+    )
+
+    assert cache.state_root == ROOT_B
+    assert cache.get_account(ADDRESS) == b"c"
+    assert cache.get_account(OTHER_ADDRESS) == b"b"
+    assert cache.get_storage(ADDRESS, b"\x01") == b"1"
+    # the wiped storage only keeps the slots written after the wipe
+    assert cache.get_storage(OTHER_ADDRESS, b"\x01") is None
+    assert cache.get_storage(OTHER_ADDRESS, b"\x02") == b"4"
+
+
+def test_apply_changes_from_another_root_only_keeps_code(cache):
+    cache.apply_changes(None, ROOT_A, {ADDRESS: b"a"}, {}, ())
+    cache.set_storage(ADDRESS, b"\x01", b"1")
+    cache.set_code(keccak(CODE), CODE)
+
+    cache.apply_changes(ROOT_B, ROOT_B, {OTHER_ADDRESS: b"b"}, {}, ())
+
+    assert cache.get_account(ADDRESS) is None
+    assert cache.get_storage(ADDRESS, b"\x01") is None
+    assert cache.get_account(OTHER_ADDRESS) == b"b"
+    assert cache.get_code(keccak(CODE)) == CODE
+
+
+def test_discard_state_roots(cache):
+    cache.apply_changes(None, ROOT_A, {ADDRESS: b"a"}, {}, ())
+    cache.set_code(keccak(CODE), CODE)
+
+    cache.discard_state_roots({ROOT_B})
+    assert cache.state_root == ROOT_A
+
+    cache.discard_state_roots({ROOT_A, ROOT_B})
+    assert cache.state_root is None
+    assert cache.get_account(ADDRESS) is None
+    assert cache.get_code(keccak(CODE)) == CODE
+
+
+def test_next_block_reads_from_cache(base_db, cache):
+    state_root = _build_state(base_db, cache)
+    assert cache.state_root == state_root
+
+    account_db = AccountDB(base_db, state_root, cache)
+    cache.stats.reset()
+    assert account_db.get_balance(ADDRESS) == 10
+    assert account_db.get_code(ADDRESS) == CODE
+    assert account_db.get_storage(ADDRESS, 1) == 100
+    assert account_db.get_storage(ADDRESS, 3) == 0
+    assert account_db.get_balance(OTHER_ADDRESS) == 20
+    # only the slot that was never written is missing
+    assert cache.stats.misses == 1
+
+
+def test_changes_carry_over_to_the_next_block(base_db, cache):
+    state_root = _build_state(base_db, cache)
+
+    account_db = AccountDB(base_db, state_root, cache)
+    account_db.set_storage(ADDRESS, 1, 101)
+    account_db.set_storage(ADDRESS, 2, 0)
+    account_db.delete_account(OTHER_ADDRESS)
+    account_db.lock_changes()
+    account_db.persist()
+    next_state_root = account_db.state_root
+    assert cache.state_root == next_state_root
+
+    for next_account_db in (
+        AccountDB(base_db, next_state_root, cache),
+        AccountDB(base_db, next_state_root),
+    ):
+        assert next_account_db.get_storage(ADDRESS, 1) == 101
+        assert next_account_db.get_storage(ADDRESS, 2) == 0
+        assert next_account_db.get_balance(ADDRESS) == 10
+        assert not next_account_db.account_exists(OTHER_ADDRESS)
+
+
+def test_wiped_storage_is_not_read_from_cache(base_db, cache):
+    state_root = _build_state(base_db, cache)
+
+    account_db = AccountDB(base_db, state_root, cache)
+    account_db.delete_storage(ADDRESS)
+    account_db.set_storage(ADDRESS, 2, 201)
+    account_db.lock_changes()
+    account_db.persist()
+
+    next_account_db = AccountDB(base_db, account_db.state_root, cache)
+    assert next_account_db.get_storage(ADDRESS, 1) == 0
+    assert next_account_db.get_storage(ADDRESS, 2) == 201
+
+
+def test_other_state_root_bypasses_cache(base_db, cache):
+    state_root = _build_state(base_db, cache)
+    account_db = AccountDB(base_db, state_root, cache)
+    account_db.set_balance(ADDRESS, 11)
+    account_db.lock_changes()
+    account_db.persist()
+
+    cache.stats.reset()
+    stale_account_db = AccountDB(base_db, state_root, cache)
+    assert stale_account_db.get_balance(ADDRESS) == 10
+    assert stale_account_db.get_storage(ADDRESS, 1) == 100
+    assert cache.stats.hits == 0
+
+    # persisting the stale state moves the cache to its own root
+    stale_account_db.set_balance(ADDRESS, 12)
+    stale_account_db.lock_changes()
+    stale_account_db.persist()
+    assert cache.state_root == stale_account_db.state_root
+    assert AccountDB(base_db, cache.state_root, cache).get_balance(ADDRESS) == 12